@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Script to benchmark the inference paths of the YOLO damage detector.
+It decodes a fixed number of frames from a test video once and measures the
+throughput (frames per second) of each inference mode on exactly those frames.
+With --quantization-report it compares the INT8 ONNX models against the FP32
+ONNX model instead, reporting box recall and throughput on the same frames;
+--tiling-report does the same for tiled inference against full-frame inference.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import cv2
+import numpy as np
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from src.domain.entities.damage import Damage, DamageType
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.ml.box_ops import detection_recall
+from src.infrastructure.ml.detections import FrameDetections
+from src.infrastructure.ml.tiling import FrameTiler
+from src.infrastructure.ml.yolo_damage_detector import YOLODamageDetector
+
+
+def load_frames(video_path: Path, max_frames: int) -> List[np.ndarray]:
+    """Decode up to max_frames frames from the video."""
+    cap = cv2.VideoCapture(str(video_path))
+    if not cap.isOpened():
+        raise ValueError(f"Could not open video: {video_path}")
+
+    frames = []
+    try:
+        while len(frames) < max_frames:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(frame)
+    finally:
+        cap.release()
+
+    return frames
+
+
+async def measure_per_frame(detector: YOLODamageDetector, frames: List[np.ndarray]) -> Dict[str, Any]:
+    """Measure the per-frame path (one model call per frame)."""
+    start = time.perf_counter()
+    total_damages = 0
+    for frame_number, frame in enumerate(frames):
+        damages = await detector.detect_damages_in_array(frame, frame_number)
+        total_damages += len(damages)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": "per_frame",
+        "batch_size": 1,
+        "frames": len(frames),
+        "seconds": elapsed,
+        "fps": len(frames) / elapsed if elapsed > 0 else 0.0,
+        "damages": total_damages
+    }
+
+
+async def measure_batched(
+    detector: YOLODamageDetector,
+    frames: List[np.ndarray],
+    batch_size: int
+) -> Dict[str, Any]:
+    """Measure the batched path (one model call per batch of frames)."""
+    start = time.perf_counter()
+    total_damages = 0
+    for offset in range(0, len(frames), batch_size):
+        batch = frames[offset:offset + batch_size]
+        frame_numbers = list(range(offset, offset + len(batch)))
+        batch_damages = await detector.detect_damages_in_batch(batch, frame_numbers)
+        total_damages += sum(len(damages) for damages in batch_damages)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": "batched",
+        "batch_size": batch_size,
+        "frames": len(frames),
+        "seconds": elapsed,
+        "fps": len(frames) / elapsed if elapsed > 0 else 0.0,
+        "damages": total_damages
+    }
+
+
+def print_report(results: List[Dict[str, Any]]) -> None:
+    """Print the throughput table, relative to the per-frame baseline."""
+    baseline_fps = results[0]["fps"] or 1.0
+    print(f"{'mode':<12}{'batch':>7}{'frames':>8}{'seconds':>10}{'fps':>10}{'speedup':>9}{'damages':>9}")
+    for result in results:
+        print(
+            f"{result['mode']:<12}{result['batch_size']:>7}{result['frames']:>8}"
+            f"{result['seconds']:>10.2f}{result['fps']:>10.2f}"
+            f"{result['fps'] / baseline_fps:>8.2f}x{result['damages']:>9}"
+        )
+
+
+def damages_to_detections(damages: List[Damage]) -> FrameDetections:
+    """Convert the damages of one frame back into detection arrays."""
+    if not damages:
+        return FrameDetections.empty()
+    damage_types = list(DamageType)
+    return FrameDetections(
+        np.array([
+            [d.bounding_box.x1, d.bounding_box.y1, d.bounding_box.x2, d.bounding_box.y2]
+            for d in damages
+        ], dtype=np.float32),
+        np.array([d.confidence for d in damages], dtype=np.float32),
+        np.array([damage_types.index(d.damage_type) for d in damages], dtype=np.int64)
+    )
+
+
+async def measure_detections(
+    detector: YOLODamageDetector,
+    frames: List[np.ndarray],
+    batch_size: int
+) -> Dict[str, Any]:
+    """Run the batched path and keep the per-frame detections for comparison."""
+    await detector.detect_damages_in_batch(frames[:1], [0])
+
+    start = time.perf_counter()
+    detections = []
+    for offset in range(0, len(frames), batch_size):
+        batch = frames[offset:offset + batch_size]
+        frame_numbers = list(range(offset, offset + len(batch)))
+        batch_damages = await detector.detect_damages_in_batch(batch, frame_numbers)
+        detections.extend(damages_to_detections(damages) for damages in batch_damages)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "seconds": elapsed,
+        "fps": len(frames) / elapsed if elapsed > 0 else 0.0,
+        "detections": detections
+    }
+
+
+async def quantization_report(
+    settings: Settings,
+    frames: List[np.ndarray],
+    modes: List[str],
+    iou_threshold: float
+) -> int:
+    """Compare the INT8 ONNX models against the FP32 ONNX model on the same frames."""
+    results = {}
+    for mode in ["none"] + modes:
+        detector = YOLODamageDetector(
+            model_path=settings.models_dir / "yolov8n.pt",
+            device="cpu",
+            runtime="onnx",
+            quantization=mode,
+            calibration_videos_dir=settings.videos_dir,
+            calibration_frames=settings.quantization_calibration_frames
+        )
+        if not await detector.load_model():
+            print(f"Could not load the model for quantization mode '{mode}'")
+            return 1
+        await detector.set_confidence_threshold(settings.confidence_threshold)
+        results[mode] = await measure_detections(detector, frames, settings.inference_batch_size)
+        detector.shutdown()
+
+    reference = results["none"]
+    print(f"{'model':<14}{'fps':>10}{'speedup':>9}{'boxes':>8}{'matched':>9}{'recall':>9}{'mean_iou':>10}")
+    for mode, result in results.items():
+        comparison = detection_recall(reference["detections"], result["detections"], iou_threshold)
+        label = "fp32" if mode == "none" else f"int8-{mode}"
+        print(
+            f"{label:<14}{result['fps']:>10.2f}{result['fps'] / (reference['fps'] or 1.0):>8.2f}x"
+            f"{comparison['candidate_boxes']:>8}{comparison['matched']:>9}"
+            f"{comparison['recall']:>9.3f}{comparison['mean_iou']:>10.3f}"
+        )
+    return 0
+
+
+async def tiling_report(
+    settings: Settings,
+    frames: List[np.ndarray],
+    tile_sizes: List[int],
+    iou_threshold: float
+) -> int:
+    """Compare tiled inference against full-frame inference on the same frames."""
+    results = {}
+    for tile_size in [0] + tile_sizes:
+        tiler = None
+        if tile_size:
+            tiler = FrameTiler(
+                tile_size=tile_size,
+                overlap=settings.tile_overlap,
+                nms_iou_threshold=settings.tile_nms_iou_threshold
+            )
+        detector = YOLODamageDetector(
+            model_path=settings.models_dir / "yolov8n.pt",
+            device=settings.model_device,
+            imgsz=settings.inference_imgsz,
+            tiler=tiler
+        )
+        if not await detector.load_model():
+            print("Could not load the model")
+            return 1
+        await detector.set_confidence_threshold(settings.confidence_threshold)
+        results[tile_size] = await measure_detections(detector, frames, settings.inference_batch_size)
+
+    # Recall of the full-frame boxes kept by tiling; "extra" are boxes only tiling found
+    reference = results[0]
+    print(f"{'mode':<14}{'fps':>10}{'speedup':>9}{'boxes':>8}{'matched':>9}{'recall':>9}{'extra':>7}")
+    for tile_size, result in results.items():
+        comparison = detection_recall(reference["detections"], result["detections"], iou_threshold)
+        label = "full-frame" if tile_size == 0 else f"tiles-{tile_size}"
+        print(
+            f"{label:<14}{result['fps']:>10.2f}{result['fps'] / (reference['fps'] or 1.0):>8.2f}x"
+            f"{comparison['candidate_boxes']:>8}{comparison['matched']:>9}{comparison['recall']:>9.3f}"
+            f"{comparison['candidate_boxes'] - comparison['matched']:>7}"
+        )
+    return 0
+
+
+async def main() -> int:
+    """Main function to run the inference benchmark."""
+    settings = Settings()
+
+    parser = argparse.ArgumentParser(description="Benchmark YOLO damage detector inference")
+    parser.add_argument("--video", type=Path, default=settings.videos_dir / "car2.mp4")
+    parser.add_argument("--frames", type=int, default=128, help="Number of frames to decode")
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+",
+        default=[settings.inference_batch_size],
+        help="Batch sizes to compare against the per-frame path"
+    )
+    parser.add_argument(
+        "--quantization-report", choices=["dynamic", "static"], nargs="+",
+        help="Compare INT8 ONNX models against FP32 ONNX (box recall and throughput)"
+    )
+    parser.add_argument(
+        "--tiling-report", type=int, nargs="+", metavar="TILE_SIZE",
+        help="Compare tiled inference with these tile sizes against full-frame inference"
+    )
+    parser.add_argument("--iou", type=float, default=0.5, help="IoU threshold for the recall report")
+    args = parser.parse_args()
+
+    frames = load_frames(args.video, args.frames)
+    if not frames:
+        print(f"No frames decoded from {args.video}")
+        return 1
+
+    if args.quantization_report:
+        print(f"Video: {args.video} ({len(frames)} frames)")
+        return await quantization_report(settings, frames, args.quantization_report, args.iou)
+    if args.tiling_report:
+        print(f"Video: {args.video} ({len(frames)} frames)")
+        return await tiling_report(settings, frames, args.tiling_report, args.iou)
+
+    detector = YOLODamageDetector(
+        model_path=settings.models_dir / "yolov8n.pt",
+        device=settings.model_device
+    )
+    if not await detector.load_model():
+        print("Could not load the model")
+        return 1
+    await detector.set_confidence_threshold(settings.confidence_threshold)
+
+    # Warm-up so that lazy initialisation does not skew the first measurement
+    await detector.detect_damages_in_batch(frames[:1], [0])
+
+    results = [await measure_per_frame(detector, frames)]
+    for batch_size in args.batch_sizes:
+        results.append(await measure_batched(detector, frames, batch_size))
+
+    print(f"Video: {args.video} ({len(frames)} frames)")
+    print_report(results)
+    return 0
+
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(main())
+    sys.exit(exit_code)
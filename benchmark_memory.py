@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Script to measure the memory cost per detection of the damage representations.
+It builds the same synthetic detections with the pre-change entities (regular
+dataclasses with a per-instance __dict__, as baseline), as a list of the
+current slotted Damage entities, as DamageColumns with UUID ids and as
+DamageColumns with sequential ids, and reports the bytes allocated per
+detection with tracemalloc.
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Union
+
+import numpy as np
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from src.domain.entities.damage import Damage, DamageType, DamageSeverity, BoundingBox
+from src.domain.entities.damage_columns import DamageColumns, DamageColumnsBuilder
+
+
+@dataclass
+class LegacyBoundingBox:
+    """BoundingBox as it was before the slotted entities: a regular dataclass."""
+    x: float
+    y: float
+    width: float
+    height: float
+
+    def __post_init__(self):
+        if self.x < 0 or self.y < 0:
+            raise ValueError("x and y must be positive")
+        if self.width <= 0 or self.height <= 0:
+            raise ValueError("width and height must be positive")
+
+    @classmethod
+    def from_corners(cls, x1: float, y1: float, x2: float, y2: float) -> "LegacyBoundingBox":
+        return cls(x=x1, y=y1, width=x2 - x1, height=y2 - y1)
+
+
+@dataclass
+class LegacyDamage:
+    """Damage as it was before the slotted entities: a regular dataclass with the same fields."""
+    id: Union[str, int]
+    damage_type: DamageType
+    severity: DamageSeverity
+    confidence: float
+    bounding_box: LegacyBoundingBox
+    frame_number: int
+    timestamp: float
+    description: Optional[str] = None
+
+    def __post_init__(self):
+        if not 0.0 <= self.confidence <= 1.0:
+            raise ValueError("confidence must be between 0.0 and 1.0")
+        if self.frame_number < 0:
+            raise ValueError("frame_number must be positive")
+
+
+def make_damages(count: int, sequential_ids: bool, damage_cls=Damage, box_cls=BoundingBox) -> List[Damage]:
+    """Build synthetic detections spread over frames, a few per frame."""
+    rng = np.random.default_rng(0)
+    corners = rng.uniform(0, 600, size=(count, 2))
+    sizes = rng.uniform(10, 200, size=(count, 2))
+    confidences = rng.uniform(0.5, 1.0, size=count)
+    damage_types = list(DamageType)
+    severities = list(DamageSeverity)
+
+    damages = []
+    for index in range(count):
+        x1, y1 = corners[index].tolist()
+        width, height = sizes[index].tolist()
+        damages.append(damage_cls(
+            id=index if sequential_ids else str(uuid.uuid4()),
+            damage_type=damage_types[index % len(damage_types)],
+            severity=severities[index % len(severities)],
+            confidence=float(confidences[index]),
+            bounding_box=box_cls.from_corners(x1, y1, x1 + width, y1 + height),
+            frame_number=index // 3,
+            timestamp=(index // 3) / 30.0
+        ))
+    return damages
+
+
+def as_columns(damages: List[Damage]) -> DamageColumns:
+    """Build the columns frame by frame, as the detector does."""
+    builder = DamageColumnsBuilder()
+    for offset in range(0, len(damages), 3):
+        builder.append(damages[offset:offset + 3])
+    return builder.build()
+
+
+def measure(label: str, count: int, build: Callable[[], object]) -> None:
+    """Print the bytes still allocated per detection once the representation is built."""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    print(f"{label:<38}{allocated / count:>12.1f}{allocated / 1e6:>12.2f}")
+    del kept
+
+
+def main() -> int:
+    """Main function to run the memory benchmark."""
+    parser = argparse.ArgumentParser(description="Measure memory per detection")
+    parser.add_argument("--detections", type=int, default=50000, help="Number of synthetic detections")
+    args = parser.parse_args()
+    count = args.detections
+
+    print(f"Detections: {count}")
+    print(f"{'representation':<38}{'bytes/det':>12}{'total MB':>12}")
+    # Baseline: the entities before they were made slotted and frozen
+    measure(
+        "Legacy Damage list (uuid ids)", count,
+        lambda: make_damages(count, sequential_ids=False, damage_cls=LegacyDamage, box_cls=LegacyBoundingBox)
+    )
+    measure(
+        "Legacy Damage list (sequential ids)", count,
+        lambda: make_damages(count, sequential_ids=True, damage_cls=LegacyDamage, box_cls=LegacyBoundingBox)
+    )
+    measure("Damage list (uuid ids)", count, lambda: make_damages(count, sequential_ids=False))
+    measure("Damage list (sequential ids)", count, lambda: make_damages(count, sequential_ids=True))
+    measure(
+        "DamageColumns (uuid ids)", count,
+        lambda: as_columns(make_damages(count, sequential_ids=False))
+    )
+    measure(
+        "DamageColumns (sequential ids)", count,
+        lambda: as_columns(make_damages(count, sequential_ids=True))
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
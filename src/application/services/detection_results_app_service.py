@@ -3,6 +3,7 @@ from datetime import datetime, date
 from pathlib import Path
 import asyncio
 
+from src.domain.entities.damage_columns import DamageColumns
 from src.domain.entities.detection_result import DetectionResult
 from src.domain.entities.damage import DamageType, DamageSeverity
 from src.domain.use_cases.get_detection_results_use_case import GetDetectionResultsUseCase
@@ -121,6 +122,7 @@ class DetectionResultsAppService(LoggerMixin):
             return {
                 "video_id": video_id,
                 "total_damages": len(result.damages),
+                "frames_with_damages": result.damaged_frame_count,
                 "damage_types": self._count_damage_types(result.damages),
                 "severity_distribution": self._count_severity_distribution(result.damages),
                 "processing_time": result.statistics.processing_time_seconds,
@@ -161,11 +163,9 @@ class DetectionResultsAppService(LoggerMixin):
                 daily_stats[result_date]["avg_processing_time"] += result.statistics.processing_time_seconds
                 
                 # Contar tipos de daño
-                for damage in result.damages:
-                    damage_type = damage.damage_type.value
-                    if damage_type not in daily_stats[result_date]["damage_types"]:
-                        daily_stats[result_date]["damage_types"][damage_type] = 0
-                    daily_stats[result_date]["damage_types"][damage_type] += 1
+                day_types = daily_stats[result_date]["damage_types"]
+                for damage_type, count in self._count_damage_types(result.damages).items():
+                    day_types[damage_type] = day_types.get(damage_type, 0) + count
             
             # Calcular promedios
             for date_key in daily_stats:
@@ -226,19 +226,11 @@ class DetectionResultsAppService(LoggerMixin):
     
     def _count_damage_types(self, damages) -> Dict[str, int]:
         """Cuenta la distribución de tipos de daño."""
-        counts = {}
-        for damage in damages:
-            damage_type = damage.damage_type.value
-            counts[damage_type] = counts.get(damage_type, 0) + 1
-        return counts
+        return DamageColumns.from_damages(damages).count_by_type()
     
     def _count_severity_distribution(self, damages) -> Dict[str, int]:
         """Cuenta la distribución de severidad de daños."""
-        counts = {}
-        for damage in damages:
-            severity = damage.severity.value
-            counts[severity] = counts.get(severity, 0) + 1
-        return counts
+        return DamageColumns.from_damages(damages).count_by_severity()
     
     async def get_recent_results(self, limit: int = 10) -> List[DetectionResult]:
         """Obtiene los resultados más recientes."""
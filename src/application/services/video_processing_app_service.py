@@ -19,7 +19,8 @@ class VideoProcessingAppService(LoggerMixin):
         self,
         process_video_use_case: ProcessVideoUseCase,
         get_detection_results_use_case: GetDetectionResultsUseCase,
-        max_concurrent_processes: int = None
+        max_concurrent_processes: int = None,
+        executor: Optional[ThreadPoolExecutor] = None
     ):
         self.process_video_use_case = process_video_use_case
         self.get_detection_results_use_case = get_detection_results_use_case
@@ -27,7 +28,9 @@ class VideoProcessingAppService(LoggerMixin):
         self.max_concurrent_processes = (
             max_concurrent_processes or self.settings.max_concurrent_detections
         )
-        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrent_processes)
+        # El executor puede compartirse con el detector, que ejecuta en él la inferencia bloqueante
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=self.max_concurrent_processes)
         self._processing_videos: Dict[str, bool] = {}
         
         self.log_info(f"VideoProcessingAppService inicializado con {self.max_concurrent_processes} procesos concurrentes")
@@ -120,11 +123,7 @@ class VideoProcessingAppService(LoggerMixin):
     async def get_video_status(self, video_id: str) -> Optional[Video]:
         """Obtiene el estado de un video por su ID."""
         try:
-            return await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.process_video_use_case.video_repository.find_by_id,
-                video_id
-            )
+            return await self.process_video_use_case.video_repository.find_by_id(video_id)
         except Exception as e:
             self.log_error(f"Error obteniendo estado del video {video_id}: {str(e)}")
             return None
@@ -144,10 +143,7 @@ class VideoProcessingAppService(LoggerMixin):
     async def get_all_videos(self) -> List[Video]:
         """Obtiene todos los videos registrados."""
         try:
-            return await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.process_video_use_case.video_repository.find_all
-            )
+            return await self.process_video_use_case.video_repository.find_all()
         except Exception as e:
             self.log_error(f"Error obteniendo lista de videos: {str(e)}")
             return []
@@ -155,11 +151,8 @@ class VideoProcessingAppService(LoggerMixin):
     async def get_videos_by_status(self, status: VideoStatus) -> List[Video]:
         """Obtiene videos filtrados por estado."""
         try:
-            return await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.process_video_use_case.video_repository.find_by_status,
-                status
-            )
+            # Consulta por estado resuelta por el repositorio (indexada en SQLite)
+            return await self.process_video_use_case.video_repository.find_by_status(status.value)
         except Exception as e:
             self.log_error(f"Error obteniendo videos por estado {status}: {str(e)}")
             return []
@@ -211,11 +204,7 @@ class VideoProcessingAppService(LoggerMixin):
                     video.status = VideoStatus.FAILED
                     video.updated_at = datetime.utcnow()
                     
-                    await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        self.process_video_use_case.video_repository.update,
-                        video
-                    )
+                    await self.process_video_use_case.video_repository.update(video)
                     count += 1
                     self.log_info(f"Video marcado como fallido: {video.file_path}")
             
@@ -230,5 +219,5 @@ class VideoProcessingAppService(LoggerMixin):
     
     def __del__(self):
         """Limpieza al destruir la instancia."""
-        if hasattr(self, 'executor'):
+        if hasattr(self, 'executor') and getattr(self, '_owns_executor', False):
             self.executor.shutdown(wait=False)
\ No newline at end of file
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 from datetime import datetime
 from enum import Enum
 
@@ -22,9 +22,9 @@ class DamageSeverity(Enum):
     CRITICAL = "critical" # Daño crítico
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BoundingBox:
-    """Representa las coordenadas de un bounding box."""
+    """Representa las coordenadas de un bounding box (inmutable, sin __dict__)."""
     x: float
     y: float
     width: float
@@ -37,6 +37,31 @@ class BoundingBox:
         if self.width <= 0 or self.height <= 0:
             raise ValueError("El ancho y alto deben ser positivos")
     
+    @classmethod
+    def from_corners(cls, x1: float, y1: float, x2: float, y2: float) -> "BoundingBox":
+        """Crea un bounding box a partir de las esquinas (x1, y1) y (x2, y2)."""
+        return cls(x=x1, y=y1, width=x2 - x1, height=y2 - y1)
+    
+    @property
+    def x1(self) -> float:
+        """Coordenada X de la esquina superior izquierda."""
+        return self.x
+    
+    @property
+    def y1(self) -> float:
+        """Coordenada Y de la esquina superior izquierda."""
+        return self.y
+    
+    @property
+    def x2(self) -> float:
+        """Coordenada X de la esquina inferior derecha."""
+        return self.x + self.width
+    
+    @property
+    def y2(self) -> float:
+        """Coordenada Y de la esquina inferior derecha."""
+        return self.y + self.height
+    
     @property
     def area(self) -> float:
         """Calcula el área del bounding box."""
@@ -48,16 +73,16 @@ class BoundingBox:
         return (self.x + self.width / 2, self.y + self.height / 2)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Damage:
-    """Entidad que representa un daño detectado en un vehículo."""
-    id: str
+    """Entidad que representa un daño detectado en un vehículo (inmutable, sin __dict__)."""
+    id: Union[str, int]  # UUID o entero secuencial dentro del resultado
     damage_type: DamageType
     severity: DamageSeverity
     confidence: float
     bounding_box: BoundingBox
     frame_number: int
-    timestamp: datetime
+    timestamp: float  # Segundos desde el inicio del video
     description: Optional[str] = None
     
     def __post_init__(self):
@@ -89,6 +114,6 @@ class Damage:
                 "height": self.bounding_box.height
             },
             "frame_number": self.frame_number,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp.isoformat() if isinstance(self.timestamp, datetime) else self.timestamp,
             "description": self.description
         }
\ No newline at end of file
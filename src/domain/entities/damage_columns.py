@@ -0,0 +1,279 @@
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .damage import Damage, DamageType, DamageSeverity, BoundingBox
+
+
+# Códigos enteros de tipo y severidad: índice en el orden de declaración del Enum
+DAMAGE_TYPES = list(DamageType)
+DAMAGE_SEVERITIES = list(DamageSeverity)
+_TYPE_CODES = {damage_type: code for code, damage_type in enumerate(DAMAGE_TYPES)}
+_SEVERITY_CODES = {severity: code for code, severity in enumerate(DAMAGE_SEVERITIES)}
+_SEVERE_CODES = [_SEVERITY_CODES[DamageSeverity.HIGH], _SEVERITY_CODES[DamageSeverity.CRITICAL]]
+
+
+class FrameIndex(NamedTuple):
+    """Índice de daños por frame: filas ordenadas por frame y desplazamientos por frame."""
+    order: np.ndarray       # Permutación estable de filas ordenadas por frame
+    frames: np.ndarray      # Frames con daños, ordenados y únicos
+    offsets: np.ndarray     # Inicio de cada frame en ``order`` (len(frames) + 1)
+    timestamps: np.ndarray  # Timestamps de las filas en el orden de ``order``
+
+    @classmethod
+    def build(cls, frame_numbers: np.ndarray, timestamps: np.ndarray) -> "FrameIndex":
+        """Construye el índice con una ordenación O(n log n)."""
+        order = np.argsort(frame_numbers, kind="stable")
+        sorted_frames = frame_numbers[order]
+        frames, starts = np.unique(sorted_frames, return_index=True)
+        offsets = np.append(starts, len(sorted_frames)).astype(np.int64)
+        return cls(order, frames, offsets, timestamps[order])
+
+    def rows_for_frame(self, frame_number: int) -> np.ndarray:
+        """Filas de un frame (búsqueda binaria)."""
+        position = np.searchsorted(self.frames, frame_number)
+        if position == len(self.frames) or self.frames[position] != frame_number:
+            return self.order[:0]
+        return self.order[self.offsets[position]:self.offsets[position + 1]]
+
+    def rows_for_time_range(self, start: float, end: float) -> np.ndarray:
+        """Filas con timestamp en [start, end] (los timestamps crecen con el frame)."""
+        first = np.searchsorted(self.timestamps, start, side="left")
+        last = np.searchsorted(self.timestamps, end, side="right")
+        return self.order[first:last]
+
+
+class DamageColumns(Sequence[Damage]):
+    """Daños almacenados por columnas NumPy (struct-of-arrays).
+
+    Ocupa unas decenas de bytes por detección en lugar de un Damage, un
+    BoundingBox y sus atributos por detección. Los Damage se construyen solo al
+    acceder a ellos y los filtros son máscaras vectorizadas que devuelven otra
+    DamageColumns. Las búsquedas por frame y por intervalo de tiempo usan un
+    índice por frame construido la primera vez que se necesita.
+    """
+
+    __slots__ = (
+        "frame_numbers", "timestamps", "type_codes", "severity_codes", "confidences", "boxes", "ids",
+        "_frame_index"
+    )
+
+    def __init__(
+        self,
+        frame_numbers: np.ndarray,
+        timestamps: np.ndarray,
+        type_codes: np.ndarray,
+        severity_codes: np.ndarray,
+        confidences: np.ndarray,
+        boxes: np.ndarray,
+        ids: Optional[np.ndarray] = None
+    ):
+        self.frame_numbers = np.asarray(frame_numbers, dtype=np.int64)
+        self.timestamps = np.asarray(timestamps, dtype=np.float64)
+        self.type_codes = np.asarray(type_codes, dtype=np.int8)
+        self.severity_codes = np.asarray(severity_codes, dtype=np.int8)
+        self.confidences = np.asarray(confidences, dtype=np.float32)
+        self.boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)  # x1, y1, x2, y2
+        self.ids = self._ids_column(ids) if ids is not None else None
+        self._frame_index: Optional[FrameIndex] = None
+
+        length = len(self.frame_numbers)
+        columns = [self.timestamps, self.type_codes, self.severity_codes, self.confidences, self.boxes]
+        if self.ids is not None:
+            columns.append(self.ids)
+        if any(len(column) != length for column in columns):
+            raise ValueError("Todas las columnas de daños deben tener la misma longitud")
+
+    @staticmethod
+    def _ids_column(ids) -> np.ndarray:
+        """Los ids enteros (secuenciales) se guardan como int64; los UUID como objetos."""
+        ids = np.asarray(ids)
+        if ids.dtype.kind in "iu":
+            return ids.astype(np.int64, copy=False)
+        return ids.astype(object, copy=False)
+
+    @classmethod
+    def empty(cls) -> "DamageColumns":
+        """Columnas sin daños."""
+        return cls([], [], [], [], [], np.empty((0, 4)), [])
+
+    @classmethod
+    def from_damages(cls, damages: Sequence[Damage]) -> "DamageColumns":
+        """Convierte una secuencia de Damage a columnas."""
+        if isinstance(damages, DamageColumns):
+            return damages
+        return cls(
+            frame_numbers=[damage.frame_number for damage in damages],
+            timestamps=[damage.timestamp for damage in damages],
+            type_codes=[_TYPE_CODES[damage.damage_type] for damage in damages],
+            severity_codes=[_SEVERITY_CODES[damage.severity] for damage in damages],
+            confidences=[damage.confidence for damage in damages],
+            boxes=[
+                [damage.bounding_box.x1, damage.bounding_box.y1, damage.bounding_box.x2, damage.bounding_box.y2]
+                for damage in damages
+            ] or np.empty((0, 4)),
+            ids=[damage.id for damage in damages]
+        )
+
+    @classmethod
+    def concat(cls, chunks: Sequence["DamageColumns"]) -> "DamageColumns":
+        """Concatena varios bloques de columnas."""
+        if not chunks:
+            return cls.empty()
+        with_ids = all(chunk.ids is not None for chunk in chunks)
+        return cls(
+            frame_numbers=np.concatenate([chunk.frame_numbers for chunk in chunks]),
+            timestamps=np.concatenate([chunk.timestamps for chunk in chunks]),
+            type_codes=np.concatenate([chunk.type_codes for chunk in chunks]),
+            severity_codes=np.concatenate([chunk.severity_codes for chunk in chunks]),
+            confidences=np.concatenate([chunk.confidences for chunk in chunks]),
+            boxes=np.concatenate([chunk.boxes for chunk in chunks]),
+            ids=np.concatenate([chunk.ids for chunk in chunks]) if with_ids else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.frame_numbers)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Damage, "DamageColumns"]:
+        if isinstance(index, slice):
+            return self.select(index)
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Índice de daño fuera de rango")
+        return self._damage_at(index)
+
+    def __iter__(self) -> Iterator[Damage]:
+        for index in range(len(self)):
+            yield self._damage_at(index)
+
+    def __repr__(self) -> str:
+        return f"DamageColumns({len(self)} daños)"
+
+    def select(self, selector: Union[np.ndarray, slice]) -> "DamageColumns":
+        """Subconjunto por máscara booleana, índices o slice."""
+        return DamageColumns(
+            frame_numbers=self.frame_numbers[selector],
+            timestamps=self.timestamps[selector],
+            type_codes=self.type_codes[selector],
+            severity_codes=self.severity_codes[selector],
+            confidences=self.confidences[selector],
+            boxes=self.boxes[selector],
+            ids=self.ids[selector] if self.ids is not None else None
+        )
+
+    @property
+    def frame_index(self) -> FrameIndex:
+        """Índice por frame (se construye una vez y se reutiliza)."""
+        if self._frame_index is None:
+            self._frame_index = FrameIndex.build(self.frame_numbers, self.timestamps)
+        return self._frame_index
+
+    @property
+    def frames(self) -> np.ndarray:
+        """Frames con al menos un daño, ordenados."""
+        return self.frame_index.frames
+
+    def by_frame(self, frame_number: int) -> "DamageColumns":
+        """Daños de un frame (O(log n) con el índice por frame)."""
+        return self.select(self.frame_index.rows_for_frame(frame_number))
+
+    def by_time_range(self, start: float, end: float) -> "DamageColumns":
+        """Daños con timestamp en [start, end] segundos, en orden de frame."""
+        return self.select(self.frame_index.rows_for_time_range(start, end))
+
+    def iter_frames(self) -> Iterator[Tuple[int, "DamageColumns"]]:
+        """Recorre los frames con daños en orden, con los daños de cada uno."""
+        index = self.frame_index
+        for position, frame_number in enumerate(index.frames.tolist()):
+            rows = index.order[index.offsets[position]:index.offsets[position + 1]]
+            yield frame_number, self.select(rows)
+
+    def by_type(self, damage_type: str) -> "DamageColumns":
+        """Daños de un tipo (valor del Enum, p. ej. "dent")."""
+        try:
+            code = _TYPE_CODES[DamageType(damage_type)]
+        except ValueError:
+            return self.select(np.zeros(len(self), dtype=bool))
+        return self.select(self.type_codes == code)
+
+    def by_confidence_range(self, min_confidence: float, max_confidence: float = 1.0) -> "DamageColumns":
+        """Daños con confianza en [min_confidence, max_confidence]."""
+        return self.select((self.confidences >= min_confidence) & (self.confidences <= max_confidence))
+
+    def severe(self) -> "DamageColumns":
+        """Daños severos o críticos."""
+        return self.select(np.isin(self.severity_codes, _SEVERE_CODES))
+
+    def with_types(self, damage_types: Iterable[str]) -> "DamageColumns":
+        """Daños de cualquiera de los tipos dados (valores del Enum)."""
+        codes = [_TYPE_CODES[DamageType(value)] for value in damage_types]
+        return self.select(np.isin(self.type_codes, codes))
+
+    def with_severities(self, severities: Iterable[str]) -> "DamageColumns":
+        """Daños de cualquiera de las severidades dadas (valores del Enum)."""
+        codes = [_SEVERITY_CODES[DamageSeverity(value)] for value in severities]
+        return self.select(np.isin(self.severity_codes, codes))
+
+    def count_by_type(self) -> Dict[str, int]:
+        """Número de daños de cada tipo presente (un único ``bincount``)."""
+        counts = np.bincount(self.type_codes, minlength=len(DAMAGE_TYPES))
+        return {DAMAGE_TYPES[code].value: int(counts[code]) for code in np.flatnonzero(counts)}
+
+    def count_by_severity(self) -> Dict[str, int]:
+        """Número de daños de cada severidad presente (un único ``bincount``)."""
+        counts = np.bincount(self.severity_codes, minlength=len(DAMAGE_SEVERITIES))
+        return {DAMAGE_SEVERITIES[code].value: int(counts[code]) for code in np.flatnonzero(counts)}
+
+    def unique_types(self) -> List[str]:
+        """Valores de los tipos de daño presentes."""
+        return [DAMAGE_TYPES[code].value for code in np.unique(self.type_codes)]
+
+    def _damage_at(self, index: int) -> Damage:
+        """Materializa el Damage de una fila."""
+        x1, y1, x2, y2 = self.boxes[index].tolist()
+        damage_id = self.ids[index] if self.ids is not None else index
+        if isinstance(damage_id, np.generic):
+            damage_id = damage_id.item()
+        return Damage(
+            id=damage_id,
+            damage_type=DAMAGE_TYPES[self.type_codes[index]],
+            severity=DAMAGE_SEVERITIES[self.severity_codes[index]],
+            confidence=float(self.confidences[index]),
+            bounding_box=BoundingBox.from_corners(x1, y1, x2, y2),
+            frame_number=int(self.frame_numbers[index]),
+            timestamp=float(self.timestamps[index])
+        )
+
+
+class DamageColumnsBuilder:
+    """Acumula daños frame a frame en bloques de columnas y los concatena al final."""
+
+    # Bloques por frame pendientes antes de compactarlos en uno (acota la sobrecarga por frame)
+    COMPACT_EVERY = 256
+
+    def __init__(self):
+        self._blocks: List[DamageColumns] = []
+        self._pending: List[DamageColumns] = []
+
+    def append(self, damages: Sequence[Damage]) -> None:
+        """Añade los daños de un frame; los Damage pueden liberarse después."""
+        if not damages:
+            return
+        self._pending.append(DamageColumns.from_damages(damages))
+        if len(self._pending) >= self.COMPACT_EVERY:
+            self._compact()
+
+    def build(self) -> DamageColumns:
+        """Columnas con todos los daños añadidos."""
+        self._compact()
+        if len(self._blocks) > 1:
+            self._blocks = [DamageColumns.concat(self._blocks)]
+        return self._blocks[0] if self._blocks else DamageColumns.empty()
+
+    def _compact(self) -> None:
+        """Une los bloques pendientes en un único bloque."""
+        if self._pending:
+            self._blocks.append(DamageColumns.concat(self._pending))
+            self._pending = []
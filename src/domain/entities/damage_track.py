@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+
+from .damage import Damage, DamageType, DamageSeverity, BoundingBox
+
+
+@dataclass(frozen=True, slots=True)
+class DamageTrack:
+    """Un mismo daño seguido a lo largo de varios frames del video."""
+    id: str
+    damage_type: DamageType
+    severity: DamageSeverity  # Severidad máxima observada
+    peak_confidence: float
+    representative_box: BoundingBox  # Caja del frame de mayor confianza
+    first_frame: int
+    last_frame: int
+    first_timestamp: float
+    last_timestamp: float
+    peak_frame: int
+    peak_timestamp: float
+    detection_count: int
+
+    def __post_init__(self):
+        """Validar los datos del track."""
+        if not 0.0 <= self.peak_confidence <= 1.0:
+            raise ValueError("La confianza máxima debe estar entre 0.0 y 1.0")
+        if self.first_frame < 0 or self.last_frame < self.first_frame:
+            raise ValueError("El rango de frames del track no es válido")
+        if self.detection_count < 1:
+            raise ValueError("Un track debe tener al menos una detección")
+
+    @property
+    def frame_span(self) -> int:
+        """Número de frames entre la primera y la última aparición (inclusive)."""
+        return self.last_frame - self.first_frame + 1
+
+    @property
+    def duration(self) -> float:
+        """Segundos durante los que el daño es visible."""
+        return self.last_timestamp - self.first_timestamp
+
+    def is_severe(self) -> bool:
+        """Determina si el daño es severo o crítico."""
+        return self.severity in [DamageSeverity.HIGH, DamageSeverity.CRITICAL]
+
+    def to_damage(self) -> Damage:
+        """Detección representativa del track (la de mayor confianza)."""
+        return Damage(
+            id=self.id,
+            damage_type=self.damage_type,
+            severity=self.severity,
+            confidence=self.peak_confidence,
+            bounding_box=self.representative_box,
+            frame_number=self.peak_frame,
+            timestamp=self.peak_timestamp
+        )
+
+    def to_dict(self) -> dict:
+        """Convierte el track a diccionario para serialización."""
+        return {
+            "id": self.id,
+            "damage_type": self.damage_type.value,
+            "severity": self.severity.value,
+            "peak_confidence": self.peak_confidence,
+            "representative_box": {
+                "x": self.representative_box.x,
+                "y": self.representative_box.y,
+                "width": self.representative_box.width,
+                "height": self.representative_box.height
+            },
+            "first_frame": self.first_frame,
+            "last_frame": self.last_frame,
+            "first_timestamp": self.first_timestamp,
+            "last_timestamp": self.last_timestamp,
+            "peak_frame": self.peak_frame,
+            "peak_timestamp": self.peak_timestamp,
+            "detection_count": self.detection_count
+        }
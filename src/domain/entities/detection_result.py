@@ -1,9 +1,12 @@
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+import heapq
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Sequence, Tuple
 from datetime import datetime
 from pathlib import Path
 
 from .damage import Damage
+from .damage_columns import DamageColumns
+from .damage_track import DamageTrack
 from .video import Video
 
 
@@ -17,6 +20,20 @@ class DetectionStatistics:
     average_confidence: float
     processing_time: float
     frames_per_second: float
+    total_tracks: int = 0  # Daños distintos tras enlazar las detecciones entre frames
+    # Agregados incrementales (None en resultados guardados antes de existir)
+    high_confidence_damages: Optional[int] = None
+    severe_damages: Optional[int] = None
+    confidence_histogram: Optional[List[int]] = None  # Bins de igual ancho en [0, 1]
+    damages_per_frame: Optional[Dict[int, int]] = None  # Solo frames con daños
+    top_damages: Optional[List[Damage]] = None  # Top-K por confianza
+    
+    @property
+    def frames_with_damages(self) -> Optional[int]:
+        """Número de frames con al menos un daño, si se acumuló."""
+        if self.damages_per_frame is None:
+            return None
+        return len(self.damages_per_frame)
     
     def __post_init__(self):
         """Validar estadísticas."""
@@ -32,18 +49,103 @@ class DetectionStatistics:
             raise ValueError("Los frames por segundo deben ser positivos")
 
 
+class DetectionStatisticsAccumulator:
+    """Acumula las estadísticas de una detección frame a frame.
+
+    Mantiene solo contadores, sumas, un histograma de confianza, el número de
+    daños por frame con daños y un heap con los ``top_k`` daños más confiables,
+    de modo que las cifras finales no requieren conservar ni recorrer de nuevo
+    todas las detecciones.
+    """
+    
+    def __init__(self, confidence_threshold: float = 0.5, histogram_bins: int = 10, top_k: int = 10):
+        if histogram_bins < 1:
+            raise ValueError("El histograma de confianza debe tener al menos un bin")
+        self._confidence_threshold = confidence_threshold
+        self._top_k = top_k
+        self._frames_processed = 0
+        self._total_damages = 0
+        self._confidence_sum = 0.0
+        self._high_confidence = 0
+        self._severe = 0
+        self._by_type: Dict[str, int] = {}
+        self._by_severity: Dict[str, int] = {}
+        self._histogram = [0] * histogram_bins
+        self._per_frame: Dict[int, int] = {}
+        self._top: List[Tuple[float, int, Damage]] = []
+    
+    @property
+    def total_damages(self) -> int:
+        """Daños acumulados hasta el momento."""
+        return self._total_damages
+    
+    @property
+    def frames_processed(self) -> int:
+        """Frames acumulados hasta el momento."""
+        return self._frames_processed
+    
+    def add_frame(self, frame_number: int, damages: List[Damage]) -> None:
+        """Incorpora los daños de un frame inferido (la lista puede estar vacía)."""
+        self._frames_processed += 1
+        if not damages:
+            return
+        
+        self._per_frame[frame_number] = self._per_frame.get(frame_number, 0) + len(damages)
+        bins = len(self._histogram)
+        for damage in damages:
+            self._total_damages += 1
+            self._confidence_sum += damage.confidence
+            if damage.confidence >= self._confidence_threshold:
+                self._high_confidence += 1
+            if damage.is_severe():
+                self._severe += 1
+            
+            damage_type = damage.damage_type.value
+            self._by_type[damage_type] = self._by_type.get(damage_type, 0) + 1
+            severity = damage.severity.value
+            self._by_severity[severity] = self._by_severity.get(severity, 0) + 1
+            self._histogram[min(int(damage.confidence * bins), bins - 1)] += 1
+            
+            # Min-heap de tamaño top_k; el contador desempata sin comparar Damage
+            entry = (damage.confidence, self._total_damages, damage)
+            if len(self._top) < self._top_k:
+                heapq.heappush(self._top, entry)
+            elif entry[0] > self._top[0][0]:
+                heapq.heapreplace(self._top, entry)
+    
+    def build(self, processing_time: float, total_tracks: int = 0) -> DetectionStatistics:
+        """Estadísticas finales de la detección."""
+        return DetectionStatistics(
+            total_frames_processed=self._frames_processed,
+            total_damages_detected=self._total_damages,
+            damages_by_type=dict(self._by_type),
+            damages_by_severity=dict(self._by_severity),
+            average_confidence=self._confidence_sum / self._total_damages if self._total_damages else 0.0,
+            processing_time=processing_time,
+            frames_per_second=self._frames_processed / processing_time if processing_time > 0 else 0.0,
+            total_tracks=total_tracks,
+            high_confidence_damages=self._high_confidence,
+            severe_damages=self._severe,
+            confidence_histogram=list(self._histogram),
+            damages_per_frame=dict(self._per_frame),
+            top_damages=[damage for _, _, damage in sorted(self._top, reverse=True)]
+        )
+
+
 @dataclass
 class DetectionResult:
     """Resultado completo de la detección de daños en un video."""
     id: str
     video: Video
-    damages: List[Damage]
+    damages: Sequence[Damage]  # Se almacena como DamageColumns
     statistics: DetectionStatistics
     created_at: datetime
     model_version: str
     confidence_threshold: float
     output_path: Optional[Path] = None
     annotated_video_path: Optional[Path] = None
+    tracks: List[DamageTrack] = field(default_factory=list)
+    annotated_clip_paths: List[Path] = field(default_factory=list)  # Clips de los tramos con daños
     
     def __post_init__(self):
         """Validar resultado de detección."""
@@ -51,6 +153,8 @@ class DetectionResult:
             raise ValueError("El umbral de confianza debe estar entre 0.0 y 1.0")
         if not self.model_version:
             raise ValueError("La versión del modelo es requerida")
+        if not isinstance(self.damages, DamageColumns):
+            self.damages = DamageColumns.from_damages(self.damages)
     
     @property
     def has_damages(self) -> bool:
@@ -63,49 +167,84 @@ class DetectionResult:
         return len(self.damages)
     
     @property
-    def high_confidence_damages(self) -> List[Damage]:
+    def high_confidence_damages(self) -> DamageColumns:
         """Obtiene daños con confianza superior al umbral."""
-        return [damage for damage in self.damages if damage.confidence >= self.confidence_threshold]
+        return self.damages.by_confidence_range(self.confidence_threshold)
     
     @property
-    def severe_damages(self) -> List[Damage]:
+    def severe_damages(self) -> DamageColumns:
         """Obtiene daños severos o críticos."""
-        return [damage for damage in self.damages if damage.is_severe()]
+        return self.damages.severe()
+    
+    @property
+    def high_confidence_count(self) -> int:
+        """Número de daños con confianza superior al umbral."""
+        if self.statistics.high_confidence_damages is not None:
+            return self.statistics.high_confidence_damages
+        return len(self.high_confidence_damages)
+    
+    @property
+    def severe_count(self) -> int:
+        """Número de daños severos o críticos."""
+        if self.statistics.severe_damages is not None:
+            return self.statistics.severe_damages
+        return len(self.severe_damages)
     
     @property
     def unique_damage_types(self) -> List[str]:
         """Obtiene los tipos únicos de daños detectados."""
-        return list(set(damage.damage_type.value for damage in self.damages))
+        return [damage_type for damage_type, count in self.statistics.damages_by_type.items() if count > 0]
+    
+    def get_damage_count_by_frame(self, frame_number: int) -> int:
+        """Número de daños detectados en un frame específico."""
+        if self.statistics.damages_per_frame is not None:
+            return self.statistics.damages_per_frame.get(frame_number, 0)
+        return len(self.get_damages_by_frame(frame_number))
     
-    def get_damages_by_frame(self, frame_number: int) -> List[Damage]:
-        """Obtiene todos los daños detectados en un frame específico."""
-        return [damage for damage in self.damages if damage.frame_number == frame_number]
+    def get_damages_by_frame(self, frame_number: int) -> DamageColumns:
+        """Obtiene todos los daños detectados en un frame específico (búsqueda indexada)."""
+        return self.damages.by_frame(frame_number)
+    
+    def get_damages_in_time_range(self, start: float, end: float) -> DamageColumns:
+        """Obtiene los daños detectados entre dos instantes del video (segundos)."""
+        return self.damages.by_time_range(start, end)
+    
+    @property
+    def damaged_frames(self) -> List[int]:
+        """Frames con al menos un daño, ordenados."""
+        return self.damages.frames.tolist()
+    
+    @property
+    def damaged_frame_count(self) -> int:
+        """Número de frames con al menos un daño."""
+        if self.statistics.frames_with_damages is not None:
+            return self.statistics.frames_with_damages
+        return len(self.damages.frames)
     
-    def get_damages_by_type(self, damage_type: str) -> List[Damage]:
+    def get_damages_by_type(self, damage_type: str) -> DamageColumns:
         """Obtiene todos los daños de un tipo específico."""
-        return [damage for damage in self.damages if damage.damage_type.value == damage_type]
+        return self.damages.by_type(damage_type)
     
-    def get_damages_by_confidence_range(self, min_confidence: float, max_confidence: float = 1.0) -> List[Damage]:
+    def get_damages_by_confidence_range(self, min_confidence: float, max_confidence: float = 1.0) -> DamageColumns:
         """Obtiene daños dentro de un rango de confianza."""
-        return [
-            damage for damage in self.damages 
-            if min_confidence <= damage.confidence <= max_confidence
-        ]
+        return self.damages.by_confidence_range(min_confidence, max_confidence)
     
     def calculate_damage_density(self) -> float:
         """Calcula la densidad de daños por frame."""
         if self.statistics.total_frames_processed == 0:
             return 0.0
-        return self.damage_count / self.statistics.total_frames_processed
+        return self.statistics.total_damages_detected / self.statistics.total_frames_processed
     
     def generate_summary(self) -> Dict[str, any]:
         """Genera un resumen del resultado de detección."""
         return {
             "video_name": self.video.name,
             "total_damages": self.damage_count,
-            "high_confidence_damages": len(self.high_confidence_damages),
-            "severe_damages": len(self.severe_damages),
+            "high_confidence_damages": self.high_confidence_count,
+            "severe_damages": self.severe_count,
             "unique_damage_types": self.unique_damage_types,
+            "damage_tracks": len(self.tracks),
+            "frames_with_damages": self.damaged_frame_count,
             "damage_density": self.calculate_damage_density(),
             "processing_time": self.statistics.processing_time,
             "average_confidence": self.statistics.average_confidence,
@@ -127,12 +266,22 @@ class DetectionResult:
                 "damages_by_severity": self.statistics.damages_by_severity,
                 "average_confidence": self.statistics.average_confidence,
                 "processing_time": self.statistics.processing_time,
-                "frames_per_second": self.statistics.frames_per_second
+                "frames_per_second": self.statistics.frames_per_second,
+                "total_tracks": self.statistics.total_tracks,
+                "high_confidence_damages": self.statistics.high_confidence_damages,
+                "severe_damages": self.statistics.severe_damages,
+                "confidence_histogram": self.statistics.confidence_histogram,
+                "frames_with_damages": self.statistics.frames_with_damages,
+                "top_damages": [
+                    damage.to_dict() for damage in self.statistics.top_damages
+                ] if self.statistics.top_damages is not None else None
             },
             "created_at": self.created_at.isoformat(),
             "model_version": self.model_version,
             "confidence_threshold": self.confidence_threshold,
             "output_path": str(self.output_path) if self.output_path else None,
             "annotated_video_path": str(self.annotated_video_path) if self.annotated_video_path else None,
+            "annotated_clip_paths": [str(path) for path in self.annotated_clip_paths],
+            "tracks": [track.to_dict() for track in self.tracks],
             "summary": self.generate_summary()
         }
\ No newline at end of file
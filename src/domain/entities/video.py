@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, InitVar
 from typing import List, Optional
 from datetime import datetime
 from pathlib import Path
@@ -79,12 +79,17 @@ class Video:
     processing_time: Optional[float] = None  # Tiempo en segundos
     error_message: Optional[str] = None
     updated_at: Optional[datetime] = None
+    # False al reconstruir un video ya persistido: el archivo se validó al registrarlo
+    validate_file: InitVar[bool] = True
     
-    def __post_init__(self):
+    def __post_init__(self, validate_file: bool):
         """Inicializar valores por defecto."""
         if self.damages is None:
             self.damages = []
         
+        if not validate_file:
+            return
+        
         # Validar que el archivo existe
         if not self.file_path.exists():
             raise FileNotFoundError(f"El archivo {self.file_path} no existe")
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from pathlib import Path
+import numpy as np
 
 from ..entities.video import Video
 from ..entities.damage import Damage
@@ -11,13 +12,27 @@ class DamageDetectionService(ABC):
     """Interfaz del servicio de detección de daños."""
     
     @abstractmethod
-    async def detect_damages_in_video(self, video: Video, confidence_threshold: float = 0.5) -> DetectionResult:
-        """Detecta daños en un video completo."""
+    async def detect_damages_in_video(
+        self,
+        video: Video,
+        confidence_threshold: float = 0.5,
+        annotated_output_path: Optional[Path] = None
+    ) -> DetectionResult:
+        """Detecta daños en un video completo.
+
+        Si se indica ``annotated_output_path``, el video anotado se escribe en la
+        misma pasada de decodificación y su ruta queda en el resultado.
+        """
         pass
     
     @abstractmethod
     async def detect_damages_in_frame(self, frame_data: bytes, frame_number: int) -> List[Damage]:
-        """Detecta daños en un frame específico."""
+        """Detecta daños en un frame codificado (JPEG/PNG) específico."""
+        pass
+    
+    @abstractmethod
+    async def detect_damages_in_array(self, frame: np.ndarray, frame_number: int) -> List[Damage]:
+        """Detecta daños en un frame ya decodificado (array BGR)."""
         pass
     
     @abstractmethod
@@ -36,8 +36,28 @@ class VideoProcessingService(ABC):
         pass
     
     @abstractmethod
-    async def create_annotated_video(self, video: Video, detection_result: DetectionResult, output_path: Path) -> Path:
-        """Crea un video anotado con las detecciones."""
+    async def create_annotated_video(
+        self,
+        video: Video,
+        detection_result: DetectionResult,
+        output_path: Path,
+        passthrough_unannotated: bool = False
+    ) -> Path:
+        """Crea un video anotado con las detecciones.
+        
+        Con ``passthrough_unannotated`` los tramos sin daños se copian del original
+        sin recodificar cuando la implementación lo permite.
+        """
+        pass
+    
+    @abstractmethod
+    async def create_annotated_clips(
+        self,
+        video: Video,
+        detection_result: DetectionResult,
+        output_dir: Path
+    ) -> List[Path]:
+        """Crea clips anotados solo de los tramos del video con daños."""
         pass
     
     @abstractmethod
@@ -1,8 +1,9 @@
+from collections import Counter
 from typing import List, Optional, Dict
 from datetime import datetime
 
 from ..entities.detection_result import DetectionResult
-from ..entities.damage import DamageType, DamageSeverity
+from ..entities.damage import Damage, DamageType, DamageSeverity
 from ..repositories.detection_repository import DetectionRepository
 from ..repositories.video_repository import VideoRepository
 
@@ -46,13 +47,29 @@ class GetDetectionResultsUseCase:
         """Obtiene resultados en un rango de fechas."""
         return await self._detection_repository.find_by_date_range(start_date, end_date)
     
+    async def get_damages_in_frame(self, result_id: str, frame_number: int) -> Optional[List[Damage]]:
+        """Obtiene los daños de un frame concreto de un resultado."""
+        result = await self._detection_repository.find_by_id(result_id)
+        if not result:
+            return None
+        return list(result.get_damages_by_frame(frame_number))
+    
+    async def get_damages_in_time_range(
+        self,
+        result_id: str,
+        start_seconds: float,
+        end_seconds: float
+    ) -> Optional[List[Damage]]:
+        """Obtiene los daños de un resultado entre dos instantes del video."""
+        result = await self._detection_repository.find_by_id(result_id)
+        if not result:
+            return None
+        return list(result.get_damages_in_time_range(start_seconds, end_seconds))
+    
     async def get_severe_damage_results(self) -> List[DetectionResult]:
         """Obtiene resultados que contienen daños severos o críticos."""
         all_results = await self._detection_repository.find_with_damages()
-        return [
-            result for result in all_results 
-            if any(damage.is_severe() for damage in result.damages)
-        ]
+        return [result for result in all_results if len(result.damages.severe()) > 0]
     
     async def get_statistics(self) -> Dict[str, any]:
         """Obtiene estadísticas generales de todas las detecciones."""
@@ -62,23 +79,13 @@ class GetDetectionResultsUseCase:
         all_results = await self._detection_repository.find_all()
         results_with_damages = await self._detection_repository.find_with_damages()
         
-        # Calcular estadísticas por tipo de daño
-        damage_type_stats = {}
-        severity_stats = {}
+        # Distribución por tipo y severidad: un bincount sobre las columnas de cada resultado
+        damage_type_stats = Counter()
+        severity_stats = Counter()
         
         for result in results_with_damages:
-            for damage in result.damages:
-                # Estadísticas por tipo
-                damage_type = damage.damage_type.value
-                if damage_type not in damage_type_stats:
-                    damage_type_stats[damage_type] = 0
-                damage_type_stats[damage_type] += 1
-                
-                # Estadísticas por severidad
-                severity = damage.severity.value
-                if severity not in severity_stats:
-                    severity_stats[severity] = 0
-                severity_stats[severity] += 1
+            damage_type_stats.update(result.damages.count_by_type())
+            severity_stats.update(result.damages.count_by_severity())
         
         # Combinar estadísticas
         enhanced_stats = {
@@ -87,8 +94,8 @@ class GetDetectionResultsUseCase:
             "videos_with_damages": len(results_with_damages),
             "videos_without_damages": len(all_results) - len(results_with_damages),
             "damage_detection_rate": len(results_with_damages) / len(all_results) if all_results else 0,
-            "damage_types_distribution": damage_type_stats,
-            "severity_distribution": severity_stats
+            "damage_types_distribution": dict(damage_type_stats),
+            "severity_distribution": dict(severity_stats)
         }
         
         return enhanced_stats
@@ -150,24 +157,16 @@ class GetDetectionResultsUseCase:
             elif end_date:
                 results = [r for r in results if r.created_at <= end_date]
         
+        # Filtros por daño como máscaras sobre las columnas (sin materializar los Damage)
         if damage_types:
             damage_type_values = [dt.value for dt in damage_types]
-            results = [
-                r for r in results 
-                if any(d.damage_type.value in damage_type_values for d in r.damages)
-            ]
+            results = [r for r in results if len(r.damages.with_types(damage_type_values)) > 0]
         
         if min_confidence is not None:
-            results = [
-                r for r in results 
-                if any(d.confidence >= min_confidence for d in r.damages)
-            ]
+            results = [r for r in results if len(r.damages.by_confidence_range(min_confidence)) > 0]
         
         if severity_levels:
             severity_values = [sl.value for sl in severity_levels]
-            results = [
-                r for r in results 
-                if any(d.severity.value in severity_values for d in r.damages)
-            ]
+            results = [r for r in results if len(r.damages.with_severities(severity_values)) > 0]
         
         return results
\ No newline at end of file
@@ -11,6 +11,11 @@ from ..services.damage_detection_service import DamageDetectionService
 from ..services.video_processing_service import VideoProcessingService
 
 
+# Salida anotada: video completo, solo clips de los tramos con daños, o video completo
+# con los tramos sin daños copiados del original
+ANNOTATED_OUTPUT_MODES = ("full", "clips", "passthrough")
+
+
 class ProcessVideoUseCase:
     """Caso de uso para procesar un video y detectar daños."""
     
@@ -19,12 +24,26 @@ class ProcessVideoUseCase:
         video_repository: VideoRepository,
         detection_repository: DetectionRepository,
         damage_detection_service: DamageDetectionService,
-        video_processing_service: VideoProcessingService
+        video_processing_service: VideoProcessingService,
+        fused_annotation: bool = True,
+        annotated_output_mode: str = "full"
     ):
+        if annotated_output_mode not in ANNOTATED_OUTPUT_MODES:
+            raise ValueError(f"Modo de salida anotada no soportado: {annotated_output_mode}")
+        
         self._video_repository = video_repository
         self._detection_repository = detection_repository
         self._damage_detection_service = damage_detection_service
         self._video_processing_service = video_processing_service
+        # El video anotado se escribe durante la detección en lugar de decodificar el video dos veces
+        # (solo en el modo full: los otros modos necesitan conocer antes los tramos con daños)
+        self._fused_annotation = fused_annotation
+        self._annotated_output_mode = annotated_output_mode
+    
+    @property
+    def video_repository(self) -> VideoRepository:
+        """Repositorio de videos usado por el caso de uso."""
+        return self._video_repository
     
     async def execute(
         self, 
@@ -67,21 +86,42 @@ class ProcessVideoUseCase:
             # Configurar umbral de confianza
             await self._damage_detection_service.set_confidence_threshold(confidence_threshold)
             
-            # Detectar daños en el video
-            detection_result = await self._damage_detection_service.detect_damages_in_video(
-                video, confidence_threshold
-            )
-            
-            # Crear video anotado si se solicita
-            if create_annotated_video and detection_result.has_damages:
+            annotated_path = None
+            if create_annotated_video:
                 output_dir = video_path.parent / "output"
                 output_dir.mkdir(exist_ok=True)
-                
                 annotated_path = output_dir / f"annotated_{video_path.name}"
-                annotated_video_path = await self._video_processing_service.create_annotated_video(
-                    video, detection_result, annotated_path
+            
+            fused = self._fused_annotation and self._annotated_output_mode == "full"
+            if annotated_path and fused:
+                # Detectar daños y escribir el video anotado en una sola pasada
+                detection_result = await self._damage_detection_service.detect_damages_in_video(
+                    video, confidence_threshold, annotated_output_path=annotated_path
                 )
-                detection_result.annotated_video_path = annotated_video_path
+                if not detection_result.has_damages:
+                    # Sin daños no se conserva el video anotado, igual que en el modo de dos pasadas
+                    annotated_path.unlink(missing_ok=True)
+                    detection_result.annotated_video_path = None
+            else:
+                # Detectar daños en el video
+                detection_result = await self._damage_detection_service.detect_damages_in_video(
+                    video, confidence_threshold
+                )
+                
+                # Crear video anotado (o clips de los tramos con daños) si se solicita
+                if annotated_path and detection_result.has_damages:
+                    if self._annotated_output_mode == "clips":
+                        detection_result.annotated_clip_paths = (
+                            await self._video_processing_service.create_annotated_clips(
+                                video, detection_result, annotated_path.parent
+                            )
+                        )
+                    else:
+                        annotated_video_path = await self._video_processing_service.create_annotated_video(
+                            video, detection_result, annotated_path,
+                            passthrough_unannotated=self._annotated_output_mode == "passthrough"
+                        )
+                        detection_result.annotated_video_path = annotated_video_path
             
             # Actualizar estado del video
             video.status = VideoStatus.COMPLETED
@@ -1,4 +1,5 @@
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import Dict, Any
 
 from src.domain.repositories.video_repository import VideoRepository
@@ -11,7 +12,14 @@ from src.application.services.video_processing_app_service import VideoProcessin
 
 from src.infrastructure.repositories.json_video_repository import JsonVideoRepository
 from src.infrastructure.repositories.json_detection_repository import JsonDetectionRepository
+from src.infrastructure.repositories.sqlite_database import SqliteDatabase
+from src.infrastructure.repositories.sqlite_detection_repository import SqliteDetectionRepository
+from src.infrastructure.repositories.sqlite_video_repository import SqliteVideoRepository
 from src.infrastructure.ml.yolo_damage_detector import YOLODamageDetector
+from src.infrastructure.ml.damage_tracker import IoUDamageTracker
+from src.infrastructure.ml.frame_sampler import create_frame_sampler
+from src.infrastructure.ml.tiling import FrameTiler
+from src.infrastructure.ml.vehicle_roi import VehicleRoiLocator
 from src.infrastructure.video.opencv_video_processor import OpenCVVideoProcessor
 from src.infrastructure.config.settings import get_settings
 from src.infrastructure.config.logging_config import get_logger
@@ -30,20 +38,53 @@ class DependencyContainer:
     def get_video_repository(self) -> VideoRepository:
         """Obtiene la instancia del repositorio de videos."""
         if "video_repository" not in self._instances:
-            storage_path = self._settings.storage_path / "videos.json"
-            self._instances["video_repository"] = JsonVideoRepository(storage_path)
-            self._logger.info(f"VideoRepository creado con storage: {storage_path}")
+            if self._settings.storage_type == "sqlite":
+                # Misma base de datos (y conexiones) que el repositorio de detecciones
+                self._instances["video_repository"] = SqliteVideoRepository(self.get_sqlite_database())
+                self._logger.info("VideoRepository creado con storage SQLite")
+            elif self._settings.storage_type == "json":
+                storage_path = self._settings.storage_path / "videos.json"
+                self._instances["video_repository"] = JsonVideoRepository(storage_path)
+                self._logger.info(f"VideoRepository creado con storage: {storage_path}")
+            else:
+                raise ValueError(f"Tipo de almacenamiento no soportado: {self._settings.storage_type}")
         return self._instances["video_repository"]
     
+    @lru_cache(maxsize=1)
+    def get_sqlite_database(self) -> SqliteDatabase:
+        """Obtiene la base de datos SQLite compartida por los repositorios."""
+        if "sqlite_database" not in self._instances:
+            self._instances["sqlite_database"] = SqliteDatabase(self._settings.sqlite_path)
+            self._logger.info(f"Base de datos SQLite abierta: {self._settings.sqlite_path}")
+        return self._instances["sqlite_database"]
+    
     @lru_cache(maxsize=1)
     def get_detection_repository(self) -> DetectionRepository:
         """Obtiene la instancia del repositorio de detecciones."""
         if "detection_repository" not in self._instances:
-            storage_path = self._settings.storage_path / "detections.json"
-            self._instances["detection_repository"] = JsonDetectionRepository(storage_path)
-            self._logger.info(f"DetectionRepository creado con storage: {storage_path}")
+            if self._settings.storage_type == "sqlite":
+                self._instances["detection_repository"] = SqliteDetectionRepository(self.get_sqlite_database())
+                self._logger.info("DetectionRepository creado con storage SQLite")
+            elif self._settings.storage_type == "json":
+                storage_path = self._settings.storage_path / "detections.json"
+                self._instances["detection_repository"] = JsonDetectionRepository(storage_path)
+                self._logger.info(f"DetectionRepository creado con storage: {storage_path}")
+            else:
+                raise ValueError(f"Tipo de almacenamiento no soportado: {self._settings.storage_type}")
         return self._instances["detection_repository"]
     
+    @lru_cache(maxsize=1)
+    def get_inference_executor(self) -> ThreadPoolExecutor:
+        """Obtiene el executor compartido para el trabajo bloqueante de detección."""
+        if "inference_executor" not in self._instances:
+            max_workers = self._settings.max_concurrent_detections
+            self._instances["inference_executor"] = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="inference"
+            )
+            self._logger.info(f"Executor de inferencia creado con {max_workers} hilos")
+        return self._instances["inference_executor"]
+    
     @lru_cache(maxsize=1)
     def get_damage_detection_service(self) -> DamageDetectionService:
         """Obtiene la instancia del servicio de detección de daños."""
@@ -53,11 +94,78 @@ class DependencyContainer:
             device = self._settings.model_device
             confidence_threshold = self._settings.confidence_threshold
             
+            batch_size = self._settings.inference_batch_size
+            frame_sampler_factory = partial(
+                create_frame_sampler,
+                mode=self._settings.frame_sampling_mode,
+                interval=self._settings.frame_extraction_interval,
+                scene_change_threshold=self._settings.adaptive_scene_change_threshold,
+                max_frame_gap=self._settings.adaptive_max_frame_gap,
+                dense_window=self._settings.adaptive_dense_window
+            )
+            tracker_factory = None
+            if self._settings.damage_tracking:
+                tracker_factory = partial(
+                    IoUDamageTracker,
+                    iou_threshold=self._settings.tracking_iou_threshold,
+                    max_centroid_distance=self._settings.tracking_max_centroid_distance,
+                    # El hueco debe cubrir al menos un par de frames inferidos con la máxima
+                    # separación del muestreador (en modo adaptativo, ADAPTIVE_MAX_FRAME_GAP)
+                    max_frame_gap=max(
+                        self._settings.tracking_max_frame_gap,
+                        2 * frame_sampler_factory().max_spacing
+                    )
+                )
+            
+            tiler = None
+            if self._settings.tiled_inference:
+                tiler = FrameTiler(
+                    tile_size=self._settings.tile_size,
+                    overlap=self._settings.tile_overlap,
+                    nms_iou_threshold=self._settings.tile_nms_iou_threshold
+                )
+            vehicle_locator = None
+            if self._settings.vehicle_roi_cropping:
+                vehicle_model_path = self._settings.vehicle_model_path
+                if vehicle_model_path and not vehicle_model_path.is_absolute():
+                    vehicle_model_path = self._settings.models_dir / vehicle_model_path
+                vehicle_locator = VehicleRoiLocator(
+                    model_path=vehicle_model_path,
+                    device=device,
+                    imgsz=self._settings.vehicle_roi_imgsz,
+                    margin=self._settings.vehicle_roi_margin
+                )
+            
             self._instances["damage_detection_service"] = YOLODamageDetector(
                 model_path=model_path,
-                device=device
+                device=device,
+                batch_size=batch_size,
+                max_batch_wait_ms=self._settings.inference_max_batch_wait_ms,
+                pipeline_queue_size=self._settings.pipeline_queue_size,
+                passthrough_buffer_frames=self._settings.passthrough_buffer_frames,
+                frame_sampler_factory=frame_sampler_factory,
+                executor=self.get_inference_executor(),
+                process_workers=self._settings.inference_process_workers,
+                torch_threads_per_worker=self._settings.torch_threads_per_worker,
+                scale_severity_with_resolution=self._settings.scale_severity_with_resolution,
+                runtime=self._settings.inference_runtime,
+                quantization=self._settings.inference_quantization,
+                calibration_videos_dir=self._settings.videos_dir,
+                calibration_frames=self._settings.quantization_calibration_frames,
+                imgsz=self._settings.inference_imgsz,
+                letterbox=self._settings.letterbox_preprocessing,
+                tiler=tiler,
+                vehicle_locator=vehicle_locator,
+                vehicle_roi_refresh_interval=self._settings.vehicle_roi_refresh_interval,
+                tracker_factory=tracker_factory,
+                keep_frame_damages=self._settings.keep_frame_damages,
+                sequential_damage_ids=self._settings.damage_id_mode == "sequential"
+            )
+            self._logger.info(
+                f"DamageDetectionService creado - Modelo: {model_path}, Device: {device}, "
+                f"Runtime: {self._settings.inference_runtime}, Lote: {batch_size}, "
+                f"Muestreo: {self._settings.frame_sampling_mode} cada {self._settings.frame_extraction_interval} frames"
             )
-            self._logger.info(f"DamageDetectionService creado - Modelo: {model_path}, Device: {device}")
         return self._instances["damage_detection_service"]
     
     @lru_cache(maxsize=1)
@@ -67,7 +175,10 @@ class DependencyContainer:
             output_dir = self._settings.output_dir
             supported_formats = self._settings.supported_formats
             
-            self._instances["video_processing_service"] = OpenCVVideoProcessor()
+            self._instances["video_processing_service"] = OpenCVVideoProcessor(
+                clip_padding_seconds=self._settings.annotated_clip_padding_seconds,
+                executor=self.get_inference_executor()
+            )
             self._logger.info(f"VideoProcessingService creado - Output: {output_dir}")
         return self._instances["video_processing_service"]
     
@@ -84,7 +195,9 @@ class DependencyContainer:
                 video_repository=video_repo,
                 detection_repository=detection_repo,
                 damage_detection_service=damage_service,
-                video_processing_service=video_service
+                video_processing_service=video_service,
+                fused_annotation=self._settings.fused_annotation,
+                annotated_output_mode=self._settings.annotated_output_mode
             )
             self._logger.info("ProcessVideoUseCase creado")
         return self._instances["process_video_use_case"]
@@ -112,19 +225,31 @@ class DependencyContainer:
             
             self._instances["video_processing_app_service"] = VideoProcessingAppService(
                 process_video_use_case=process_video_use_case,
-                get_detection_results_use_case=detection_results_use_case
+                get_detection_results_use_case=detection_results_use_case,
+                executor=self.get_inference_executor()
             )
             self._logger.info("VideoProcessingAppService creado")
         return self._instances["video_processing_app_service"]
     
     def clear_cache(self):
         """Limpia el cache de instancias."""
+        damage_service = self._instances.get("damage_detection_service")
+        if damage_service and hasattr(damage_service, "shutdown"):
+            damage_service.shutdown()
+        executor = self._instances.get("inference_executor")
+        if executor:
+            executor.shutdown(wait=False)
+        database = self._instances.get("sqlite_database")
+        if database:
+            database.close()
         self._instances.clear()
         # Limpiar cache de lru_cache
         self.get_video_repository.cache_clear()
         self.get_detection_repository.cache_clear()
+        self.get_sqlite_database.cache_clear()
         self.get_damage_detection_service.cache_clear()
         self.get_video_processing_service.cache_clear()
+        self.get_inference_executor.cache_clear()
         self.get_process_video_use_case.cache_clear()
         self.get_detection_results_use_case.cache_clear()
         self.get_video_processing_app_service.cache_clear()
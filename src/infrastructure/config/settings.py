@@ -34,13 +34,34 @@ class Settings(BaseSettings):
     config_dir: Path = Field(default_factory=lambda: Path("config"))
     
     # Configuración de almacenamiento
-    storage_type: str = Field(default="json", env="STORAGE_TYPE")
+    storage_type: str = Field(default="json", env="STORAGE_TYPE")  # json | sqlite
     storage_path: Path = Field(default_factory=lambda: Path("data"))
     
     # Configuración del modelo YOLO
     model_path: Optional[Path] = Field(default=None, env="MODEL_PATH")
     model_device: str = Field(default="cpu", env="MODEL_DEVICE")
+    inference_runtime: str = Field(default="pytorch", env="INFERENCE_RUNTIME")  # pytorch | onnx | openvino
+    inference_quantization: str = Field(default="none", env="INFERENCE_QUANTIZATION")  # none | dynamic | static
+    quantization_calibration_frames: int = Field(default=64, env="QUANTIZATION_CALIBRATION_FRAMES")
     confidence_threshold: float = Field(default=0.5, env="CONFIDENCE_THRESHOLD")
+    inference_imgsz: int = Field(default=640, env="INFERENCE_IMGSZ")  # múltiplo de 32
+    letterbox_preprocessing: bool = Field(default=True, env="LETTERBOX_PREPROCESSING")
+    tiled_inference: bool = Field(default=False, env="TILED_INFERENCE")
+    tile_size: int = Field(default=640, env="TILE_SIZE")
+    tile_overlap: float = Field(default=0.2, env="TILE_OVERLAP")
+    tile_nms_iou_threshold: float = Field(default=0.5, env="TILE_NMS_IOU_THRESHOLD")
+    vehicle_roi_cropping: bool = Field(default=False, env="VEHICLE_ROI_CROPPING")
+    vehicle_model_path: Optional[Path] = Field(default=None, env="VEHICLE_MODEL_PATH")  # modelo COCO
+    vehicle_roi_refresh_interval: int = Field(default=10, env="VEHICLE_ROI_REFRESH_INTERVAL")
+    vehicle_roi_margin: float = Field(default=0.1, env="VEHICLE_ROI_MARGIN")
+    vehicle_roi_imgsz: int = Field(default=320, env="VEHICLE_ROI_IMGSZ")
+    inference_batch_size: int = Field(default=8, env="INFERENCE_BATCH_SIZE")
+    inference_max_batch_wait_ms: int = Field(default=50, env="INFERENCE_MAX_BATCH_WAIT_MS")
+    pipeline_queue_size: int = Field(default=16, env="PIPELINE_QUEUE_SIZE")
+    passthrough_buffer_frames: int = Field(default=32, env="PASSTHROUGH_BUFFER_FRAMES")
+    inference_process_workers: int = Field(default=0, env="INFERENCE_PROCESS_WORKERS")  # 0 = hilos
+    torch_threads_per_worker: int = Field(default=1, env="TORCH_THREADS_PER_WORKER")
+    scale_severity_with_resolution: bool = Field(default=True, env="SCALE_SEVERITY_WITH_RESOLUTION")
     
     # Configuración de procesamiento de video
     max_video_size_mb: int = Field(default=500, env="MAX_VIDEO_SIZE_MB")
@@ -49,7 +70,20 @@ class Settings(BaseSettings):
         env="SUPPORTED_FORMATS"
     )
     frame_extraction_interval: int = Field(default=1, env="FRAME_EXTRACTION_INTERVAL")
+    frame_sampling_mode: str = Field(default="fixed", env="FRAME_SAMPLING_MODE")  # fixed | adaptive
+    adaptive_scene_change_threshold: float = Field(default=0.08, env="ADAPTIVE_SCENE_CHANGE_THRESHOLD")
+    adaptive_max_frame_gap: int = Field(default=30, env="ADAPTIVE_MAX_FRAME_GAP")
+    adaptive_dense_window: int = Field(default=15, env="ADAPTIVE_DENSE_WINDOW")
+    damage_tracking: bool = Field(default=True, env="DAMAGE_TRACKING")
+    tracking_iou_threshold: float = Field(default=0.3, env="TRACKING_IOU_THRESHOLD")
+    tracking_max_centroid_distance: float = Field(default=0.5, env="TRACKING_MAX_CENTROID_DISTANCE")
+    tracking_max_frame_gap: int = Field(default=15, env="TRACKING_MAX_FRAME_GAP")
+    keep_frame_damages: bool = Field(default=True, env="KEEP_FRAME_DAMAGES")  # False = un daño por track
+    damage_id_mode: str = Field(default="uuid", env="DAMAGE_ID_MODE")  # uuid | sequential
     create_annotated_videos: bool = Field(default=True, env="CREATE_ANNOTATED_VIDEOS")
+    fused_annotation: bool = Field(default=True, env="FUSED_ANNOTATION")  # anotar durante la detección
+    annotated_output_mode: str = Field(default="full", env="ANNOTATED_OUTPUT_MODE")  # full | clips | passthrough
+    annotated_clip_padding_seconds: float = Field(default=1.0, env="ANNOTATED_CLIP_PADDING_SECONDS")
     
     # Configuración de logging
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
@@ -108,10 +142,15 @@ class Settings(BaseSettings):
                          self.models_dir, self.config_dir, self.storage_path]:
             directory.mkdir(parents=True, exist_ok=True)
     
+    @property
+    def sqlite_path(self) -> Path:
+        """Archivo de la base de datos SQLite (storage_type = sqlite)."""
+        return self.storage_path / "app.db"
+    
     @property
     def database_url(self) -> str:
-        """URL de la base de datos (para futuras implementaciones)."""
-        return f"sqlite:///{self.storage_path}/app.db"
+        """URL de la base de datos."""
+        return f"sqlite:///{self.sqlite_path}"
     
     @property
     def log_file_path(self) -> Path:
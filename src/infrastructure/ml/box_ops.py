@@ -0,0 +1,92 @@
+from typing import Dict, Sequence
+
+import numpy as np
+
+from .detections import FrameDetections
+
+
+def box_iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """Matriz IoU (n, m) entre dos conjuntos de cajas xyxy."""
+    if boxes_a.size == 0 or boxes_b.size == 0:
+        return np.zeros((len(boxes_a), len(boxes_b)), dtype=np.float32)
+
+    top_left = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    bottom_right = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+
+    area_a = np.prod(boxes_a[:, 2:] - boxes_a[:, :2], axis=1)
+    area_b = np.prod(boxes_b[:, 2:] - boxes_b[:, :2], axis=1)
+    union = area_a[:, None] + area_b[None, :] - intersection
+    return intersection / np.maximum(union, 1e-9)
+
+
+def detection_recall(
+    reference: Sequence[FrameDetections],
+    candidate: Sequence[FrameDetections],
+    iou_threshold: float = 0.5
+) -> Dict[str, float]:
+    """Recall de las cajas de ``candidate`` respecto a ``reference`` en los mismos frames.
+
+    Cada caja de referencia se empareja como máximo con una caja candidata de la
+    misma clase (emparejamiento voraz por IoU descendente).
+    """
+    reference_boxes = 0
+    candidate_boxes = 0
+    matched = 0
+    matched_iou = 0.0
+
+    for ref, cand in zip(reference, candidate):
+        reference_boxes += ref.count
+        candidate_boxes += cand.count
+        if ref.count == 0 or cand.count == 0:
+            continue
+
+        iou = box_iou(ref.xyxy, cand.xyxy)
+        iou[ref.class_ids[:, None] != cand.class_ids[None, :]] = 0.0
+
+        used_ref = np.zeros(ref.count, dtype=bool)
+        used_cand = np.zeros(cand.count, dtype=bool)
+        for flat_index in np.argsort(iou, axis=None)[::-1]:
+            i, j = np.unravel_index(flat_index, iou.shape)
+            if iou[i, j] < iou_threshold:
+                break
+            if used_ref[i] or used_cand[j]:
+                continue
+            used_ref[i] = used_cand[j] = True
+            matched += 1
+            matched_iou += float(iou[i, j])
+
+    return {
+        "reference_boxes": reference_boxes,
+        "candidate_boxes": candidate_boxes,
+        "matched": matched,
+        "recall": matched / reference_boxes if reference_boxes else 1.0,
+        "mean_iou": matched_iou / matched if matched else 0.0
+    }
+
+
+def nms(xyxy: np.ndarray, scores: np.ndarray, iou_threshold: float = 0.5) -> np.ndarray:
+    """Supresión de no máximos voraz; devuelve los índices conservados por score descendente."""
+    order = np.argsort(scores)[::-1]
+    keep = []
+    while order.size > 0:
+        best = order[0]
+        keep.append(best)
+        if order.size == 1:
+            break
+        iou = box_iou(xyxy[best:best + 1], xyxy[order[1:]])[0]
+        order = order[1:][iou < iou_threshold]
+    return np.array(keep, dtype=np.int64)
+
+
+def batched_nms(
+    xyxy: np.ndarray,
+    scores: np.ndarray,
+    class_ids: np.ndarray,
+    iou_threshold: float = 0.5
+) -> np.ndarray:
+    """NMS por clase: desplaza las cajas de cada clase para que no se solapen entre sí."""
+    if xyxy.size == 0:
+        return np.empty((0,), dtype=np.int64)
+    offsets = class_ids.astype(xyxy.dtype)[:, None] * (float(xyxy.max()) + 1.0)
+    return nms(xyxy + offsets, scores, iou_threshold)
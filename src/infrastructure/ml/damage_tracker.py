@@ -0,0 +1,173 @@
+import uuid
+from typing import List, Optional
+
+import numpy as np
+
+from ...domain.entities.damage import Damage, DamageSeverity
+from ...domain.entities.damage_track import DamageTrack
+from .box_ops import box_iou
+
+
+# Orden creciente de severidad para conservar la máxima de cada track
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(DamageSeverity)}
+
+
+class _ActiveTrack:
+    """Estado mutable de un track mientras sigue recibiendo detecciones."""
+
+    __slots__ = (
+        "id", "damage_type", "severity", "box", "first_frame", "last_frame",
+        "first_timestamp", "last_timestamp", "peak_damage", "detection_count"
+    )
+
+    def __init__(self, track_id: str, damage: Damage, box: np.ndarray):
+        self.id = track_id
+        self.damage_type = damage.damage_type
+        self.severity = damage.severity
+        self.box = box
+        self.first_frame = self.last_frame = damage.frame_number
+        self.first_timestamp = self.last_timestamp = damage.timestamp
+        self.peak_damage = damage
+        self.detection_count = 1
+
+    def add(self, damage: Damage, box: np.ndarray) -> None:
+        """Incorpora una nueva detección del mismo daño."""
+        self.box = box
+        self.last_frame = damage.frame_number
+        self.last_timestamp = damage.timestamp
+        self.detection_count += 1
+        if damage.confidence > self.peak_damage.confidence:
+            self.peak_damage = damage
+        if _SEVERITY_RANK[damage.severity] > _SEVERITY_RANK[self.severity]:
+            self.severity = damage.severity
+
+    def to_track(self) -> DamageTrack:
+        """Congela el estado en una entidad DamageTrack."""
+        return DamageTrack(
+            id=self.id,
+            damage_type=self.damage_type,
+            severity=self.severity,
+            peak_confidence=self.peak_damage.confidence,
+            representative_box=self.peak_damage.bounding_box,
+            first_frame=self.first_frame,
+            last_frame=self.last_frame,
+            first_timestamp=self.first_timestamp,
+            last_timestamp=self.last_timestamp,
+            peak_frame=self.peak_damage.frame_number,
+            peak_timestamp=self.peak_damage.timestamp,
+            detection_count=self.detection_count
+        )
+
+
+class IoUDamageTracker:
+    """Enlaza las detecciones de frames sucesivos en tracks de daño.
+
+    Una detección continúa el track activo del mismo tipo con el que más se
+    solapa (IoU >= ``iou_threshold``); si ninguno se solapa lo suficiente, se
+    acepta el track cuyo centroide esté a menos de ``max_centroid_distance``
+    veces la diagonal de su última caja. Los tracks sin detecciones durante más
+    de ``max_frame_gap`` frames se cierran. Se crea uno por video y espera los
+    frames en orden.
+    """
+
+    def __init__(
+        self,
+        iou_threshold: float = 0.3,
+        max_centroid_distance: float = 0.5,
+        max_frame_gap: int = 15
+    ):
+        if not 0.0 < iou_threshold <= 1.0:
+            raise ValueError("El umbral IoU del tracker debe estar entre 0.0 y 1.0")
+        if max_frame_gap < 1:
+            raise ValueError("La separación máxima entre detecciones de un track debe ser al menos 1")
+
+        self._iou_threshold = iou_threshold
+        self._max_centroid_distance = max_centroid_distance
+        self._max_frame_gap = max_frame_gap
+        self._active: List[_ActiveTrack] = []
+        self._finished: List[_ActiveTrack] = []
+
+    def update(self, frame_number: int, damages: List[Damage]) -> List[str]:
+        """Asigna las detecciones de un frame a tracks; devuelve el id de track de cada una."""
+        self._expire(frame_number)
+        if not damages:
+            return []
+
+        boxes = np.array([
+            [d.bounding_box.x1, d.bounding_box.y1, d.bounding_box.x2, d.bounding_box.y2]
+            for d in damages
+        ], dtype=np.float32)
+        assignment: List[Optional[_ActiveTrack]] = [None] * len(damages)
+
+        if self._active:
+            track_boxes = np.stack([track.box for track in self._active])
+            same_type = np.array([
+                [damage.damage_type == track.damage_type for track in self._active]
+                for damage in damages
+            ])
+
+            iou = np.where(same_type, box_iou(boxes, track_boxes), 0.0)
+            self._assign_greedy(assignment, iou, iou >= self._iou_threshold, descending=True)
+
+            # Segunda pasada por distancia de centroides para las detecciones sin solape
+            distance = self._centroid_distance(boxes, track_boxes)
+            self._assign_greedy(
+                assignment, distance, same_type & (distance <= self._max_centroid_distance), descending=False
+            )
+
+        track_ids = []
+        for damage, box, track in zip(damages, boxes, assignment):
+            if track is None:
+                track = _ActiveTrack(str(uuid.uuid4()), damage, box)
+                self._active.append(track)
+            else:
+                track.add(damage, box)
+            track_ids.append(track.id)
+        return track_ids
+
+    def finalize(self) -> List[DamageTrack]:
+        """Cierra todos los tracks y los devuelve ordenados por su primera aparición."""
+        self._finished.extend(self._active)
+        self._active = []
+        return [track.to_track() for track in sorted(self._finished, key=lambda t: t.first_frame)]
+
+    def _assign_greedy(
+        self,
+        assignment: List[Optional[_ActiveTrack]],
+        scores: np.ndarray,
+        valid: np.ndarray,
+        descending: bool
+    ) -> None:
+        """Emparejamiento voraz detección-track sobre los pares válidos aún libres."""
+        taken = {id(track) for track in assignment if track is not None}
+        candidates = np.argwhere(valid)
+        if candidates.size == 0:
+            return
+
+        order = np.argsort(scores[valid])
+        if descending:
+            order = order[::-1]
+        for detection_index, track_index in candidates[order]:
+            track = self._active[track_index]
+            if assignment[detection_index] is None and id(track) not in taken:
+                assignment[detection_index] = track
+                taken.add(id(track))
+
+    @staticmethod
+    def _centroid_distance(boxes: np.ndarray, track_boxes: np.ndarray) -> np.ndarray:
+        """Distancia entre centroides normalizada por la diagonal de la caja del track."""
+        centers = (boxes[:, :2] + boxes[:, 2:]) / 2
+        track_centers = (track_boxes[:, :2] + track_boxes[:, 2:]) / 2
+        diagonals = np.linalg.norm(track_boxes[:, 2:] - track_boxes[:, :2], axis=1)
+        distance = np.linalg.norm(centers[:, None, :] - track_centers[None, :, :], axis=2)
+        return distance / np.maximum(diagonals[None, :], 1e-6)
+
+    def _expire(self, frame_number: int) -> None:
+        """Cierra los tracks que llevan demasiados frames sin detecciones."""
+        still_active = []
+        for track in self._active:
+            if frame_number - track.last_frame > self._max_frame_gap:
+                self._finished.append(track)
+            else:
+                still_active.append(track)
+        self._active = still_active
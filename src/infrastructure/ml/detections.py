@@ -0,0 +1,69 @@
+from typing import Any, List, NamedTuple, Sequence
+
+import numpy as np
+
+
+class FrameDetections(NamedTuple):
+    """Detecciones crudas de un frame como arrays: cajas xyxy, confianzas y clases."""
+    xyxy: np.ndarray         # (n, 4) float32
+    confidences: np.ndarray  # (n,) float32
+    class_ids: np.ndarray    # (n,) int64
+
+    @classmethod
+    def empty(cls) -> "FrameDetections":
+        """Detecciones vacías para un frame sin resultados."""
+        return cls(
+            np.empty((0, 4), dtype=np.float32),
+            np.empty((0,), dtype=np.float32),
+            np.empty((0,), dtype=np.int64)
+        )
+
+    @classmethod
+    def from_results(cls, results: Sequence[Any]) -> List["FrameDetections"]:
+        """Extrae las detecciones de un lote de resultados con una sola copia a CPU.
+
+        Las cajas de todos los frames se concatenan en el dispositivo y se transfieren
+        juntas, en lugar de sincronizar y copiar caja a caja.
+        """
+        counts = [
+            len(result.boxes) if getattr(result, "boxes", None) is not None else 0
+            for result in results
+        ]
+        if sum(counts) == 0:
+            return [cls.empty() for _ in results]
+
+        import torch
+
+        # Columnas de boxes.data: x1, y1, x2, y2, [track_id,] conf, cls
+        data = torch.cat([
+            result.boxes.data for result, count in zip(results, counts) if count > 0
+        ]).cpu().numpy()
+
+        detections = []
+        offset = 0
+        for count in counts:
+            rows = data[offset:offset + count]
+            offset += count
+            detections.append(cls(
+                rows[:, :4].astype(np.float32, copy=False),
+                rows[:, -2].astype(np.float32, copy=False),
+                rows[:, -1].astype(np.int64)
+            ))
+        return detections
+
+    def without_degenerate_boxes(self) -> "FrameDetections":
+        """Descarta las cajas sin ancho o alto (p. ej. reducidas a una línea al recortarlas al borde)."""
+        keep = (self.xyxy[:, 2] > self.xyxy[:, 0]) & (self.xyxy[:, 3] > self.xyxy[:, 1])
+        if keep.all():
+            return self
+        return FrameDetections(self.xyxy[keep], self.confidences[keep], self.class_ids[keep])
+
+    @property
+    def areas(self) -> np.ndarray:
+        """Área en píxeles de cada caja."""
+        return (self.xyxy[:, 2] - self.xyxy[:, 0]) * (self.xyxy[:, 3] - self.xyxy[:, 1])
+
+    @property
+    def count(self) -> int:
+        """Número de detecciones del frame."""
+        return int(self.confidences.shape[0])
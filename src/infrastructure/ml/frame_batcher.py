@@ -0,0 +1,85 @@
+import time
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+
+class BatchedFrame(NamedTuple):
+    """Frame decodificado pendiente de inferencia junto con su posición en el video."""
+    frame_number: int
+    timestamp: float
+    frame: Optional[np.ndarray]  # None en los marcadores de frames de paso (la imagen va por otro buffer)
+    infer: bool = True  # False = frame de paso (solo se reenvía en orden, p. ej. para el video anotado)
+
+
+class FrameBatcher:
+    """Agrupa frames decodificados en lotes para una única pasada del modelo.
+
+    Un lote se libera cuando alcanza ``batch_size`` frames a inferir o cuando el
+    frame más antiguo lleva esperando más de ``max_wait_seconds``. Los frames de
+    paso viajan en el lote (como marcadores sin imagen) para conservar el orden,
+    pero no cuentan para su tamaño.
+    """
+
+    def __init__(self, batch_size: int, max_wait_seconds: float):
+        if batch_size < 1:
+            raise ValueError("El tamaño de lote debe ser al menos 1")
+        if max_wait_seconds < 0:
+            raise ValueError("La espera máxima del lote no puede ser negativa")
+
+        self._batch_size = batch_size
+        self._max_wait_seconds = max_wait_seconds
+        self._pending: List[BatchedFrame] = []
+        self._inferable = 0
+        self._first_frame_at: Optional[float] = None
+
+    @property
+    def batch_size(self) -> int:
+        """Tamaño máximo de lote."""
+        return self._batch_size
+
+    @property
+    def pending(self) -> int:
+        """Número de frames acumulados a la espera de inferencia."""
+        return len(self._pending)
+
+    def add(
+        self,
+        frame_number: int,
+        timestamp: float,
+        frame: Optional[np.ndarray],
+        infer: bool = True
+    ) -> Optional[List[BatchedFrame]]:
+        """Añade un frame y devuelve el lote si está listo para inferencia."""
+        if not self._pending:
+            self._first_frame_at = time.monotonic()
+        self._pending.append(BatchedFrame(frame_number, timestamp, frame, infer))
+        if infer:
+            self._inferable += 1
+
+        if self.is_ready():
+            return self.flush()
+        return None
+
+    def is_ready(self) -> bool:
+        """Indica si el lote está lleno o ha superado la espera máxima."""
+        if not self._pending:
+            return False
+        if self._inferable >= self._batch_size:
+            return True
+        return self.time_until_deadline() <= 0
+
+    def time_until_deadline(self) -> Optional[float]:
+        """Segundos restantes hasta que el lote pendiente deba liberarse."""
+        if self._first_frame_at is None:
+            return None
+        elapsed = time.monotonic() - self._first_frame_at
+        return self._max_wait_seconds - elapsed
+
+    def flush(self) -> List[BatchedFrame]:
+        """Devuelve los frames pendientes y reinicia el lote."""
+        batch = self._pending
+        self._pending = []
+        self._inferable = 0
+        self._first_frame_at = None
+        return batch
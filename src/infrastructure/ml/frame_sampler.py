@@ -0,0 +1,195 @@
+import threading
+from typing import Iterator, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class FrameSampler:
+    """Muestreo de paso fijo: se infiere un frame de cada ``interval``."""
+
+    def __init__(self, interval: int = 1):
+        if interval < 1:
+            raise ValueError("El intervalo de extracción de frames debe ser al menos 1")
+        self._interval = interval
+
+    @property
+    def interval(self) -> int:
+        """Paso entre frames candidatos a inferencia."""
+        return self._interval
+
+    @property
+    def max_spacing(self) -> int:
+        """Máxima separación en frames entre dos frames inferidos consecutivos."""
+        return self._interval
+
+    def is_candidate(self, frame_number: int) -> bool:
+        """Indica si el frame cae en el paso fijo (permite saltarlo sin decodificarlo)."""
+        return frame_number % self._interval == 0
+
+    def should_infer(self, frame_number: int, frame: np.ndarray) -> bool:
+        """Decide si un frame candidato se envía al modelo."""
+        return self.is_candidate(frame_number)
+
+    def notify_damage(self, frame_number: int) -> None:
+        """Informa de que se detectaron daños en un frame (sin efecto en el paso fijo)."""
+        pass
+
+    def should_resample(self, frame_number: int) -> bool:
+        """Indica si un frame candidato ya descartado debe inferirse tras un aviso de daños."""
+        return False
+
+
+class AdaptiveFrameSampler(FrameSampler):
+    """Muestreo adaptativo según el cambio de escena y las detecciones recientes.
+
+    Sobre los frames candidatos del paso fijo:
+    - se salta el frame si su diferencia con el último frame inferido (miniatura en
+      escala de grises) no alcanza ``scene_change_threshold``;
+    - nunca pasan más de ``max_frame_gap`` frames sin inferir;
+    - tras un frame con daños se infieren todos los candidatos de los siguientes
+      ``dense_window`` frames.
+
+    Los daños se conocen cuando el decodificador ya va por delante; los candidatos
+    de la ventana que ya se descartaron se recuperan con ``should_resample``.
+    """
+
+    def __init__(
+        self,
+        interval: int = 1,
+        scene_change_threshold: float = 0.08,
+        max_frame_gap: int = 30,
+        dense_window: int = 15,
+        thumbnail_size: int = 32
+    ):
+        super().__init__(interval)
+        if not 0.0 <= scene_change_threshold <= 1.0:
+            raise ValueError("El umbral de cambio de escena debe estar entre 0.0 y 1.0")
+        if max_frame_gap < 1:
+            raise ValueError("La separación máxima entre frames inferidos debe ser al menos 1")
+
+        self._scene_change_threshold = scene_change_threshold
+        self._max_frame_gap = max_frame_gap
+        self._dense_window = dense_window
+        self._thumbnail_size = thumbnail_size
+        self._last_thumbnail: Optional[np.ndarray] = None
+        self._last_inferred_frame: Optional[int] = None
+        # Ventanas densas (frame con daños, último frame de la ventana], ordenadas y sin solapes
+        self._dense_windows: List[Tuple[int, int]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def max_spacing(self) -> int:
+        """Máxima separación entre frames inferidos: ``max_frame_gap`` redondeado al paso fijo."""
+        return -(-self._max_frame_gap // self._interval) * self._interval
+
+    def should_infer(self, frame_number: int, frame: np.ndarray) -> bool:
+        """Decide si un frame candidato se envía al modelo."""
+        if not self.is_candidate(frame_number):
+            return False
+
+        thumbnail = self._thumbnail(frame)
+
+        with self._lock:
+            dense = self._in_dense_window(frame_number)
+
+        if (
+            dense
+            or self._last_thumbnail is None
+            or frame_number - self._last_inferred_frame >= self._max_frame_gap
+            or self.scene_change_score(thumbnail, self._last_thumbnail) >= self._scene_change_threshold
+        ):
+            self._last_thumbnail = thumbnail
+            self._last_inferred_frame = frame_number
+            return True
+
+        return False
+
+    def notify_damage(self, frame_number: int) -> None:
+        """Densifica el muestreo en la ventana posterior a un frame con daños."""
+        start, end = frame_number, frame_number + self._dense_window
+        with self._lock:
+            merged = []
+            for window_start, window_end in self._dense_windows:
+                if window_end < start or window_start > end:
+                    merged.append((window_start, window_end))
+                else:
+                    start, end = min(start, window_start), max(end, window_end)
+            merged.append((start, end))
+            self._dense_windows = sorted(merged)
+
+    def should_resample(self, frame_number: int) -> bool:
+        """Indica si un candidato descartado cae en la ventana densa de un frame con daños."""
+        if not self.is_candidate(frame_number):
+            return False
+        with self._lock:
+            # El pipeline consulta en orden de frame: las ventanas ya superadas no vuelven a servir
+            while self._dense_windows and self._dense_windows[0][1] < frame_number:
+                self._dense_windows.pop(0)
+            return self._in_dense_window(frame_number)
+
+    def _in_dense_window(self, frame_number: int) -> bool:
+        """Indica si el frame cae en alguna ventana densa (llamar con el lock tomado)."""
+        return any(start < frame_number <= end for start, end in self._dense_windows)
+
+    @staticmethod
+    def scene_change_score(current: np.ndarray, previous: np.ndarray) -> float:
+        """Diferencia media absoluta normalizada (0-1) entre dos miniaturas."""
+        return float(np.mean(cv2.absdiff(current, previous))) / 255.0
+
+    def _thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        """Miniatura en escala de grises usada para medir el cambio de escena."""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        size = (self._thumbnail_size, self._thumbnail_size)
+        return cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+
+
+def sample_frames(
+    cap: cv2.VideoCapture,
+    fps: float,
+    sampler: FrameSampler,
+    passthrough: bool = False
+) -> Iterator[Tuple[int, float, np.ndarray, bool]]:
+    """Decodifica el video y produce (número de frame, timestamp, frame, inferir).
+
+    Los candidatos del paso fijo se producen siempre, con inferir=False si el
+    muestreador los descarta (así pueden recuperarse si un daño cercano densifica
+    el muestreo). Con ``passthrough`` se producen además los demás frames; sin él,
+    estos solo se avanzan sin recuperar la imagen.
+    """
+    frame_number = 0
+    while True:
+        if not passthrough and not sampler.is_candidate(frame_number):
+            if not cap.grab():
+                break
+            frame_number += 1
+            continue
+
+        ret, frame = cap.read()
+        if not ret:
+            break
+
+        infer = sampler.is_candidate(frame_number) and sampler.should_infer(frame_number, frame)
+        timestamp = frame_number / fps if fps > 0 else 0
+        yield frame_number, timestamp, frame, infer
+        frame_number += 1
+
+
+def create_frame_sampler(
+    mode: str = "fixed",
+    interval: int = 1,
+    scene_change_threshold: float = 0.08,
+    max_frame_gap: int = 30,
+    dense_window: int = 15
+) -> FrameSampler:
+    """Crea el muestreador de frames para el modo configurado ("fixed" o "adaptive")."""
+    if mode == "fixed":
+        return FrameSampler(interval)
+    if mode == "adaptive":
+        return AdaptiveFrameSampler(
+            interval=interval,
+            scene_change_threshold=scene_change_threshold,
+            max_frame_gap=max_frame_gap,
+            dense_window=dense_window
+        )
+    raise ValueError(f"Modo de muestreo de frames no soportado: {mode}")
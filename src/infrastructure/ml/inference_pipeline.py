@@ -0,0 +1,207 @@
+import logging
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .frame_batcher import BatchedFrame, FrameBatcher
+from .frame_sampler import FrameSampler
+from .passthrough_buffer import PassthroughFrameBuffer
+
+
+# Marcador de fin de flujo entre etapas
+_END_OF_STREAM = object()
+
+
+class _StageError:
+    """Envuelve una excepción producida en una etapa para relanzarla en el consumidor."""
+
+    def __init__(self, stage: str, error: BaseException):
+        self.stage = stage
+        self.error = error
+
+
+class InferencePipeline:
+    """Pipeline productor/consumidor de tres etapas para la inferencia de video.
+
+    - Decodificación: un hilo recorre la fuente de frames.
+    - Inferencia: un hilo agrupa frames en lotes y ejecuta el modelo.
+    - Postprocesado: el hilo que itera sobre ``run`` construye y agrega los resultados.
+
+    Las etapas se comunican mediante colas acotadas, de modo que una etapa lenta
+    frena a la anterior (backpressure) y el número de frames en memoria queda acotado.
+
+    La fuente produce tuplas (número de frame, timestamp, frame[, inferir]); los
+    frames marcados para no inferir se entregan en orden con resultado None. Sus
+    imágenes no pasan por las colas: esperan en un ``PassthroughFrameBuffer`` de
+    ``passthrough_buffer_size`` frames y por el pipeline viaja solo un marcador.
+    Con ``forward_skipped=False`` esos frames no se entregan al consumidor.
+
+    Con un ``sampler``, la etapa de inferencia le avisa de cada frame con
+    detecciones (``has_detections``) nada más inferirlo, y los frames descartados
+    que caen en la ventana densa resultante se recuperan del buffer y se infieren:
+    tanto los del mismo lote como los que siguen en la cola.
+    """
+
+    # Intervalo con el que las etapas bloqueadas comprueban si deben detenerse
+    _POLL_SECONDS = 0.1
+
+    def __init__(
+        self,
+        infer_batch: Callable[[List[BatchedFrame]], List[Any]],
+        batch_size: int,
+        max_batch_wait_seconds: float,
+        queue_size: int = 16,
+        passthrough_buffer_size: int = 32,
+        sampler: Optional[FrameSampler] = None,
+        has_detections: Callable[[Any], bool] = bool,
+        forward_skipped: bool = True
+    ):
+        if queue_size < 1:
+            raise ValueError("El tamaño de cola debe ser al menos 1")
+
+        self._infer_batch = infer_batch
+        self._batch_size = batch_size
+        self._max_batch_wait_seconds = max_batch_wait_seconds
+        self._frame_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._result_queue: queue.Queue = queue.Queue(maxsize=max(2, queue_size // batch_size))
+        self._passthrough = PassthroughFrameBuffer(passthrough_buffer_size)
+        self._sampler = sampler
+        self._has_detections = has_detections
+        self._forward_skipped = forward_skipped
+        self._stop = threading.Event()
+        self._logger = logging.getLogger(__name__)
+
+    def run(self, frames: Iterable[Tuple]) -> Iterator[Tuple[BatchedFrame, Any]]:
+        """Ejecuta el pipeline y produce pares (frame, resultado del modelo) en orden."""
+        decoder = threading.Thread(
+            target=self._decode_stage, args=(frames,), name="pipeline-decoder", daemon=True
+        )
+        inference = threading.Thread(
+            target=self._inference_stage, name="pipeline-inference", daemon=True
+        )
+        decoder.start()
+        inference.start()
+
+        try:
+            while True:
+                item = self._result_queue.get()
+                if item is _END_OF_STREAM:
+                    break
+                if isinstance(item, _StageError):
+                    raise RuntimeError(f"Error en la etapa de {item.stage}: {item.error}") from item.error
+
+                batch, results = item
+                for batched_frame, result in zip(batch, results):
+                    if not batched_frame.infer:
+                        # Recuperar la imagen del frame de paso y liberar su hueco
+                        frame = self._passthrough.take(batched_frame.frame_number)
+                        if not self._forward_skipped:
+                            continue
+                        batched_frame = batched_frame._replace(frame=frame)
+                    yield batched_frame, result
+        finally:
+            # Detener las etapas si el consumidor termina antes de tiempo
+            self._stop.set()
+            self._drain(self._result_queue)
+            self._drain(self._frame_queue)
+            self._passthrough.clear()
+            decoder.join()
+            inference.join()
+
+    def _decode_stage(self, frames: Iterable[Tuple]) -> None:
+        """Etapa 1: lee frames de la fuente y los encola."""
+        try:
+            for frame in frames:
+                item = BatchedFrame(*frame)
+                if not item.infer:
+                    # La imagen espera en el buffer de paso; por las colas viaja solo el marcador
+                    if not self._passthrough.put(item.frame_number, item.frame, self._stop):
+                        return
+                    item = item._replace(frame=None)
+                if not self._put(self._frame_queue, item):
+                    return
+            self._put(self._frame_queue, _END_OF_STREAM)
+        except Exception as e:
+            self._logger.error(f"Error en la etapa de decodificación: {e}")
+            self._put(self._frame_queue, _StageError("decodificación", e))
+
+    def _inference_stage(self) -> None:
+        """Etapa 2: agrupa frames en lotes y ejecuta el modelo sobre cada lote."""
+        batcher = FrameBatcher(self._batch_size, self._max_batch_wait_seconds)
+
+        try:
+            while not self._stop.is_set():
+                deadline = batcher.time_until_deadline()
+                timeout = self._POLL_SECONDS if deadline is None else max(deadline, 0.0)
+                try:
+                    item = self._frame_queue.get(timeout=timeout)
+                except queue.Empty:
+                    # Se agotó la espera máxima del lote: inferir lo acumulado
+                    if batcher.is_ready() and not self._emit(batcher.flush()):
+                        return
+                    continue
+
+                if item is _END_OF_STREAM or isinstance(item, _StageError):
+                    if batcher.pending and not self._emit(batcher.flush()):
+                        return
+                    self._put(self._result_queue, item)
+                    return
+
+                if not item.infer:
+                    item = self._resample(item)
+                batch = batcher.add(item.frame_number, item.timestamp, item.frame, item.infer)
+                if batch is None and self._passthrough.is_full():
+                    # El decodificador está esperando hueco: liberar el lote sin agotar la espera
+                    batch = batcher.flush()
+                if batch and not self._emit(batch):
+                    return
+        except Exception as e:
+            self._logger.error(f"Error en la etapa de inferencia: {e}")
+            self._put(self._result_queue, _StageError("inferencia", e))
+
+    def _emit(self, batch: List[BatchedFrame]) -> bool:
+        """Infiere un lote y lo envía a la etapa de postprocesado."""
+        if not batch:
+            return True
+        results: List[Any] = [None] * len(batch)
+        pending = [index for index, item in enumerate(batch) if item.infer]
+        while pending:
+            inferred = self._infer_batch([batch[index] for index in pending])
+            for index, result in zip(pending, inferred):
+                results[index] = result
+                if self._sampler is not None and self._has_detections(result):
+                    self._sampler.notify_damage(batch[index].frame_number)
+
+            # Los daños recién detectados pueden densificar frames descartados del mismo lote
+            pending = []
+            for index, item in enumerate(batch):
+                if not item.infer:
+                    batch[index] = self._resample(item)
+                    if batch[index].infer:
+                        pending.append(index)
+        return self._put(self._result_queue, (batch, results))
+
+    def _resample(self, item: BatchedFrame) -> BatchedFrame:
+        """Convierte un frame descartado en frame a inferir si el muestreador lo pide."""
+        if self._sampler is None or not self._sampler.should_resample(item.frame_number):
+            return item
+        return item._replace(frame=self._passthrough.take(item.frame_number), infer=True)
+
+    def _put(self, target: queue.Queue, item: Any) -> bool:
+        """Encola respetando la capacidad de la cola; devuelve False si el pipeline se detuvo."""
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=self._POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @staticmethod
+    def _drain(source: queue.Queue) -> None:
+        """Vacía una cola para desbloquear a los productores pendientes."""
+        while True:
+            try:
+                source.get_nowait()
+            except queue.Empty:
+                return
@@ -0,0 +1,176 @@
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+# Color de relleno usado por el preprocesado de YOLO
+PAD_VALUE = 114
+
+# Resoluciones de entrada cuya geometría se cachea (los recortes de ROI varían por frame)
+MAX_CACHED_SHAPES = 64
+
+
+class LetterboxTransform(NamedTuple):
+    """Geometría del letterbox de una resolución de entrada a la entrada del modelo.
+
+    Sin ``stride`` la salida es el cuadrado ``imgsz`` x ``imgsz`` (modelos de forma
+    fija, p. ej. ONNX/OpenVINO). Con ``stride`` se rellena solo hasta el múltiplo
+    de ``stride`` más cercano, como el ``LetterBox(auto=True)`` de ultralytics para
+    modelos PyTorch: un video 16:9 entra como 640x384 en lugar de 640x640.
+    """
+    gain: float
+    new_width: int
+    new_height: int
+    left: int
+    top: int
+    source_width: int
+    source_height: int
+    out_width: int
+    out_height: int
+
+    @classmethod
+    def for_shape(
+        cls,
+        frame_shape: Tuple[int, ...],
+        imgsz: int,
+        stride: Optional[int] = None
+    ) -> "LetterboxTransform":
+        """Calcula escala y márgenes para frames de la forma dada."""
+        height, width = frame_shape[:2]
+        gain = min(imgsz / height, imgsz / width)
+        new_width, new_height = int(round(width * gain)), int(round(height * gain))
+        if stride:
+            out_width = new_width + (imgsz - new_width) % stride
+            out_height = new_height + (imgsz - new_height) % stride
+        else:
+            out_width = out_height = imgsz
+        return cls(
+            gain=gain,
+            new_width=new_width,
+            new_height=new_height,
+            left=(out_width - new_width) // 2,
+            top=(out_height - new_height) // 2,
+            source_width=width,
+            source_height=height,
+            out_width=out_width,
+            out_height=out_height
+        )
+
+    @property
+    def out_shape(self) -> Tuple[int, int, int]:
+        """Forma (alto, ancho, canales) del buffer de entrada del modelo."""
+        return self.out_height, self.out_width, 3
+
+    def apply(self, frame: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Escribe el frame redimensionado en ``out`` (de forma ``out_shape``) sin reservar memoria.
+
+        Solo se escribe la región de la imagen; el relleno de ``out`` debe estar ya
+        inicializado con PAD_VALUE.
+        """
+        region = out[self.top:self.top + self.new_height, self.left:self.left + self.new_width]
+        if self.gain == 1.0:
+            np.copyto(region, frame)
+        else:
+            cv2.resize(frame, (self.new_width, self.new_height), dst=region, interpolation=cv2.INTER_LINEAR)
+        return out
+
+    def to_original(self, xyxy: np.ndarray) -> np.ndarray:
+        """Convierte cajas xyxy del espacio letterbox a coordenadas del frame original."""
+        boxes = (xyxy - np.array([self.left, self.top, self.left, self.top], dtype=xyxy.dtype)) / self.gain
+        boxes[:, [0, 2]] = boxes[:, [0, 2]].clip(0, self.source_width)
+        boxes[:, [1, 3]] = boxes[:, [1, 3]].clip(0, self.source_height)
+        return boxes.astype(xyxy.dtype, copy=False)
+
+
+def letterbox(frame: np.ndarray, imgsz: int) -> np.ndarray:
+    """Letterbox de un único frame a ``imgsz`` x ``imgsz`` (reserva un buffer nuevo)."""
+    out = np.full((imgsz, imgsz, 3), PAD_VALUE, dtype=np.uint8)
+    return LetterboxTransform.for_shape(frame.shape, imgsz).apply(frame, out)
+
+
+def batch_transforms(
+    frame_shapes: List[Tuple[int, ...]],
+    imgsz: int,
+    stride: Optional[int] = None,
+    transform_for: Optional[Callable[[Tuple[int, ...], Optional[int]], LetterboxTransform]] = None
+) -> List[LetterboxTransform]:
+    """Geometrías de un lote con una forma de salida común.
+
+    El rectángulo mínimo solo se usa si todos los frames del lote lo comparten
+    (ultralytics apila el lote en un único tensor); si no, el lote va al cuadrado.
+    """
+    if transform_for is None:
+        def transform_for(shape: Tuple[int, ...], shape_stride: Optional[int]) -> LetterboxTransform:
+            return LetterboxTransform.for_shape(shape, imgsz, shape_stride)
+
+    transforms = [transform_for(shape, stride) for shape in frame_shapes]
+    if stride and len({transform.out_shape for transform in transforms}) > 1:
+        transforms = [transform_for(shape, None) for shape in frame_shapes]
+    return transforms
+
+
+class LetterboxPreprocessor:
+    """Preprocesado letterbox con buffers preasignados y reutilizados entre lotes.
+
+    La geometría se calcula una vez por resolución de entrada (fija durante un
+    video) y cada posición del lote reutiliza su buffer; el relleno solo se
+    repinta cuando cambia la geometría que ocupó ese buffer. Con ``stride`` los
+    buffers son el rectángulo mínimo alineado a ``stride`` (modelos PyTorch); sin
+    él, el cuadrado ``imgsz`` x ``imgsz`` que esperan los modelos de forma fija.
+    No es seguro entre hilos: el detector lo usa bajo el lock del modelo.
+    """
+
+    def __init__(self, imgsz: int = 640, stride: Optional[int] = None):
+        if imgsz < 32 or imgsz % 32 != 0:
+            raise ValueError("El tamaño de entrada de inferencia debe ser múltiplo de 32")
+        if stride is not None and (stride < 1 or imgsz % stride != 0):
+            raise ValueError("El tamaño de entrada de inferencia debe ser múltiplo del stride del modelo")
+        self._imgsz = imgsz
+        self._stride = stride
+        self._transforms: Dict[Tuple[int, int, Optional[int]], LetterboxTransform] = {}
+        self._buffers: List[np.ndarray] = []
+        self._buffer_transforms: List[Optional[LetterboxTransform]] = []
+
+    @property
+    def imgsz(self) -> int:
+        """Lado mayor de la entrada del modelo."""
+        return self._imgsz
+
+    @property
+    def stride(self) -> Optional[int]:
+        """Alineación del rectángulo de entrada (None = cuadrado fijo)."""
+        return self._stride
+
+    def transform_for(self, frame_shape: Tuple[int, ...], stride: Optional[int] = None) -> LetterboxTransform:
+        """Geometría (cacheada) para una resolución de entrada."""
+        key = (frame_shape[0], frame_shape[1], stride)
+        transform = self._transforms.get(key)
+        if transform is None:
+            if len(self._transforms) >= MAX_CACHED_SHAPES:
+                self._transforms.clear()
+            transform = LetterboxTransform.for_shape(frame_shape, self._imgsz, stride)
+            self._transforms[key] = transform
+        return transform
+
+    def preprocess(self, frames: List[np.ndarray]) -> Tuple[List[np.ndarray], List[LetterboxTransform]]:
+        """Aplica el letterbox a un lote; los buffers devueltos se reutilizan en la siguiente llamada."""
+        transforms = batch_transforms(
+            [frame.shape for frame in frames], self._imgsz, self._stride, self.transform_for
+        )
+        while len(self._buffers) < len(frames):
+            self._buffers.append(np.full(transforms[0].out_shape, PAD_VALUE, dtype=np.uint8))
+            self._buffer_transforms.append(None)
+
+        inputs = []
+        for index, (frame, transform) in enumerate(zip(frames, transforms)):
+            buffer = self._buffers[index]
+            if buffer.shape != transform.out_shape:
+                buffer = np.full(transform.out_shape, PAD_VALUE, dtype=np.uint8)
+                self._buffers[index] = buffer
+            elif self._buffer_transforms[index] != transform:
+                buffer.fill(PAD_VALUE)
+            self._buffer_transforms[index] = transform
+            inputs.append(transform.apply(frame, buffer))
+
+        return inputs, transforms
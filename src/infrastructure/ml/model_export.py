@@ -0,0 +1,54 @@
+import logging
+from pathlib import Path
+from typing import Any
+
+from ultralytics import YOLO
+
+
+# Runtimes de inferencia soportados y formato de exportación de ultralytics asociado
+SUPPORTED_RUNTIMES = ("pytorch", "onnx", "openvino")
+
+
+def is_pytorch_runtime(runtime: str) -> bool:
+    """Indica si el runtime ejecuta el checkpoint de PyTorch directamente."""
+    return runtime == "pytorch"
+
+
+def exported_artifact_path(weights_path: Path, runtime: str) -> Path:
+    """Ruta donde ultralytics deja el modelo exportado, junto a los pesos originales."""
+    if runtime == "onnx":
+        return weights_path.with_suffix(".onnx")
+    if runtime == "openvino":
+        return weights_path.parent / f"{weights_path.stem}_openvino_model"
+    raise ValueError(f"Runtime de inferencia no soportado: {runtime}")
+
+
+def export_model(model: Any, weights_path: Path, runtime: str, imgsz: int = 640) -> Path:
+    """Exporta el checkpoint al formato del runtime una sola vez y devuelve el artefacto.
+
+    El artefacto se cachea junto a los pesos y solo se regenera si los pesos son
+    más recientes que la exportación existente.
+    """
+    if runtime not in SUPPORTED_RUNTIMES:
+        raise ValueError(f"Runtime de inferencia no soportado: {runtime}")
+    if is_pytorch_runtime(runtime):
+        return weights_path
+
+    logger = logging.getLogger(__name__)
+    artifact = exported_artifact_path(weights_path, runtime)
+
+    if artifact.exists() and artifact.stat().st_mtime >= weights_path.stat().st_mtime:
+        logger.info(f"Usando modelo {runtime} exportado en caché: {artifact}")
+        return artifact
+
+    logger.info(f"Exportando {weights_path.name} a {runtime} (imgsz={imgsz})")
+    # Ejes dinámicos para admitir lotes de tamaño variable y otras resoluciones de entrada
+    exported = model.export(format=runtime, imgsz=imgsz, dynamic=True, half=False)
+    artifact = Path(exported)
+    logger.info(f"Modelo exportado a: {artifact}")
+    return artifact
+
+
+def load_runtime_model(artifact: Path, runtime: str) -> YOLO:
+    """Carga un modelo exportado; ultralytics lo ejecuta con ONNX Runtime u OpenVINO en CPU."""
+    return YOLO(str(artifact), task="detect")
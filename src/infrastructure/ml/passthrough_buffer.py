@@ -0,0 +1,68 @@
+import threading
+from typing import Dict
+
+import numpy as np
+
+
+class PassthroughFrameBuffer:
+    """Buffer acotado, indexado por número de frame, para los frames que no se infieren.
+
+    Los frames de paso (p. ej. los que solo se escriben en el video anotado) no
+    viajan por las colas de inferencia: el decodificador los deja aquí y el
+    pipeline transporta solo su número de frame. El consumidor los retira en
+    orden al postprocesarlos. Con el buffer lleno el decodificador espera, de modo
+    que los frames a resolución completa en memoria quedan acotados por
+    ``capacity`` con independencia del tamaño de lote y de las colas.
+    """
+
+    # Intervalo con el que una escritura bloqueada comprueba si el pipeline se detuvo
+    _POLL_SECONDS = 0.1
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("La capacidad del buffer de frames de paso debe ser al menos 1")
+        self._capacity = capacity
+        self._frames: Dict[int, np.ndarray] = {}
+        self._condition = threading.Condition()
+
+    @property
+    def capacity(self) -> int:
+        """Número máximo de frames retenidos."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._frames)
+
+    def is_full(self) -> bool:
+        """Indica si el decodificador tendría que esperar para añadir un frame."""
+        with self._condition:
+            return len(self._frames) >= self._capacity
+
+    def put(self, frame_number: int, frame: np.ndarray, stop: threading.Event) -> bool:
+        """Guarda un frame, esperando a que haya hueco; devuelve False si ``stop`` se activa."""
+        with self._condition:
+            while len(self._frames) >= self._capacity:
+                if stop.is_set():
+                    return False
+                self._condition.wait(self._POLL_SECONDS)
+            self._frames[frame_number] = frame
+            return True
+
+    def get(self, frame_number: int) -> np.ndarray:
+        """Devuelve un frame sin liberarlo."""
+        with self._condition:
+            return self._frames[frame_number]
+
+    def take(self, frame_number: int) -> np.ndarray:
+        """Retira un frame y libera su hueco."""
+        with self._condition:
+            frame = self._frames.pop(frame_number)
+            self._condition.notify()
+            return frame
+
+    def clear(self) -> None:
+        """Libera todos los frames (al detener el pipeline)."""
+        with self._condition:
+            self._frames.clear()
+            self._condition.notify_all()
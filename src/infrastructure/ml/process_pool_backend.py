@@ -0,0 +1,190 @@
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .detections import FrameDetections
+from .letterbox import PAD_VALUE, LetterboxTransform, batch_transforms
+
+
+# Modelo cargado una única vez por proceso trabajador (ver _init_worker)
+_worker_model: Any = None
+_worker_buffer: Optional[np.ndarray] = None
+
+
+def _init_worker(model_path: str, device: str, torch_threads: int, runtime: str) -> None:
+    """Inicializa un proceso trabajador: fija los hilos de torch y carga el modelo."""
+    global _worker_model
+
+    import torch
+
+    from .model_export import is_pytorch_runtime, load_runtime_model
+
+    # Evita que los hilos intra-op de cada proceso compitan por los mismos núcleos
+    torch.set_num_threads(torch_threads)
+    torch.set_num_interop_threads(1)
+
+    _worker_model = load_runtime_model(Path(model_path), runtime)
+    if is_pytorch_runtime(runtime):
+        _worker_model.to(device)
+
+    # Precalentar para que el primer lote real no pague la inicialización perezosa
+    _worker_model(np.zeros((64, 64, 3), dtype=np.uint8), verbose=False)
+
+
+def _worker_ready() -> bool:
+    """Tarea vacía usada para forzar el arranque de los trabajadores."""
+    time.sleep(0.1)
+    return _worker_model is not None
+
+
+def _infer_shared_batch(
+    shm_name: str,
+    shape: Tuple[int, ...],
+    dtype: str,
+    confidence: float,
+    imgsz: int
+) -> List[FrameDetections]:
+    """Infiere un lote de frames publicado en memoria compartida por el proceso principal."""
+    global _worker_buffer
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        shared = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        # Copia local reutilizable: ultralytics conserva referencias a las imágenes de
+        # entrada y el segmento compartido debe poder cerrarse al terminar la tarea
+        if _worker_buffer is None or _worker_buffer.shape != shared.shape or _worker_buffer.dtype != shared.dtype:
+            _worker_buffer = np.empty_like(shared)
+        np.copyto(_worker_buffer, shared)
+        del shared
+    finally:
+        shm.close()
+
+    results = _worker_model(list(_worker_buffer), conf=confidence, imgsz=imgsz, verbose=False)
+    return FrameDetections.from_results(results)
+
+
+class ProcessPoolInferenceBackend:
+    """Ejecuta la inferencia en un pool de procesos con el modelo precargado en cada uno.
+
+    Los lotes de frames se publican en memoria compartida en lugar de serializarse
+    con pickle; solo las detecciones (arrays pequeños) vuelven por la cola del pool.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        device: str = 'cpu',
+        runtime: str = 'pytorch',
+        workers: int = 2,
+        torch_threads: int = 1
+    ):
+        if workers < 1:
+            raise ValueError("El número de procesos de inferencia debe ser al menos 1")
+        if torch_threads < 1:
+            raise ValueError("El número de hilos de torch por proceso debe ser al menos 1")
+
+        self._workers = workers
+        self._logger = logging.getLogger(__name__)
+        # "spawn" evita heredar por fork el estado de hilos de torch del proceso principal
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(model_path, device, torch_threads, runtime)
+        )
+
+    @property
+    def workers(self) -> int:
+        """Número de procesos trabajadores."""
+        return self._workers
+
+    def warm_up(self) -> None:
+        """Arranca todos los procesos para que carguen el modelo antes del primer video."""
+        futures = [self._pool.submit(_worker_ready) for _ in range(self._workers)]
+        for future in futures:
+            future.result()
+        self._logger.info(f"Pool de inferencia listo con {self._workers} procesos")
+
+    def infer(
+        self,
+        frames: List[np.ndarray],
+        confidence: float,
+        imgsz: int = 640,
+        letterbox: bool = False,
+        stride: Optional[int] = None
+    ) -> List[FrameDetections]:
+        """Infiere un lote de frames en un proceso trabajador.
+
+        Con ``letterbox`` los frames se redimensionan directamente sobre la memoria
+        compartida, por lo que se envían a la resolución de entrada del modelo en lugar
+        de a resolución completa (el rectángulo mínimo alineado a ``stride`` si se
+        indica, o ``imgsz`` x ``imgsz``), y las cajas se devuelven en coordenadas del
+        frame original.
+        """
+        if not frames:
+            return []
+
+        if letterbox:
+            transforms = batch_transforms([frame.shape for frame in frames], imgsz, stride)
+            detections = self._infer_group(
+                frames, transforms[0].out_shape, np.dtype(np.uint8).str, confidence, imgsz, transforms
+            )
+            return [
+                frame_detections._replace(xyxy=transform.to_original(frame_detections.xyxy))
+                for frame_detections, transform in zip(detections, transforms)
+            ]
+
+        # Los frames de distinta resolución se envían en sub-lotes homogéneos
+        groups: Dict[Tuple[Tuple[int, ...], str], List[int]] = {}
+        for index, frame in enumerate(frames):
+            groups.setdefault((frame.shape, frame.dtype.str), []).append(index)
+
+        detections: List[Optional[FrameDetections]] = [None] * len(frames)
+        for (shape, dtype), indices in groups.items():
+            group_detections = self._infer_group(
+                [frames[i] for i in indices], shape, dtype, confidence, imgsz
+            )
+            for index, frame_detections in zip(indices, group_detections):
+                detections[index] = frame_detections
+
+        return detections
+
+    def _infer_group(
+        self,
+        frames: List[np.ndarray],
+        shape: Tuple[int, ...],
+        dtype: str,
+        confidence: float,
+        imgsz: int,
+        transforms: Optional[List[LetterboxTransform]] = None
+    ) -> List[FrameDetections]:
+        """Copia un lote homogéneo a memoria compartida y lo infiere en el pool."""
+        batch_shape = (len(frames),) + tuple(shape)
+        nbytes = int(np.prod(batch_shape)) * np.dtype(dtype).itemsize
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        try:
+            batch = np.ndarray(batch_shape, dtype=np.dtype(dtype), buffer=shm.buf)
+            if transforms is not None:
+                batch.fill(PAD_VALUE)
+                for index, (frame, transform) in enumerate(zip(frames, transforms)):
+                    transform.apply(frame, batch[index])
+            else:
+                for index, frame in enumerate(frames):
+                    batch[index] = frame
+            del batch
+
+            future = self._pool.submit(_infer_shared_batch, shm.name, batch_shape, dtype, confidence, imgsz)
+            return future.result()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def shutdown(self) -> None:
+        """Detiene los procesos trabajadores."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,134 @@
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import cv2
+import numpy as np
+
+from .letterbox import letterbox
+
+
+# Modos de cuantización INT8 post-entrenamiento soportados
+SUPPORTED_QUANTIZATION_MODES = ("none", "dynamic", "static")
+
+
+def quantized_artifact_path(onnx_path: Path, mode: str) -> Path:
+    """Ruta del modelo cuantizado, junto al modelo ONNX FP32 del que se deriva."""
+    return onnx_path.with_name(f"{onnx_path.stem}_int8_{mode}.onnx")
+
+
+def collect_calibration_frames(
+    videos_dir: Path,
+    max_frames: int = 64,
+    supported_formats: Iterable[str] = (".mp4", ".avi", ".mov", ".mkv")
+) -> List[np.ndarray]:
+    """Toma frames repartidos uniformemente entre los videos de ``videos_dir``."""
+    videos = sorted(
+        path for path in videos_dir.iterdir()
+        if path.is_file() and path.suffix.lower() in supported_formats
+    ) if videos_dir.exists() else []
+    if not videos:
+        raise ValueError(f"No hay videos para calibrar la cuantización en {videos_dir}")
+
+    frames_per_video = max(1, max_frames // len(videos))
+    frames: List[np.ndarray] = []
+
+    for video_path in videos:
+        cap = cv2.VideoCapture(str(video_path))
+        try:
+            total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            if total <= 0:
+                continue
+            for frame_number in np.linspace(0, total - 1, frames_per_video, dtype=int):
+                cap.set(cv2.CAP_PROP_POS_FRAMES, int(frame_number))
+                ret, frame = cap.read()
+                if ret:
+                    frames.append(frame)
+        finally:
+            cap.release()
+
+    if not frames:
+        raise ValueError(f"No se pudieron leer frames de calibración en {videos_dir}")
+    return frames[:max_frames]
+
+
+def preprocess_for_onnx(frame: np.ndarray, imgsz: int = 640) -> np.ndarray:
+    """Letterbox + BGR->RGB + NCHW float32 normalizado, como el preprocesado de YOLO."""
+    tensor = letterbox(frame, imgsz)[:, :, ::-1].transpose(2, 0, 1)[None]
+    return np.ascontiguousarray(tensor, dtype=np.float32) / 255.0
+
+
+class FrameCalibrationDataReader:
+    """Lector de calibración para ``onnxruntime.quantization.quantize_static``."""
+
+    def __init__(self, input_name: str, frames: List[np.ndarray], imgsz: int = 640):
+        self._input_name = input_name
+        self._frames = frames
+        self._imgsz = imgsz
+        self._index = 0
+
+    def get_next(self) -> Optional[Dict[str, np.ndarray]]:
+        """Devuelve la siguiente entrada preprocesada o None al agotar los frames."""
+        if self._index >= len(self._frames):
+            return None
+        frame = self._frames[self._index]
+        self._index += 1
+        return {self._input_name: preprocess_for_onnx(frame, self._imgsz)}
+
+    def rewind(self) -> None:
+        """Vuelve al primer frame."""
+        self._index = 0
+
+
+def quantize_onnx_model(
+    onnx_path: Path,
+    mode: str,
+    calibration_frames: Optional[List[np.ndarray]] = None,
+    imgsz: int = 640
+) -> Path:
+    """Cuantiza a INT8 un modelo ONNX FP32 y devuelve la ruta del modelo cuantizado.
+
+    ``dynamic`` cuantiza solo los pesos; ``static`` además calibra las activaciones
+    con ``calibration_frames``. El resultado se cachea junto al modelo original.
+    """
+    if mode not in SUPPORTED_QUANTIZATION_MODES or mode == "none":
+        raise ValueError(f"Modo de cuantización no soportado: {mode}")
+
+    import onnx
+    from onnxruntime import InferenceSession
+    from onnxruntime.quantization import QuantFormat, QuantType, quantize_dynamic, quantize_static
+
+    logger = logging.getLogger(__name__)
+    output_path = quantized_artifact_path(onnx_path, mode)
+
+    if output_path.exists() and output_path.stat().st_mtime >= onnx_path.stat().st_mtime:
+        logger.info(f"Usando modelo INT8 ({mode}) en caché: {output_path}")
+        return output_path
+
+    logger.info(f"Cuantizando {onnx_path.name} a INT8 ({mode})")
+    if mode == "dynamic":
+        quantize_dynamic(str(onnx_path), str(output_path), weight_type=QuantType.QUInt8)
+    else:
+        if not calibration_frames:
+            raise ValueError("La cuantización estática requiere frames de calibración")
+        session = InferenceSession(str(onnx_path), providers=["CPUExecutionProvider"])
+        reader = FrameCalibrationDataReader(session.get_inputs()[0].name, calibration_frames, imgsz)
+        del session
+        quantize_static(
+            str(onnx_path),
+            str(output_path),
+            reader,
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8
+        )
+
+    # Conservar los metadatos de ultralytics (clases, stride, imgsz) del modelo original
+    source = onnx.load(str(onnx_path), load_external_data=False)
+    quantized = onnx.load(str(output_path))
+    del quantized.metadata_props[:]
+    quantized.metadata_props.extend(source.metadata_props)
+    onnx.save(quantized, str(output_path))
+
+    logger.info(f"Modelo INT8 guardado en: {output_path}")
+    return output_path
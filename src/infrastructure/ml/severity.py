@@ -0,0 +1,59 @@
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from ...domain.entities.damage import DamageSeverity
+
+
+class SeverityClassifier:
+    """Clasificador vectorizado de severidad a partir del área y la confianza.
+
+    Los umbrales de área se definen para ``reference_resolution`` y, si
+    ``scale_with_resolution`` está activo, se escalan con el área del frame, de modo
+    que una misma abolladura reciba la misma severidad en 720p que en 4K.
+    """
+
+    # Códigos de severidad en orden creciente
+    LEVELS = np.array(
+        [DamageSeverity.LOW, DamageSeverity.MEDIUM, DamageSeverity.HIGH, DamageSeverity.CRITICAL],
+        dtype=object
+    )
+
+    def __init__(
+        self,
+        thresholds: Dict[str, float],
+        reference_resolution: Tuple[int, int] = (1280, 720),
+        scale_with_resolution: bool = True
+    ):
+        self._thresholds = thresholds
+        self._reference_area = float(reference_resolution[0] * reference_resolution[1])
+        self._scale_with_resolution = scale_with_resolution
+
+    def area_thresholds(self, frame_shape: Optional[Tuple[int, ...]] = None) -> Tuple[float, float]:
+        """Umbrales de área (pequeño, mediano) para un frame de la forma dada."""
+        scale = 1.0
+        if self._scale_with_resolution and frame_shape is not None:
+            scale = (frame_shape[0] * frame_shape[1]) / self._reference_area
+        return self._thresholds['area_small'] * scale, self._thresholds['area_medium'] * scale
+
+    def classify(
+        self,
+        areas: np.ndarray,
+        confidences: np.ndarray,
+        frame_shape: Optional[Tuple[int, ...]] = None
+    ) -> np.ndarray:
+        """Devuelve el código de severidad (0-3, índice de LEVELS) de cada detección."""
+        area_small, area_medium = self.area_thresholds(frame_shape)
+
+        # Nivel por tamaño (0-2) y por confianza (0-2); la confianza alta sube un nivel
+        # y la baja lo resta, igual que la tabla de decisión original
+        size_level = (areas >= area_small).astype(np.int8) + (areas >= area_medium)
+        confidence_level = (
+            (confidences >= self._thresholds['confidence_medium']).astype(np.int8)
+            + (confidences >= self._thresholds['confidence_high'])
+        )
+        return np.clip(size_level + confidence_level - 1, 0, len(self.LEVELS) - 1).astype(np.int8)
+
+    def to_severities(self, codes: np.ndarray) -> np.ndarray:
+        """Convierte códigos de severidad en miembros de DamageSeverity."""
+        return self.LEVELS[codes]
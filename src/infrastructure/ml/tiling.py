@@ -0,0 +1,92 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .box_ops import batched_nms
+from .detections import FrameDetections
+
+
+class FrameTiler:
+    """Divide frames de alta resolución en teselas solapadas y fusiona sus detecciones.
+
+    Las teselas son vistas del frame (sin copia). Opcionalmente se añade el frame
+    completo, de modo que los daños grandes que cruzan varias teselas se sigan
+    detectando enteros; las cajas duplicadas se eliminan con NMS por clase.
+    """
+
+    def __init__(
+        self,
+        tile_size: int = 640,
+        overlap: float = 0.2,
+        nms_iou_threshold: float = 0.5,
+        include_full_frame: bool = True
+    ):
+        if tile_size < 32:
+            raise ValueError("El tamaño de tesela debe ser al menos 32 píxeles")
+        if not 0.0 <= overlap < 1.0:
+            raise ValueError("El solapamiento entre teselas debe estar entre 0.0 y 1.0 (excluido)")
+
+        self._tile_size = tile_size
+        self._stride = max(1, int(tile_size * (1.0 - overlap)))
+        self._nms_iou_threshold = nms_iou_threshold
+        self._include_full_frame = include_full_frame
+
+    def tile_origins(self, frame_shape: Tuple[int, ...]) -> List[Tuple[int, int]]:
+        """Esquinas superiores izquierdas (x, y) de las teselas que cubren el frame."""
+        height, width = frame_shape[:2]
+        return [(x, y) for y in self._axis_origins(height) for x in self._axis_origins(width)]
+
+    def split(self, frame: np.ndarray) -> Tuple[List[np.ndarray], np.ndarray]:
+        """Devuelve las imágenes a inferir y el desplazamiento (x, y) de cada una."""
+        height, width = frame.shape[:2]
+        if height <= self._tile_size and width <= self._tile_size:
+            return [frame], np.zeros((1, 2), dtype=np.float32)
+
+        origins = self.tile_origins(frame.shape)
+        tiles = [frame[y:y + self._tile_size, x:x + self._tile_size] for x, y in origins]
+        offsets = np.array(origins, dtype=np.float32)
+        if self._include_full_frame:
+            tiles.append(frame)
+            offsets = np.vstack([offsets, np.zeros((1, 2), dtype=np.float32)])
+        return tiles, offsets
+
+    def merge(
+        self,
+        tile_detections: List[FrameDetections],
+        offsets: np.ndarray,
+        frame_shape: Optional[Tuple[int, ...]] = None
+    ) -> FrameDetections:
+        """Lleva las cajas de cada tesela al frame completo y elimina duplicados con NMS.
+
+        Con ``frame_shape`` las cajas desplazadas se recortan a los bordes del frame.
+        """
+        if len(tile_detections) == 1:
+            return tile_detections[0]
+
+        counts = [detections.count for detections in tile_detections]
+        if sum(counts) == 0:
+            return FrameDetections.empty()
+
+        shifts = np.repeat(np.tile(offsets, (1, 2)), counts, axis=0)
+        xyxy = np.concatenate([detections.xyxy for detections in tile_detections]) + shifts
+        if frame_shape is not None:
+            height, width = frame_shape[:2]
+            xyxy[:, [0, 2]] = xyxy[:, [0, 2]].clip(0, width)
+            xyxy[:, [1, 3]] = xyxy[:, [1, 3]].clip(0, height)
+        confidences = np.concatenate([detections.confidences for detections in tile_detections])
+        class_ids = np.concatenate([detections.class_ids for detections in tile_detections])
+
+        keep = batched_nms(xyxy, confidences, class_ids, self._nms_iou_threshold)
+        return FrameDetections(
+            xyxy[keep].astype(np.float32, copy=False),
+            confidences[keep],
+            class_ids[keep]
+        )
+
+    def _axis_origins(self, length: int) -> List[int]:
+        """Posiciones de inicio a lo largo de un eje; la última tesela se alinea al borde."""
+        if length <= self._tile_size:
+            return [0]
+        origins = list(range(0, length - self._tile_size, self._stride))
+        origins.append(length - self._tile_size)
+        return origins
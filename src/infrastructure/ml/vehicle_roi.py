@@ -0,0 +1,144 @@
+import logging
+import threading
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .detections import FrameDetections
+from .frame_batcher import BatchedFrame
+
+
+# Clases COCO de vehículos: car, motorcycle, bus, truck
+VEHICLE_CLASSES = (2, 3, 5, 7)
+
+# Región de interés (x1, y1, x2, y2) en píxeles del frame
+Roi = Tuple[int, int, int, int]
+
+
+class VehicleRoiLocator:
+    """Localizador barato del vehículo con un modelo COCO a baja resolución.
+
+    Devuelve la región que engloba a todos los vehículos detectados, ampliada con
+    ``margin`` (fracción del tamaño de la caja), o None si no hay ninguno.
+    """
+
+    def __init__(
+        self,
+        model_path: Optional[Path] = None,
+        device: str = 'cpu',
+        imgsz: int = 320,
+        confidence: float = 0.3,
+        margin: float = 0.1,
+        classes: Sequence[int] = VEHICLE_CLASSES
+    ):
+        self._model_path = model_path
+        self._device = device
+        self._imgsz = imgsz
+        self._confidence = confidence
+        self._margin = margin
+        self._classes = list(classes)
+        self._model: Optional[Any] = None
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+
+    def load(self) -> None:
+        """Carga el modelo COCO del localizador."""
+        from ultralytics import YOLO
+
+        if self._model_path and Path(self._model_path).exists():
+            self._model = YOLO(str(self._model_path))
+        else:
+            self._model = YOLO('yolov8n.pt')
+        self._model.to(self._device)
+        self._logger.info(f"Localizador de vehículos cargado (imgsz={self._imgsz})")
+
+    @property
+    def is_loaded(self) -> bool:
+        """Indica si el modelo del localizador está cargado."""
+        return self._model is not None
+
+    def locate(self, frames: List[np.ndarray]) -> List[Optional[Roi]]:
+        """Localiza el vehículo en un lote de frames con una sola llamada al modelo."""
+        if not frames:
+            return []
+
+        with self._lock:
+            results = self._model(
+                frames, conf=self._confidence, imgsz=self._imgsz, classes=self._classes, verbose=False
+            )
+
+        rois = []
+        for frame, result in zip(frames, results):
+            boxes = result.boxes.xyxy.cpu().numpy() if result.boxes is not None else np.empty((0, 4))
+            rois.append(self._union_roi(boxes, frame.shape) if len(boxes) else None)
+        return rois
+
+    def _union_roi(self, boxes: np.ndarray, frame_shape: Tuple[int, ...]) -> Roi:
+        """Caja que engloba todos los vehículos, ampliada con el margen y recortada al frame."""
+        height, width = frame_shape[:2]
+        x1, y1 = boxes[:, 0].min(), boxes[:, 1].min()
+        x2, y2 = boxes[:, 2].max(), boxes[:, 3].max()
+        pad_x = (x2 - x1) * self._margin
+        pad_y = (y2 - y1) * self._margin
+        return (
+            int(max(0, x1 - pad_x)),
+            int(max(0, y1 - pad_y)),
+            int(min(width, np.ceil(x2 + pad_x))),
+            int(min(height, np.ceil(y2 + pad_y)))
+        )
+
+
+class VehicleRoiTracker:
+    """Mantiene la ROI del vehículo a lo largo de un video.
+
+    El localizador solo se ejecuta cada ``refresh_interval`` frames (o mientras no
+    haya ROI); entre medias se reutiliza la última, cuyo margen absorbe el
+    desplazamiento del vehículo. Se crea uno por video.
+    """
+
+    def __init__(self, locator: VehicleRoiLocator, refresh_interval: int = 10):
+        if refresh_interval < 1:
+            raise ValueError("El intervalo de refresco de la ROI debe ser al menos 1")
+        self._locator = locator
+        self._refresh_interval = refresh_interval
+        self._roi: Optional[Roi] = None
+        self._last_refresh: Optional[int] = None
+
+    def rois_for(self, batch: List[BatchedFrame]) -> List[Optional[Roi]]:
+        """ROI de cada frame del lote; None significa frame completo."""
+        refresh = [
+            item for item in batch
+            if self._roi is None
+            or self._last_refresh is None
+            or item.frame_number - self._last_refresh >= self._refresh_interval
+        ]
+        located = {}
+        if refresh:
+            # Con la ROI caducada basta localizar el primer frame del lote que la necesita
+            first = refresh[0]
+            located[first.frame_number] = self._locator.locate([first.frame])[0]
+
+        rois = []
+        for item in batch:
+            if item.frame_number in located:
+                self._roi = located[item.frame_number]
+                self._last_refresh = item.frame_number
+            rois.append(self._roi)
+        return rois
+
+
+def crop_to_roi(frame: np.ndarray, roi: Optional[Roi]) -> np.ndarray:
+    """Vista del frame recortada a la ROI (el frame completo si no hay ROI)."""
+    if roi is None:
+        return frame
+    x1, y1, x2, y2 = roi
+    return frame[y1:y2, x1:x2]
+
+
+def detections_to_frame(detections: FrameDetections, roi: Optional[Roi]) -> FrameDetections:
+    """Lleva las cajas detectadas en el recorte de la ROI a coordenadas del frame."""
+    if roi is None or detections.count == 0:
+        return detections
+    offset = np.array([roi[0], roi[1], roi[0], roi[1]], dtype=detections.xyxy.dtype)
+    return detections._replace(xyxy=detections.xyxy + offset)
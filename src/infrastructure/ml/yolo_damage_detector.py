@@ -1,5 +1,9 @@
 import asyncio
-from typing import List, Optional, Dict, Any
+import itertools
+import threading
+from concurrent.futures import Executor
+from functools import partial
+from typing import List, Optional, Dict, Any, Tuple, Callable
 from pathlib import Path
 import cv2
 import numpy as np
@@ -9,18 +13,109 @@ import uuid
 import logging
 
 from ...domain.entities.video import Video
-from ...domain.entities.damage import Damage, DamageType, DamageSeverity, BoundingBox
-from ...domain.entities.detection_result import DetectionResult, DetectionStatistics
+from ...domain.entities.damage import Damage, DamageType, BoundingBox
+from ...domain.entities.damage_columns import DamageColumnsBuilder
+from ...domain.entities.detection_result import DetectionResult, DetectionStatisticsAccumulator
 from ...domain.services.damage_detection_service import DamageDetectionService
+from .damage_tracker import IoUDamageTracker
+from .detections import FrameDetections
+from .frame_batcher import BatchedFrame
+from .frame_sampler import FrameSampler, sample_frames
+from .inference_pipeline import InferencePipeline
+from .letterbox import LetterboxPreprocessor
+from .model_export import SUPPORTED_RUNTIMES, export_model, is_pytorch_runtime, load_runtime_model
+from .process_pool_backend import ProcessPoolInferenceBackend
+from .quantization import SUPPORTED_QUANTIZATION_MODES, collect_calibration_frames, quantize_onnx_model
+from .severity import SeverityClassifier
+from .tiling import FrameTiler
+from .vehicle_roi import VehicleRoiLocator, VehicleRoiTracker, crop_to_roi, detections_to_frame
+from ..video.frame_annotator import AnnotatedVideoWriter
 
 
 class YOLODamageDetector(DamageDetectionService):
     """Implementación del servicio de detección de daños usando YOLOv11."""
     
-    def __init__(self, model_path: Optional[Path] = None, device: str = 'cpu'):
+    def __init__(
+        self,
+        model_path: Optional[Path] = None,
+        device: str = 'cpu',
+        batch_size: int = 1,
+        max_batch_wait_ms: int = 50,
+        pipeline_queue_size: int = 16,
+        passthrough_buffer_frames: int = 32,
+        frame_sampler_factory: Optional[Callable[[], FrameSampler]] = None,
+        executor: Optional[Executor] = None,
+        process_workers: int = 0,
+        torch_threads_per_worker: int = 1,
+        scale_severity_with_resolution: bool = True,
+        runtime: str = "pytorch",
+        quantization: str = "none",
+        calibration_videos_dir: Optional[Path] = None,
+        calibration_frames: int = 64,
+        imgsz: int = 640,
+        letterbox: bool = True,
+        tiler: Optional[FrameTiler] = None,
+        vehicle_locator: Optional[VehicleRoiLocator] = None,
+        vehicle_roi_refresh_interval: int = 10,
+        tracker_factory: Optional[Callable[[], IoUDamageTracker]] = None,
+        keep_frame_damages: bool = True,
+        sequential_damage_ids: bool = False
+    ):
+        if batch_size < 1:
+            raise ValueError("El tamaño de lote debe ser al menos 1")
+        if runtime not in SUPPORTED_RUNTIMES:
+            raise ValueError(f"Runtime de inferencia no soportado: {runtime}")
+        if quantization not in SUPPORTED_QUANTIZATION_MODES:
+            raise ValueError(f"Modo de cuantización no soportado: {quantization}")
+        if quantization != "none" and runtime != "onnx":
+            raise ValueError("La cuantización INT8 requiere el runtime onnx")
+        if quantization == "static" and calibration_videos_dir is None:
+            raise ValueError("La cuantización estática requiere un directorio de videos de calibración")
+        if not keep_frame_damages and tracker_factory is None:
+            raise ValueError("Descartar los daños por frame requiere el seguimiento temporal de daños")
+        
         self._model: Optional[YOLO] = None
         self._model_path = model_path
         self._device = device
+        # Runtime de inferencia (pytorch, onnx u openvino) y artefacto que se ejecuta
+        self._runtime = runtime
+        self._artifact_path: Optional[Path] = None
+        # Cuantización INT8 opcional del modelo ONNX (none, dynamic o static)
+        self._quantization = quantization
+        self._calibration_videos_dir = calibration_videos_dir
+        self._calibration_frames = calibration_frames
+        # Resolución de entrada del modelo; con letterbox el redimensionado se hace aquí
+        # sobre buffers reutilizados en lugar de dejarlo a ultralytics en cada llamada
+        self._imgsz = imgsz
+        self._letterbox = LetterboxPreprocessor(imgsz) if letterbox else None
+        # Stride del modelo PyTorch: permite entradas rectangulares mínimas (None = cuadrado fijo)
+        self._input_stride: Optional[int] = None
+        # Inferencia por teselas solapadas (None = frame completo)
+        self._tiler = tiler
+        # Modo en dos etapas: localizar el vehículo y detectar daños solo en su ROI
+        self._vehicle_locator = vehicle_locator
+        self._vehicle_roi_refresh_interval = vehicle_roi_refresh_interval
+        # Seguimiento temporal: un tracker por video enlaza las detecciones del mismo daño;
+        # sin keep_frame_damages el resultado guarda solo la detección representativa de cada track
+        self._tracker_factory = tracker_factory
+        self._keep_frame_damages = keep_frame_damages
+        # Ids enteros secuenciales por resultado en lugar de un UUID por detección
+        self._sequential_damage_ids = sequential_damage_ids
+        self._batch_size = batch_size
+        self._max_batch_wait_seconds = max_batch_wait_ms / 1000.0
+        self._pipeline_queue_size = pipeline_queue_size
+        # Frames de paso (modo fusionado) retenidos a la vez, independiente de las colas de inferencia
+        self._passthrough_buffer_frames = passthrough_buffer_frames
+        # Cada video usa su propio muestreador (el adaptativo guarda estado entre frames)
+        self._frame_sampler_factory = frame_sampler_factory or FrameSampler
+        # Executor donde corre el trabajo bloqueante (None = executor por defecto del loop)
+        self._executor = executor
+        # El predictor de ultralytics no es seguro entre hilos: una llamada al modelo a la vez
+        self._model_lock = threading.Lock()
+        # Con process_workers > 0 la inferencia se delega a un pool de procesos
+        self._process_workers = process_workers
+        self._torch_threads_per_worker = torch_threads_per_worker
+        self._process_backend: Optional[ProcessPoolInferenceBackend] = None
         self._confidence_threshold = 0.5
         self._model_version = "YOLOv11"
         self._logger = logging.getLogger(__name__)
@@ -33,6 +128,11 @@ class YOLODamageDetector(DamageDetectionService):
             3: DamageType.RUST,
             4: DamageType.BROKEN_PART
         }
+        # Tabla indexada por clase para mapear todas las detecciones de un frame a la vez
+        self._damage_type_table = np.array(
+            [self._class_mapping.get(i, DamageType.UNKNOWN) for i in range(max(self._class_mapping) + 1)],
+            dtype=object
+        )
         
         # Configuración de severidad basada en área y confianza
         self._severity_thresholds = {
@@ -41,9 +141,20 @@ class YOLODamageDetector(DamageDetectionService):
             'confidence_high': 0.8,
             'confidence_medium': 0.6
         }
+        # Los umbrales de área se refieren a 1280x720 y se escalan con la resolución del frame
+        self._severity_classifier = SeverityClassifier(
+            self._severity_thresholds,
+            reference_resolution=(1280, 720),
+            scale_with_resolution=scale_severity_with_resolution
+        )
     
     async def load_model(self, model_path: Optional[Path] = None) -> bool:
         """Carga el modelo YOLOv11."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._load_model_sync, model_path)
+    
+    def _load_model_sync(self, model_path: Optional[Path] = None) -> bool:
+        """Carga el modelo de forma bloqueante (se ejecuta en el executor)."""
         try:
             if model_path:
                 self._model_path = model_path
@@ -65,12 +176,76 @@ class YOLODamageDetector(DamageDetectionService):
             self._model.to(self._device)
             self._logger.info(f"Modelo configurado para usar: {self._device}")
             
+            # Stride de la red PyTorch; el modelo exportado conserva la misma arquitectura
+            self._input_stride = self._model_stride()
+            
+            # Exportar (una vez) y cargar el modelo en el runtime optimizado configurado
+            weights_path = Path(self._model.ckpt_path) if self._model.ckpt_path else None
+            self._artifact_path = weights_path
+            if not is_pytorch_runtime(self._runtime):
+                if weights_path is None:
+                    raise RuntimeError("No se encontró el checkpoint para exportar el modelo")
+                self._artifact_path = export_model(
+                    self._model, weights_path, self._runtime, self._imgsz
+                )
+                if self._quantization != "none":
+                    self._artifact_path = self._quantize_artifact(self._artifact_path)
+                self._model = load_runtime_model(self._artifact_path, self._runtime)
+                self._logger.info(f"Modelo cargado con runtime {self._runtime}: {self._artifact_path}")
+            
+            # ONNX/OpenVINO se exportan con ejes dinámicos, así que todos los runtimes
+            # aceptan el letterbox rectangular mínimo alineado al stride
+            if self._letterbox:
+                self._letterbox = LetterboxPreprocessor(self._imgsz, stride=self._input_stride)
+            
+            if self._vehicle_locator:
+                self._vehicle_locator.load()
+            
+            if self._process_workers > 0:
+                self._start_process_backend()
+            
             return True
             
         except Exception as e:
             self._logger.error(f"Error al cargar el modelo: {e}")
             return False
     
+    def _quantize_artifact(self, onnx_path: Path) -> Path:
+        """Cuantiza a INT8 el modelo ONNX exportado, calibrando con frames de videos/."""
+        frames = None
+        if self._quantization == "static":
+            frames = collect_calibration_frames(self._calibration_videos_dir, self._calibration_frames)
+            self._logger.info(f"Calibrando cuantización con {len(frames)} frames")
+        return quantize_onnx_model(onnx_path, self._quantization, frames, self._imgsz)
+    
+    def _model_stride(self) -> int:
+        """Stride máximo de la red PyTorch (32 si el modelo no lo expone)."""
+        try:
+            return int(self._model.model.stride.max())
+        except AttributeError:
+            return 32
+    
+    def _start_process_backend(self) -> None:
+        """Arranca el pool de procesos de inferencia con el modelo precargado en cada trabajador."""
+        if self._process_backend:
+            self._process_backend.shutdown()
+        
+        model_path = self._artifact_path or 'yolov8n.pt'
+        self._process_backend = ProcessPoolInferenceBackend(
+            model_path=str(model_path),
+            device=self._device,
+            runtime=self._runtime,
+            workers=self._process_workers,
+            torch_threads=self._torch_threads_per_worker
+        )
+        self._process_backend.warm_up()
+    
+    def shutdown(self) -> None:
+        """Libera los recursos de inferencia (pool de procesos, si existe)."""
+        if self._process_backend:
+            self._process_backend.shutdown()
+            self._process_backend = None
+    
     async def is_model_loaded(self) -> bool:
         """Verifica si el modelo está cargado."""
         return self._model is not None
@@ -84,8 +259,15 @@ class YOLODamageDetector(DamageDetectionService):
             "loaded": True,
             "version": self._model_version,
             "device": self._device,
+            "runtime": self._runtime,
+            "quantization": self._quantization,
             "model_path": str(self._model_path) if self._model_path else "preentrenado",
             "confidence_threshold": self._confidence_threshold,
+            "imgsz": self._imgsz,
+            "tiled": self._tiler is not None,
+            "vehicle_roi": self._vehicle_locator is not None,
+            "batch_size": self._batch_size,
+            "process_workers": self._process_backend.workers if self._process_backend else 0,
             "classes": list(self._class_mapping.values())
         }
     
@@ -99,19 +281,41 @@ class YOLODamageDetector(DamageDetectionService):
         """Obtiene los formatos de video soportados."""
         return ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm']
     
-    async def detect_damages_in_video(self, video: Video, confidence_threshold: float = 0.5) -> DetectionResult:
-        """Detecta daños en un video completo."""
+    async def detect_damages_in_video(
+        self,
+        video: Video,
+        confidence_threshold: float = 0.5,
+        annotated_output_path: Optional[Path] = None
+    ) -> DetectionResult:
+        """Detecta daños en un video completo (y escribe el video anotado en la misma pasada si se pide)."""
         if not self._model:
             raise RuntimeError("El modelo no está cargado")
         
         await self.set_confidence_threshold(confidence_threshold)
         
+        # La decodificación y la inferencia son bloqueantes: el event loop solo espera el resultado
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._detect_damages_in_video_sync, video, confidence_threshold, annotated_output_path
+        )
+    
+    def _detect_damages_in_video_sync(
+        self,
+        video: Video,
+        confidence_threshold: float,
+        annotated_output_path: Optional[Path] = None
+    ) -> DetectionResult:
+        """Detecta daños en un video completo de forma bloqueante (se ejecuta en el executor).
+
+        Con ``annotated_output_path`` todos los frames se decodifican y se escriben
+        anotados durante la detección, sin una segunda decodificación del video.
+        """
         start_time = datetime.now()
-        damages = []
-        frames_processed = 0
-        total_confidence = 0.0
-        damages_by_type = {}
-        damages_by_severity = {}
+        # Los daños de cada frame se pasan a columnas y los Damage se liberan
+        damage_columns = DamageColumnsBuilder()
+        statistics_accumulator = DetectionStatisticsAccumulator(confidence_threshold)
+        tracker = self._tracker_factory() if self._tracker_factory else None
+        next_damage_id = self._damage_id_factory()
         
         try:
             # Abrir video con OpenCV
@@ -122,42 +326,65 @@ class YOLODamageDetector(DamageDetectionService):
             fps = cap.get(cv2.CAP_PROP_FPS)
             total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
             
-            frame_number = 0
-            
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                
-                # Detectar daños en el frame actual
-                frame_damages = await self.detect_damages_in_frame(
-                    cv2.imencode('.jpg', frame)[1].tobytes(), 
-                    frame_number
+            # Modo fusionado: los frames no inferidos atraviesan el pipeline solo para escribirse
+            writer = None
+            if annotated_output_path is not None:
+                writer = AnnotatedVideoWriter(
+                    annotated_output_path,
+                    fps,
+                    int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                    int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
                 )
-                
-                # Agregar timestamp a cada daño
-                timestamp = frame_number / fps if fps > 0 else 0
-                for damage in frame_damages:
-                    damage.timestamp = timestamp
-                    damages.append(damage)
+            
+            # El pipeline avisa al muestreador de los daños en cuanto se infiere cada lote
+            sampler = self._frame_sampler_factory()
+            pipeline = InferencePipeline(
+                infer_batch=partial(
+                    self._infer_batch_safe,
+                    confidence=confidence_threshold,
+                    roi_tracker=self._create_roi_tracker(self._vehicle_roi_refresh_interval)
+                ),
+                batch_size=self._batch_size,
+                max_batch_wait_seconds=self._max_batch_wait_seconds,
+                queue_size=self._pipeline_queue_size,
+                passthrough_buffer_size=self._passthrough_buffer_frames,
+                sampler=sampler,
+                has_detections=lambda detections: detections.count > 0,
+                forward_skipped=writer is not None
+            )
+            
+            try:
+                # Decodificación e inferencia corren en sus propios hilos; aquí se postprocesa
+                frames = sample_frames(cap, fps, sampler, passthrough=writer is not None)
+                for item, result in pipeline.run(frames):
+                    if not item.infer:
+                        writer.write(item.frame)
+                        continue
                     
-                    # Actualizar estadísticas
-                    total_confidence += damage.confidence
+                    frame_damages = self._to_damages(
+                        result, item.frame_number, item.timestamp, item.frame.shape, next_damage_id
+                    )
+                    if tracker:
+                        tracker.update(item.frame_number, frame_damages)
+                    if self._keep_frame_damages:
+                        damage_columns.append(frame_damages)
                     
-                    damage_type = damage.damage_type.value
-                    damages_by_type[damage_type] = damages_by_type.get(damage_type, 0) + 1
+                    if writer:
+                        writer.write(item.frame, frame_damages)
                     
-                    severity = damage.severity.value
-                    damages_by_severity[severity] = damages_by_severity.get(severity, 0) + 1
-                
-                frames_processed += 1
-                frame_number += 1
-                
-                # Log progreso cada 100 frames
-                if frames_processed % 100 == 0:
-                    self._logger.info(f"Procesados {frames_processed}/{total_frames} frames")
-            
-            cap.release()
+                    # Actualizar estadísticas
+                    statistics_accumulator.add_frame(item.frame_number, frame_damages)
+                    
+                    # Log progreso cada 100 frames inferidos
+                    frames_processed = statistics_accumulator.frames_processed
+                    if frames_processed % 100 == 0:
+                        self._logger.info(
+                            f"Inferidos {frames_processed} frames (frame {item.frame_number}/{total_frames})"
+                        )
+            finally:
+                cap.release()
+                if writer:
+                    writer.release()
             
         except Exception as e:
             self._logger.error(f"Error durante la detección: {e}")
@@ -166,18 +393,14 @@ class YOLODamageDetector(DamageDetectionService):
         # Calcular estadísticas finales
         end_time = datetime.now()
         processing_time = (end_time - start_time).total_seconds()
-        average_confidence = total_confidence / len(damages) if damages else 0.0
-        fps_processed = frames_processed / processing_time if processing_time > 0 else 0.0
         
-        statistics = DetectionStatistics(
-            total_frames_processed=frames_processed,
-            total_damages_detected=len(damages),
-            damages_by_type=damages_by_type,
-            damages_by_severity=damages_by_severity,
-            average_confidence=average_confidence,
-            processing_time=processing_time,
-            frames_per_second=fps_processed
-        )
+        tracks = tracker.finalize() if tracker else []
+        if self._keep_frame_damages:
+            damages = damage_columns.build()
+        else:
+            damages = [track.to_damage() for track in tracks]
+        
+        statistics = statistics_accumulator.build(processing_time, total_tracks=len(tracks))
         
         # Crear resultado de detección
         detection_result = DetectionResult(
@@ -187,15 +410,20 @@ class YOLODamageDetector(DamageDetectionService):
             statistics=statistics,
             created_at=end_time,
             model_version=self._model_version,
-            confidence_threshold=confidence_threshold
+            confidence_threshold=confidence_threshold,
+            tracks=tracks,
+            annotated_video_path=annotated_output_path
         )
         
-        self._logger.info(f"Detección completada: {len(damages)} daños encontrados en {frames_processed} frames")
+        self._logger.info(
+            f"Detección completada: {statistics.total_damages_detected} daños encontrados "
+            f"({len(tracks)} tracks) en {statistics.total_frames_processed} frames inferidos de {total_frames}"
+        )
         
         return detection_result
     
     async def detect_damages_in_frame(self, frame_data: bytes, frame_number: int) -> List[Damage]:
-        """Detecta daños en un frame específico."""
+        """Detecta daños en un frame codificado (adaptador para llamadas externas)."""
         if not self._model:
             raise RuntimeError("El modelo no está cargado")
         
@@ -203,50 +431,174 @@ class YOLODamageDetector(DamageDetectionService):
             # Decodificar imagen desde bytes
             nparr = np.frombuffer(frame_data, np.uint8)
             frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            
-            if frame is None:
-                return []
-            
-            # Ejecutar detección
-            results = self._model(frame, conf=self._confidence_threshold, verbose=False)
+        except Exception as e:
+            self._logger.error(f"Error al decodificar el frame {frame_number}: {e}")
+            return []
+        
+        if frame is None:
+            self._logger.warning(f"No se pudo decodificar el frame {frame_number}")
+            return []
+        
+        return await self.detect_damages_in_array(frame, frame_number)
+    
+    async def detect_damages_in_array(self, frame: np.ndarray, frame_number: int) -> List[Damage]:
+        """Detecta daños en un frame BGR ya decodificado (p. ej. de cv2.VideoCapture)."""
+        batch_damages = await self.detect_damages_in_batch([frame], [frame_number])
+        return batch_damages[0]
+    
+    async def detect_damages_in_batch(
+        self,
+        frames: List[np.ndarray],
+        frame_numbers: List[int],
+        timestamps: Optional[List[float]] = None
+    ) -> List[List[Damage]]:
+        """Detecta daños en varios frames con una única pasada del modelo."""
+        if not self._model:
+            raise RuntimeError("El modelo no está cargado")
+        if len(frames) != len(frame_numbers):
+            raise ValueError("El número de frames y de números de frame no coincide")
+        if timestamps is None:
+            timestamps = [0.0] * len(frames)
+        
+        batch = [
+            BatchedFrame(frame_number, timestamp, frame)
+            for frame, frame_number, timestamp in zip(frames, frame_numbers, timestamps)
+        ]
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._detect_batch, batch, self._confidence_threshold
+        )
+    
+    def _detect_batch(self, batch: List[BatchedFrame], confidence: float) -> List[List[Damage]]:
+        """Infiere un lote y asigna los daños a su número de frame y timestamp."""
+        # Frames sueltos sin continuidad: la ROI se localiza en cada frame
+        batch_results = self._infer_batch_safe(batch, confidence, self._create_roi_tracker(1))
+        next_damage_id = self._damage_id_factory()
+        return [
+            self._to_damages(result, item.frame_number, item.timestamp, item.frame.shape, next_damage_id)
+            for result, item in zip(batch_results, batch)
+        ]
+    
+    def _damage_id_factory(self) -> Callable[[], Any]:
+        """Generador de ids de daño para un resultado: secuencial o UUID."""
+        if self._sequential_damage_ids:
+            return itertools.count().__next__
+        return lambda: str(uuid.uuid4())
+    
+    def _create_roi_tracker(self, refresh_interval: int) -> Optional[VehicleRoiTracker]:
+        """Seguimiento de la ROI del vehículo para una secuencia de frames (None sin ROI)."""
+        if self._vehicle_locator is None:
+            return None
+        return VehicleRoiTracker(self._vehicle_locator, refresh_interval)
+    
+    def _infer_batch_safe(
+        self,
+        batch: List[BatchedFrame],
+        confidence: float,
+        roi_tracker: Optional[VehicleRoiTracker] = None
+    ) -> List[FrameDetections]:
+        """Infiere un lote; si falla, registra el error y devuelve resultados vacíos."""
+        try:
+            if roi_tracker is None:
+                return self._infer_batch([item.frame for item in batch], confidence)
+            return self._infer_batch_in_rois(batch, confidence, roi_tracker)
+        except Exception as e:
+            frame_numbers = [item.frame_number for item in batch]
+            self._logger.error(f"Error en detección del lote de frames {frame_numbers}: {e}")
+            return [FrameDetections.empty() for _ in batch]
+    
+    def _infer_batch_in_rois(
+        self,
+        batch: List[BatchedFrame],
+        confidence: float,
+        roi_tracker: VehicleRoiTracker
+    ) -> List[FrameDetections]:
+        """Infiere los daños solo dentro de la ROI del vehículo de cada frame.
+
+        El recorte se redimensiona a la entrada del modelo, así que el vehículo se
+        analiza a mayor resolución efectiva; las cajas vuelven a coordenadas del frame.
+        """
+        rois = roi_tracker.rois_for(batch)
+        crops = [crop_to_roi(item.frame, roi) for item, roi in zip(batch, rois)]
+        detections = self._infer_batch(crops, confidence)
+        return [detections_to_frame(frame_detections, roi) for frame_detections, roi in zip(detections, rois)]
+    
+    def _infer_batch(self, frames: List[np.ndarray], confidence: float) -> List[FrameDetections]:
+        """Infiere un lote de frames (detecciones por frame, en coordenadas del frame)."""
+        if not frames:
+            return []
+        if self._tiler is None:
+            return self._infer_frames(frames, confidence)
+        return [self._infer_tiled(frame, confidence) for frame in frames]
+    
+    def _infer_tiled(self, frame: np.ndarray, confidence: float) -> FrameDetections:
+        """Infiere todas las teselas de un frame en un único lote y fusiona sus cajas."""
+        tiles, offsets = self._tiler.split(frame)
+        return self._tiler.merge(self._infer_frames(tiles, confidence), offsets, frame.shape)
+    
+    def _infer_frames(self, frames: List[np.ndarray], confidence: float) -> List[FrameDetections]:
+        """Ejecuta el modelo una sola vez sobre un lote de imágenes (detecciones por imagen)."""
+        if self._process_backend:
+            return self._process_backend.infer(
+                frames, confidence, imgsz=self._imgsz, letterbox=self._letterbox is not None,
+                stride=self._input_stride
+            )
+        
+        transforms = None
+        with self._model_lock:
+            inputs = frames
+            if self._letterbox:
+                inputs, transforms = self._letterbox.preprocess(frames)
+            results = self._model(inputs, conf=confidence, imgsz=self._imgsz, verbose=False)
+            detections = FrameDetections.from_results(results)
+        
+        if transforms is None:
+            return detections
+        # Devolver las cajas del espacio letterbox a coordenadas del frame original
+        return [
+            frame_detections._replace(xyxy=transform.to_original(frame_detections.xyxy))
+            for frame_detections, transform in zip(detections, transforms)
+        ]
+    
+    def _to_damages(
+        self,
+        detections: FrameDetections,
+        frame_number: int,
+        timestamp: float,
+        frame_shape: Optional[Tuple[int, ...]] = None,
+        next_damage_id: Optional[Callable[[], Any]] = None
+    ) -> List[Damage]:
+        """Convierte las detecciones de un frame en entidades Damage."""
+        # Una caja degenerada haría fallar BoundingBox y con ella todos los daños del frame
+        detections = detections.without_degenerate_boxes()
+        if detections.count == 0:
+            return []
+        
+        try:
+            # Tipos y severidades calculados sobre los arrays del frame completo
+            damage_types = self._map_damage_types(detections.class_ids)
+            severity_codes = self._severity_classifier.classify(
+                detections.areas, detections.confidences, frame_shape
+            )
+            severities = self._severity_classifier.to_severities(severity_codes)
+            confidences = detections.confidences.tolist()
+            boxes = detections.xyxy.tolist()
+            next_damage_id = next_damage_id or self._damage_id_factory()
             
             damages = []
-            
-            for result in results:
-                if result.boxes is not None:
-                    for box in result.boxes:
-                        # Extraer información de la detección
-                        confidence = float(box.conf.cpu().numpy()[0])
-                        class_id = int(box.cls.cpu().numpy()[0])
-                        
-                        # Mapear clase a tipo de daño
-                        damage_type = self._class_mapping.get(class_id, DamageType.UNKNOWN)
-                        
-                        # Obtener coordenadas del bounding box
-                        x1, y1, x2, y2 = box.xyxy.cpu().numpy()[0]
-                        
-                        bounding_box = BoundingBox(
-                            x1=float(x1),
-                            y1=float(y1),
-                            x2=float(x2),
-                            y2=float(y2)
-                        )
-                        
-                        # Determinar severidad
-                        severity = self._determine_severity(bounding_box, confidence)
-                        
-                        # Crear entidad Damage
-                        damage = Damage(
-                            id=str(uuid.uuid4()),
-                            damage_type=damage_type,
-                            severity=severity,
-                            confidence=confidence,
-                            bounding_box=bounding_box,
-                            frame_number=frame_number,
-                            timestamp=0.0  # Se establecerá en detect_damages_in_video
-                        )
-                        
-                        damages.append(damage)
+            for (x1, y1, x2, y2), confidence, damage_type, severity in zip(
+                boxes, confidences, damage_types, severities
+            ):
+                damage = Damage(
+                    id=next_damage_id(),
+                    damage_type=damage_type,
+                    severity=severity,
+                    confidence=confidence,
+                    bounding_box=BoundingBox.from_corners(x1, y1, x2, y2),
+                    frame_number=frame_number,
+                    timestamp=timestamp
+                )
+                damages.append(damage)
             
             return damages
             
@@ -254,34 +606,12 @@ class YOLODamageDetector(DamageDetectionService):
             self._logger.error(f"Error en detección de frame {frame_number}: {e}")
             return []
     
-    def _determine_severity(self, bounding_box: BoundingBox, confidence: float) -> DamageSeverity:
-        """Determina la severidad del daño basado en el área y confianza."""
-        area = bounding_box.area
-        
-        # Severidad basada en confianza alta
-        if confidence >= self._severity_thresholds['confidence_high']:
-            if area >= self._severity_thresholds['area_medium']:
-                return DamageSeverity.CRITICAL
-            elif area >= self._severity_thresholds['area_small']:
-                return DamageSeverity.SEVERE
-            else:
-                return DamageSeverity.MODERATE
-        
-        # Severidad basada en confianza media
-        elif confidence >= self._severity_thresholds['confidence_medium']:
-            if area >= self._severity_thresholds['area_medium']:
-                return DamageSeverity.SEVERE
-            elif area >= self._severity_thresholds['area_small']:
-                return DamageSeverity.MODERATE
-            else:
-                return DamageSeverity.MINOR
-        
-        # Confianza baja
-        else:
-            if area >= self._severity_thresholds['area_medium']:
-                return DamageSeverity.MODERATE
-            else:
-                return DamageSeverity.MINOR
+    def _map_damage_types(self, class_ids: np.ndarray) -> np.ndarray:
+        """Mapea un array de clases YOLO a tipos de daño (UNKNOWN fuera de la tabla)."""
+        known = (class_ids >= 0) & (class_ids < len(self._damage_type_table))
+        damage_types = np.full(class_ids.shape, DamageType.UNKNOWN, dtype=object)
+        damage_types[known] = self._damage_type_table[class_ids[known]]
+        return damage_types
     
     def _is_cuda_available(self) -> bool:
         """Verifica si CUDA está disponible."""
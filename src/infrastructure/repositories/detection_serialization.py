@@ -0,0 +1,170 @@
+from typing import Any, Dict, Optional
+
+from ...domain.entities.detection_result import DetectionStatistics
+from ...domain.entities.damage import Damage, DamageType, DamageSeverity, BoundingBox
+from ...domain.entities.damage_track import DamageTrack
+from ...domain.entities.video import VideoFormat, VideoMetadata
+
+
+# Conversión entre entidades y diccionarios serializables, compartida por los repositorios
+
+
+def metadata_to_dict(metadata: Optional[VideoMetadata]) -> Optional[Dict[str, Any]]:
+    """Convierte los metadatos de un video a diccionario."""
+    if metadata is None:
+        return None
+    return {
+        'duration': metadata.duration,
+        'fps': metadata.fps,
+        'width': metadata.width,
+        'height': metadata.height,
+        'frame_count': metadata.frame_count,
+        'file_size': metadata.file_size,
+        'format': metadata.format.value,
+        'codec': metadata.codec,
+        'bitrate': metadata.bitrate
+    }
+
+
+def dict_to_metadata(metadata_data: Optional[Dict[str, Any]]) -> Optional[VideoMetadata]:
+    """Convierte un diccionario a metadatos de video."""
+    if not metadata_data:
+        return None
+    return VideoMetadata(
+        duration=metadata_data['duration'],
+        fps=metadata_data['fps'],
+        width=metadata_data['width'],
+        height=metadata_data['height'],
+        frame_count=metadata_data['frame_count'],
+        file_size=metadata_data['file_size'],
+        format=VideoFormat(metadata_data['format']),
+        codec=metadata_data['codec'],
+        bitrate=metadata_data['bitrate']
+    )
+
+
+def damage_to_dict(damage: Damage) -> Dict[str, Any]:
+    """Convierte un Damage a diccionario."""
+    return {
+        'id': damage.id,
+        'damage_type': damage.damage_type.value,
+        'severity': damage.severity.value,
+        'confidence': damage.confidence,
+        'bounding_box': {
+            'x1': damage.bounding_box.x1,
+            'y1': damage.bounding_box.y1,
+            'x2': damage.bounding_box.x2,
+            'y2': damage.bounding_box.y2
+        },
+        'frame_number': damage.frame_number,
+        'timestamp': damage.timestamp
+    }
+
+
+def dict_to_damage(damage_data: Dict[str, Any]) -> Damage:
+    """Convierte un diccionario a Damage."""
+    bbox = BoundingBox.from_corners(
+        x1=damage_data['bounding_box']['x1'],
+        y1=damage_data['bounding_box']['y1'],
+        x2=damage_data['bounding_box']['x2'],
+        y2=damage_data['bounding_box']['y2']
+    )
+
+    return Damage(
+        id=damage_data['id'],
+        damage_type=DamageType(damage_data['damage_type']),
+        severity=DamageSeverity(damage_data['severity']),
+        confidence=damage_data['confidence'],
+        bounding_box=bbox,
+        frame_number=damage_data['frame_number'],
+        timestamp=damage_data['timestamp']
+    )
+
+
+def track_to_dict(track: DamageTrack) -> Dict[str, Any]:
+    """Convierte un DamageTrack a diccionario."""
+    return {
+        'id': track.id,
+        'damage_type': track.damage_type.value,
+        'severity': track.severity.value,
+        'peak_confidence': track.peak_confidence,
+        'representative_box': {
+            'x1': track.representative_box.x1,
+            'y1': track.representative_box.y1,
+            'x2': track.representative_box.x2,
+            'y2': track.representative_box.y2
+        },
+        'first_frame': track.first_frame,
+        'last_frame': track.last_frame,
+        'first_timestamp': track.first_timestamp,
+        'last_timestamp': track.last_timestamp,
+        'peak_frame': track.peak_frame,
+        'peak_timestamp': track.peak_timestamp,
+        'detection_count': track.detection_count
+    }
+
+
+def dict_to_track(track_data: Dict[str, Any]) -> DamageTrack:
+    """Convierte un diccionario a DamageTrack."""
+    return DamageTrack(
+        id=track_data['id'],
+        damage_type=DamageType(track_data['damage_type']),
+        severity=DamageSeverity(track_data['severity']),
+        peak_confidence=track_data['peak_confidence'],
+        representative_box=BoundingBox.from_corners(**track_data['representative_box']),
+        first_frame=track_data['first_frame'],
+        last_frame=track_data['last_frame'],
+        first_timestamp=track_data['first_timestamp'],
+        last_timestamp=track_data['last_timestamp'],
+        peak_frame=track_data['peak_frame'],
+        peak_timestamp=track_data['peak_timestamp'],
+        detection_count=track_data['detection_count']
+    )
+
+
+def statistics_to_dict(statistics: DetectionStatistics) -> Dict[str, Any]:
+    """Convierte las estadísticas de una detección a diccionario."""
+    return {
+        'total_frames_processed': statistics.total_frames_processed,
+        'total_damages_detected': statistics.total_damages_detected,
+        'damages_by_type': statistics.damages_by_type,
+        'damages_by_severity': statistics.damages_by_severity,
+        'average_confidence': statistics.average_confidence,
+        'processing_time': statistics.processing_time,
+        'frames_per_second': statistics.frames_per_second,
+        'total_tracks': statistics.total_tracks,
+        'high_confidence_damages': statistics.high_confidence_damages,
+        'severe_damages': statistics.severe_damages,
+        'confidence_histogram': statistics.confidence_histogram,
+        'damages_per_frame': statistics.damages_per_frame,
+        'top_damages': [
+            damage_to_dict(damage) for damage in statistics.top_damages
+        ] if statistics.top_damages is not None else None
+    }
+
+
+def dict_to_statistics(stats_data: Dict[str, Any], default_total_tracks: int = 0) -> DetectionStatistics:
+    """Convierte un diccionario a estadísticas de detección."""
+    return DetectionStatistics(
+        total_frames_processed=stats_data['total_frames_processed'],
+        total_damages_detected=stats_data['total_damages_detected'],
+        # Copias: los registros leídos del log JSON Lines son de solo lectura
+        damages_by_type=dict(stats_data['damages_by_type']),
+        damages_by_severity=dict(stats_data['damages_by_severity']),
+        average_confidence=stats_data['average_confidence'],
+        processing_time=stats_data['processing_time'],
+        frames_per_second=stats_data['frames_per_second'],
+        total_tracks=stats_data.get('total_tracks', default_total_tracks),
+        high_confidence_damages=stats_data.get('high_confidence_damages'),
+        severe_damages=stats_data.get('severe_damages'),
+        confidence_histogram=list(stats_data['confidence_histogram'])
+        if stats_data.get('confidence_histogram') is not None else None,
+        # JSON solo admite claves de texto: restaurar los números de frame
+        damages_per_frame={
+            int(frame_number): count
+            for frame_number, count in stats_data['damages_per_frame'].items()
+        } if stats_data.get('damages_per_frame') is not None else None,
+        top_damages=[
+            dict_to_damage(damage_data) for damage_data in stats_data['top_damages']
+        ] if stats_data.get('top_damages') is not None else None
+    )
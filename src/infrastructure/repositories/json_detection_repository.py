@@ -1,14 +1,23 @@
-import json
 import asyncio
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Mapping, Optional
 from pathlib import Path
 from datetime import datetime
 import logging
 
-from ...domain.entities.detection_result import DetectionResult, DetectionStatistics
-from ...domain.entities.damage import Damage, DamageType, DamageSeverity, BoundingBox
-from ...domain.entities.video import Video, VideoStatus, VideoFormat, VideoMetadata
+from ...domain.entities.detection_result import DetectionResult
+from ...domain.entities.video import Video, VideoStatus
 from ...domain.repositories.detection_repository import DetectionRepository
+from .detection_serialization import (
+    damage_to_dict,
+    dict_to_damage,
+    dict_to_metadata,
+    dict_to_statistics,
+    dict_to_track,
+    metadata_to_dict,
+    statistics_to_dict,
+    track_to_dict
+)
+from .jsonl_log import JsonLinesLog
 
 
 class JsonDetectionRepository(DetectionRepository):
@@ -16,22 +25,20 @@ class JsonDetectionRepository(DetectionRepository):
     
     def __init__(self, storage_path: Path):
         self._storage_path = storage_path
-        self._detections_file = storage_path / "detections.json"
         self._logger = logging.getLogger(__name__)
         
-        # Asegurar que el directorio existe
-        storage_path.mkdir(parents=True, exist_ok=True)
+        # Log de solo anexado; el documento detections.json anterior se migra al crearlo
+        self._log = JsonLinesLog(storage_path / "detections.jsonl", legacy_path=storage_path / "detections.json")
         
-        # Inicializar archivo si no existe
-        if not self._detections_file.exists():
-            self._save_data({})
+        # Serializa las escrituras del proceso; el log añade el bloqueo entre procesos
+        self._write_lock = asyncio.Lock()
     
     async def save(self, detection_result: DetectionResult) -> DetectionResult:
         """Guarda un resultado de detección."""
         try:
-            data = await self._load_data()
-            data[detection_result.id] = self._detection_to_dict(detection_result)
-            await self._save_data(data)
+            record = self._detection_to_dict(detection_result)
+            async with self._write_lock:
+                await self._run(self._log.put, detection_result.id, record)
             
             self._logger.info(f"Resultado de detección guardado: {detection_result.id}")
             return detection_result
@@ -43,8 +50,7 @@ class JsonDetectionRepository(DetectionRepository):
     async def find_by_id(self, result_id: str) -> Optional[DetectionResult]:
         """Busca un resultado por su ID."""
         try:
-            data = await self._load_data()
-            detection_data = data.get(result_id)
+            detection_data = await self._run(self._log.get, result_id)
             
             if detection_data:
                 return self._dict_to_detection(detection_data)
@@ -148,14 +154,13 @@ class JsonDetectionRepository(DetectionRepository):
     async def update(self, detection_result: DetectionResult) -> DetectionResult:
         """Actualiza un resultado de detección."""
         try:
-            data = await self._load_data()
+            record = self._detection_to_dict(detection_result)
+            async with self._write_lock:
+                updated = await self._run(self._log.replace, detection_result.id, record)
             
-            if detection_result.id not in data:
+            if not updated:
                 raise ValueError(f"Resultado de detección no encontrado: {detection_result.id}")
             
-            data[detection_result.id] = self._detection_to_dict(detection_result)
-            await self._save_data(data)
-            
             self._logger.info(f"Resultado de detección actualizado: {detection_result.id}")
             return detection_result
             
@@ -166,15 +171,12 @@ class JsonDetectionRepository(DetectionRepository):
     async def delete(self, result_id: str) -> bool:
         """Elimina un resultado de detección."""
         try:
-            data = await self._load_data()
+            async with self._write_lock:
+                deleted = await self._run(self._log.delete, result_id)
             
-            if result_id in data:
-                del data[result_id]
-                await self._save_data(data)
+            if deleted:
                 self._logger.info(f"Resultado de detección eliminado: {result_id}")
-                return True
-            
-            return False
+            return deleted
             
         except Exception as e:
             self._logger.error(f"Error al eliminar detección {result_id}: {e}")
@@ -221,25 +223,20 @@ class JsonDetectionRepository(DetectionRepository):
     async def exists(self, result_id: str) -> bool:
         """Verifica si existe un resultado con el ID dado."""
         try:
-            data = await self._load_data()
-            return result_id in data
+            return await self._run(self._log.contains, result_id)
             
         except Exception as e:
             self._logger.error(f"Error al verificar existencia de detección {result_id}: {e}")
             return False
     
-    async def _load_data(self) -> Dict[str, Any]:
-        """Carga datos del archivo JSON."""
-        try:
-            with open(self._detections_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+    async def _load_data(self) -> Dict[str, Mapping[str, Any]]:
+        """Carga el estado actual del log (desde la caché si el archivo no cambió)."""
+        return await self._run(self._log.load)
     
-    async def _save_data(self, data: Dict[str, Any]) -> None:
-        """Guarda datos en el archivo JSON."""
-        with open(self._detections_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    async def _run(self, operation: Callable[..., Any], *args: Any) -> Any:
+        """Ejecuta una operación bloqueante sobre el log en el executor por defecto."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, operation, *args)
     
     def _detection_to_dict(self, detection: DetectionResult) -> Dict[str, Any]:
         """Convierte un DetectionResult a diccionario."""
@@ -251,111 +248,40 @@ class JsonDetectionRepository(DetectionRepository):
                 'file_path': str(detection.video.file_path),
                 'status': detection.video.status.value,
                 'created_at': detection.video.created_at.isoformat(),
-                'metadata': {
-                    'duration': detection.video.metadata.duration,
-                    'fps': detection.video.metadata.fps,
-                    'width': detection.video.metadata.width,
-                    'height': detection.video.metadata.height,
-                    'frame_count': detection.video.metadata.frame_count,
-                    'file_size': detection.video.metadata.file_size,
-                    'format': detection.video.metadata.format.value,
-                    'codec': detection.video.metadata.codec,
-                    'bitrate': detection.video.metadata.bitrate
-                } if detection.video.metadata else None
-            },
-            'damages': [
-                {
-                    'id': damage.id,
-                    'damage_type': damage.damage_type.value,
-                    'severity': damage.severity.value,
-                    'confidence': damage.confidence,
-                    'bounding_box': {
-                        'x1': damage.bounding_box.x1,
-                        'y1': damage.bounding_box.y1,
-                        'x2': damage.bounding_box.x2,
-                        'y2': damage.bounding_box.y2
-                    },
-                    'frame_number': damage.frame_number,
-                    'timestamp': damage.timestamp
-                }
-                for damage in detection.damages
-            ],
-            'statistics': {
-                'total_frames_processed': detection.statistics.total_frames_processed,
-                'total_damages_detected': detection.statistics.total_damages_detected,
-                'damages_by_type': detection.statistics.damages_by_type,
-                'damages_by_severity': detection.statistics.damages_by_severity,
-                'average_confidence': detection.statistics.average_confidence,
-                'processing_time': detection.statistics.processing_time,
-                'frames_per_second': detection.statistics.frames_per_second
+                'metadata': metadata_to_dict(detection.video.metadata)
             },
+            'damages': [damage_to_dict(damage) for damage in detection.damages],
+            'statistics': statistics_to_dict(detection.statistics),
             'created_at': detection.created_at.isoformat(),
             'model_version': detection.model_version,
             'confidence_threshold': detection.confidence_threshold,
             'output_path': str(detection.output_path) if detection.output_path else None,
-            'annotated_video_path': str(detection.annotated_video_path) if detection.annotated_video_path else None
+            'annotated_video_path': str(detection.annotated_video_path) if detection.annotated_video_path else None,
+            'annotated_clip_paths': [str(path) for path in detection.annotated_clip_paths],
+            'tracks': [track_to_dict(track) for track in detection.tracks]
         }
     
     def _dict_to_detection(self, data: Dict[str, Any]) -> DetectionResult:
         """Convierte un diccionario a DetectionResult."""
         # Crear video
         video_data = data['video']
-        metadata = None
-        if video_data.get('metadata'):
-            metadata_data = video_data['metadata']
-            metadata = VideoMetadata(
-                duration=metadata_data['duration'],
-                fps=metadata_data['fps'],
-                width=metadata_data['width'],
-                height=metadata_data['height'],
-                frame_count=metadata_data['frame_count'],
-                file_size=metadata_data['file_size'],
-                format=VideoFormat(metadata_data['format']),
-                codec=metadata_data['codec'],
-                bitrate=metadata_data['bitrate']
-            )
-        
         video = Video(
             id=video_data['id'],
             name=video_data['name'],
             file_path=Path(video_data['file_path']),
             status=VideoStatus(video_data['status']),
             created_at=datetime.fromisoformat(video_data['created_at']),
-            metadata=metadata
+            metadata=dict_to_metadata(video_data.get('metadata'))
         )
         
         # Crear daños
-        damages = []
-        for damage_data in data['damages']:
-            bbox = BoundingBox(
-                x1=damage_data['bounding_box']['x1'],
-                y1=damage_data['bounding_box']['y1'],
-                x2=damage_data['bounding_box']['x2'],
-                y2=damage_data['bounding_box']['y2']
-            )
-            
-            damage = Damage(
-                id=damage_data['id'],
-                damage_type=DamageType(damage_data['damage_type']),
-                severity=DamageSeverity(damage_data['severity']),
-                confidence=damage_data['confidence'],
-                bounding_box=bbox,
-                frame_number=damage_data['frame_number'],
-                timestamp=damage_data['timestamp']
-            )
-            damages.append(damage)
+        damages = [dict_to_damage(damage_data) for damage_data in data['damages']]
+        
+        # Crear tracks (ausentes en resultados guardados antes del seguimiento temporal)
+        tracks = [dict_to_track(track_data) for track_data in data.get('tracks', [])]
         
         # Crear estadísticas
-        stats_data = data['statistics']
-        statistics = DetectionStatistics(
-            total_frames_processed=stats_data['total_frames_processed'],
-            total_damages_detected=stats_data['total_damages_detected'],
-            damages_by_type=stats_data['damages_by_type'],
-            damages_by_severity=stats_data['damages_by_severity'],
-            average_confidence=stats_data['average_confidence'],
-            processing_time=stats_data['processing_time'],
-            frames_per_second=stats_data['frames_per_second']
-        )
+        statistics = dict_to_statistics(data['statistics'], default_total_tracks=len(tracks))
         
         # Crear resultado de detección
         detection_result = DetectionResult(
@@ -367,7 +293,9 @@ class JsonDetectionRepository(DetectionRepository):
             model_version=data['model_version'],
             confidence_threshold=data['confidence_threshold'],
             output_path=Path(data['output_path']) if data.get('output_path') else None,
-            annotated_video_path=Path(data['annotated_video_path']) if data.get('annotated_video_path') else None
+            annotated_video_path=Path(data['annotated_video_path']) if data.get('annotated_video_path') else None,
+            tracks=tracks,
+            annotated_clip_paths=[Path(path) for path in data.get('annotated_clip_paths', [])]
         )
         
-        return detection_result
\ No newline at end of file
+        return detection_result
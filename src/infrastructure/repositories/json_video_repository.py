@@ -1,12 +1,12 @@
-import json
 import asyncio
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Mapping, Optional
 from pathlib import Path
 from datetime import datetime
 import logging
 
 from ...domain.entities.video import Video, VideoStatus, VideoFormat, VideoMetadata
 from ...domain.repositories.video_repository import VideoRepository
+from .jsonl_log import JsonLinesLog
 
 
 class JsonVideoRepository(VideoRepository):
@@ -14,22 +14,20 @@ class JsonVideoRepository(VideoRepository):
     
     def __init__(self, storage_path: Path):
         self._storage_path = storage_path
-        self._videos_file = storage_path / "videos.json"
         self._logger = logging.getLogger(__name__)
         
-        # Asegurar que el directorio existe
-        storage_path.mkdir(parents=True, exist_ok=True)
+        # Log de solo anexado; el documento videos.json anterior se migra al crearlo
+        self._log = JsonLinesLog(storage_path / "videos.jsonl", legacy_path=storage_path / "videos.json")
         
-        # Inicializar archivo si no existe
-        if not self._videos_file.exists():
-            self._save_data({})
+        # Serializa las escrituras del proceso; el log añade el bloqueo entre procesos
+        self._write_lock = asyncio.Lock()
     
     async def save(self, video: Video) -> Video:
         """Guarda un video en el repositorio."""
         try:
-            data = await self._load_data()
-            data[video.id] = self._video_to_dict(video)
-            await self._save_data(data)
+            record = self._video_to_dict(video)
+            async with self._write_lock:
+                await self._run(self._log.put, video.id, record)
             
             self._logger.info(f"Video guardado: {video.id} - {video.name}")
             return video
@@ -41,8 +39,7 @@ class JsonVideoRepository(VideoRepository):
     async def find_by_id(self, video_id: str) -> Optional[Video]:
         """Busca un video por su ID."""
         try:
-            data = await self._load_data()
-            video_data = data.get(video_id)
+            video_data = await self._run(self._log.get, video_id)
             
             if video_data:
                 return self._dict_to_video(video_data)
@@ -84,13 +81,14 @@ class JsonVideoRepository(VideoRepository):
             return []
     
     async def find_by_status(self, status: str) -> List[Video]:
-        """Busca videos por su estado."""
+        """Busca videos por su estado (valor de VideoStatus o el propio miembro del Enum)."""
         try:
+            status_value = VideoStatus(status).value
             data = await self._load_data()
             videos = []
             
             for video_data in data.values():
-                if video_data['status'] == status:
+                if video_data['status'] == status_value:
                     video = self._dict_to_video(video_data)
                     videos.append(video)
             
@@ -103,14 +101,13 @@ class JsonVideoRepository(VideoRepository):
     async def update(self, video: Video) -> Video:
         """Actualiza un video existente."""
         try:
-            data = await self._load_data()
+            record = self._video_to_dict(video)
+            async with self._write_lock:
+                updated = await self._run(self._log.replace, video.id, record)
             
-            if video.id not in data:
+            if not updated:
                 raise ValueError(f"Video no encontrado: {video.id}")
             
-            data[video.id] = self._video_to_dict(video)
-            await self._save_data(data)
-            
             self._logger.info(f"Video actualizado: {video.id} - {video.name}")
             return video
             
@@ -121,15 +118,12 @@ class JsonVideoRepository(VideoRepository):
     async def delete(self, video_id: str) -> bool:
         """Elimina un video del repositorio."""
         try:
-            data = await self._load_data()
+            async with self._write_lock:
+                deleted = await self._run(self._log.delete, video_id)
             
-            if video_id in data:
-                del data[video_id]
-                await self._save_data(data)
+            if deleted:
                 self._logger.info(f"Video eliminado: {video_id}")
-                return True
-            
-            return False
+            return deleted
             
         except Exception as e:
             self._logger.error(f"Error al eliminar video {video_id}: {e}")
@@ -138,25 +132,20 @@ class JsonVideoRepository(VideoRepository):
     async def exists(self, video_id: str) -> bool:
         """Verifica si existe un video con el ID dado."""
         try:
-            data = await self._load_data()
-            return video_id in data
+            return await self._run(self._log.contains, video_id)
             
         except Exception as e:
             self._logger.error(f"Error al verificar existencia del video {video_id}: {e}")
             return False
     
-    async def _load_data(self) -> Dict[str, Any]:
-        """Carga datos del archivo JSON."""
-        try:
-            with open(self._videos_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+    async def _load_data(self) -> Dict[str, Mapping[str, Any]]:
+        """Carga el estado actual del log (desde la caché si el archivo no cambió)."""
+        return await self._run(self._log.load)
     
-    async def _save_data(self, data: Dict[str, Any]) -> None:
-        """Guarda datos en el archivo JSON."""
-        with open(self._videos_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    async def _run(self, operation: Callable[..., Any], *args: Any) -> Any:
+        """Ejecuta una operación bloqueante sobre el log en el executor por defecto."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, operation, *args)
     
     def _video_to_dict(self, video: Video) -> Dict[str, Any]:
         """Convierte un objeto Video a diccionario."""
@@ -0,0 +1,361 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Set, Tuple, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# Operaciones de un registro del log
+PUT = "put"
+DELETE = "delete"
+
+T = TypeVar("T")
+
+
+def _json_default(value: Any) -> Any:
+    """Serializa los registros congelados de la caché; el resto de valores se guarda como texto."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+def _encode(record: Any) -> str:
+    """Texto JSON compacto de un registro (los valores no serializables se guardan como texto)."""
+    return json.dumps(record, ensure_ascii=False, default=_json_default, separators=(',', ':'))
+
+
+def _freeze(value: Any) -> Any:
+    """Copia inmutable de un valor JSON decodificado: objetos de solo lectura y listas como tuplas."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _put_line(record_id: str, text: str) -> str:
+    """Línea de log de un ``put`` a partir del JSON ya codificado del registro."""
+    return f'{{"op":"{PUT}","id":{json.dumps(record_id, ensure_ascii=False)},"data":{text}}}'
+
+
+class FileLock:
+    """Bloqueo entre procesos, compartido o exclusivo, sobre un archivo auxiliar.
+
+    Varios procesos pueden tener a la vez el bloqueo compartido (lectores); el
+    exclusivo (escritores) excluye a todos los demás. En Windows ``msvcrt`` solo
+    ofrece bloqueo exclusivo y el compartido se comporta como tal.
+
+    Es reentrante dentro del proceso: los hilos se serializan con un RLock y
+    solo la adquisición más externa toma el bloqueo del sistema operativo. Una
+    adquisición anidada no puede pasar de compartido a exclusivo.
+    """
+
+    def __init__(self, lock_path: Path):
+        self._lock_path = lock_path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._shared = False
+        self._handle = None
+
+    @contextmanager
+    def acquire(self, shared: bool = False) -> Iterator[None]:
+        """Mantiene el bloqueo mientras dura el bloque ``with``."""
+        with self._thread_lock:
+            if self._depth == 0:
+                self._handle = open(self._lock_path, 'a+b')
+                try:
+                    self._lock_file(self._handle, shared)
+                except BaseException:
+                    self._handle.close()
+                    self._handle = None
+                    raise
+                self._shared = shared
+            elif self._shared and not shared:
+                raise RuntimeError("No se puede pasar de bloqueo compartido a exclusivo en una adquisición anidada")
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._unlock_file(self._handle)
+                    self._handle.close()
+                    self._handle = None
+
+    @staticmethod
+    def _lock_file(handle, shared: bool) -> None:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+
+    @staticmethod
+    def _unlock_file(handle) -> None:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class JsonLinesLog:
+    """Almacén clave-valor sobre un log JSON Lines de solo anexado.
+
+    Cada ``put``/``delete`` añade una línea con el registro completo, de modo que
+    el coste de una escritura depende del tamaño del registro y no del historial.
+    El estado se obtiene reproduciendo el log; cuando las líneas obsoletas superan
+    ``compaction_ratio`` veces a los registros vivos (y hay al menos
+    ``min_compaction_records`` líneas), el log se reescribe solo con los vivos.
+
+    El estado reproducido se guarda en memoria junto con la firma del archivo
+    (mtime, tamaño e inodo): mientras no cambie, ``load`` no vuelve a leer ni a
+    reproducir el log. Las escrituras propias actualizan la caché además del disco;
+    las de otros procesos cambian la firma y fuerzan la relectura. La caché guarda
+    cada registro vivo ya decodificado e inmutable (objetos de solo lectura y listas
+    como tuplas), así que las lecturas no vuelven a pasar por el parser JSON y
+    ``get``/``contains`` consultan un único registro. Modificar un registro después
+    de guardarlo no altera la caché.
+
+    Varios procesos (p. ej. workers de Uvicorn) pueden compartir el mismo log
+    gracias a un bloqueo de archivo (``<log>.lock``): la comprobación de la caché
+    y la reproducción del log se hacen con el bloqueo compartido, de modo que los
+    lectores no se esperan entre sí; anexados, truncado de una cola incompleta y
+    compactaciones toman el exclusivo. Las compactaciones escriben un archivo
+    temporal y lo sustituyen con ``os.replace``: el log nunca queda a medio
+    reescribir.
+    """
+
+    def __init__(
+        self,
+        log_path: Path,
+        legacy_path: Optional[Path] = None,
+        compaction_ratio: float = 2.0,
+        min_compaction_records: int = 1000
+    ):
+        self._log_path = log_path
+        self._compaction_ratio = compaction_ratio
+        self._min_compaction_records = min_compaction_records
+        self._logger = logging.getLogger(__name__)
+
+        # Líneas del log e IDs vivos; se conocen tras la primera lectura
+        self._record_count = 0
+        self._live_ids: Optional[Set[str]] = None
+
+        # Caché del estado reproducido (id -> registro congelado) y firma del archivo con la que se obtuvo
+        self._cache: Optional[Dict[str, Mapping[str, Any]]] = None
+        self._cache_signature: Optional[Tuple[int, int, int]] = None
+
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file_lock = FileLock(log_path.with_name(f"{log_path.name}.lock"))
+
+        if not log_path.exists():
+            with self._file_lock.acquire():
+                # Otro proceso pudo crearlo mientras se esperaba el bloqueo
+                if not log_path.exists():
+                    # Migrar el documento JSON anterior (id -> registro), si existe
+                    legacy_data = self._read_legacy(legacy_path) if legacy_path else {}
+                    self._rewrite({record_id: _freeze(record) for record_id, record in legacy_data.items()})
+                    if legacy_data:
+                        self._logger.info(f"Migrados {len(legacy_data)} registros de {legacy_path} a {log_path}")
+
+    @property
+    def path(self) -> Path:
+        """Ruta del archivo de log."""
+        return self._log_path
+
+    def load(self) -> Dict[str, Mapping[str, Any]]:
+        """Devuelve el estado actual (id -> registro de solo lectura), desde la caché si el log no cambió."""
+        return self._read(dict)
+
+    def get(self, record_id: str) -> Optional[Mapping[str, Any]]:
+        """Devuelve un registro de solo lectura, o None si no existe."""
+        return self._read(lambda cache: cache.get(record_id))
+
+    def contains(self, record_id: str) -> bool:
+        """Indica si existe un registro con el ID dado."""
+        return self._read(lambda cache: record_id in cache)
+
+    def put(self, record_id: str, record: Dict[str, Any]) -> None:
+        """Añade (o reemplaza) un registro."""
+        with self._file_lock.acquire():
+            self._put_locked(record_id, record)
+
+    def replace(self, record_id: str, record: Dict[str, Any]) -> bool:
+        """Reemplaza un registro existente; devuelve False (sin escribir) si no existe."""
+        with self._file_lock.acquire():
+            if record_id not in self._load_locked():
+                return False
+            self._put_locked(record_id, record)
+            return True
+
+    def delete(self, record_id: str) -> bool:
+        """Marca un registro como eliminado; devuelve False (sin escribir) si no existe."""
+        with self._file_lock.acquire():
+            if record_id not in self._load_locked():
+                return False
+
+            self._append(_encode({'op': DELETE, 'id': record_id}))
+            self._live_ids.discard(record_id)
+            # La caché se acaba de validar en _load_locked
+            self._cache.pop(record_id, None)
+            self._cache_signature = self._signature()
+
+            if self._needs_compaction():
+                self._rewrite(self._replay())
+            return True
+
+    def compact(self) -> None:
+        """Reescribe el log dejando una línea por registro vivo."""
+        with self._file_lock.acquire():
+            self._rewrite(self._replay())
+
+    def _read(self, reader: Callable[[Dict[str, Mapping[str, Any]]], T]) -> T:
+        """Aplica ``reader`` a la caché actualizada, sin exponer el diccionario interno."""
+        with self._file_lock.acquire(shared=True):
+            if self._cache_is_fresh():
+                return reader(self._cache)
+            # Con el bloqueo compartido ningún escritor está anexando: una cola
+            # incompleta es de un proceso que terminó a medias y se trunca más abajo
+            data = self._replay(truncate=False)
+            if data is not None and not self._needs_compaction():
+                self._remember(data)
+                return reader(self._cache)
+
+        # Truncar o compactar modifica el archivo: repetir con el bloqueo exclusivo
+        with self._file_lock.acquire():
+            return reader(self._load_locked())
+
+    def _load_locked(self) -> Dict[str, Mapping[str, Any]]:
+        if not self._cache_is_fresh():
+            data = self._replay()
+            if self._needs_compaction():
+                self._rewrite(data)
+            else:
+                self._remember(data)
+        return self._cache
+
+    def _put_locked(self, record_id: str, record: Dict[str, Any]) -> None:
+        cache_fresh = self._cache_is_fresh()
+        text = _encode(record)
+        self._append(_put_line(record_id, text))
+        if self._live_ids is not None:
+            self._live_ids.add(record_id)
+        if cache_fresh:
+            # Se decodifica el texto escrito para que la caché coincida con una relectura del log
+            self._cache[record_id] = _freeze(json.loads(text))
+            self._cache_signature = self._signature()
+        else:
+            self._cache = None
+
+        if self._needs_compaction():
+            self._rewrite(self._replay())
+
+    def _replay(self, truncate: bool = True) -> Optional[Dict[str, Mapping[str, Any]]]:
+        """Lee el log completo aplicando sus registros en orden (id -> registro congelado).
+
+        Si el log termina en una línea incompleta, la trunca (requiere el bloqueo
+        exclusivo) o, con ``truncate=False``, devuelve None sin modificar nada.
+        """
+        data: Dict[str, Mapping[str, Any]] = {}
+        record_count = 0
+        valid_end = 0
+
+        with open(self._log_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Última línea a medio escribir (p. ej. el proceso terminó durante el anexado)
+                    break
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Cuenta como línea obsoleta: la siguiente compactación la elimina
+                    self._logger.warning(f"Registro ilegible ignorado en {self._log_path} (byte {valid_end})")
+                    valid_end += len(line)
+                    record_count += 1
+                    continue
+
+                valid_end += len(line)
+                record_count += 1
+                if record['op'] == PUT:
+                    data[record['id']] = _freeze(record['data'])
+                else:
+                    data.pop(record['id'], None)
+
+        if valid_end < self._log_path.stat().st_size:
+            if not truncate:
+                return None
+            # Descartar la cola incompleta para que el siguiente anexado empiece en una línea nueva.
+            # Es seguro bajo el bloqueo exclusivo: ningún otro proceso puede estar leyendo ni anexando.
+            self._logger.warning(f"Descartando registro incompleto al final de {self._log_path}")
+            with open(self._log_path, 'r+b') as f:
+                f.truncate(valid_end)
+
+        self._record_count = record_count
+        self._live_ids = set(data)
+        return data
+
+    def _append(self, line: str) -> None:
+        """Anexa una línea al final del log."""
+        with open(self._log_path, 'a', encoding='utf-8') as f:
+            f.write(line + "\n")
+        self._record_count += 1
+
+    def _needs_compaction(self) -> bool:
+        """Indica si las líneas obsoletas justifican reescribir el log."""
+        if self._live_ids is None or self._record_count < self._min_compaction_records:
+            return False
+        return self._record_count > self._compaction_ratio * max(len(self._live_ids), 1)
+
+    def _rewrite(self, data: Dict[str, Mapping[str, Any]]) -> None:
+        """Escribe un log nuevo con ``data`` (id -> registro) y lo sustituye de forma atómica."""
+        fd, tmp_name = tempfile.mkstemp(dir=self._log_path.parent, prefix=f".{self._log_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for record_id, record in data.items():
+                    f.write(_put_line(record_id, _encode(record)) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, self._log_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        self._record_count = len(data)
+        self._live_ids = set(data)
+        self._remember(data)
+
+    def _signature(self) -> Tuple[int, int, int]:
+        """Firma del archivo de log: cambia con cada anexado o reescritura."""
+        stat = os.stat(self._log_path)
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _cache_is_fresh(self) -> bool:
+        """Indica si la caché refleja el archivo tal como está ahora."""
+        return self._cache is not None and self._signature() == self._cache_signature
+
+    def _remember(self, data: Dict[str, Mapping[str, Any]]) -> None:
+        """Guarda en caché el estado y la firma actual del archivo."""
+        self._cache = dict(data)
+        self._cache_signature = self._signature()
+
+    def _read_legacy(self, legacy_path: Path) -> Dict[str, Any]:
+        """Lee el documento JSON del formato anterior."""
+        if not legacy_path.is_file():
+            return {}
+        try:
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            self._logger.warning(f"No se pudo migrar {legacy_path}: JSON inválido")
+            return {}
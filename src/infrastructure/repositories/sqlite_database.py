@@ -0,0 +1,124 @@
+import asyncio
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+# Esquema normalizado: un video tiene resultados de detección y cada resultado sus daños.
+# Las estadísticas y los tracks se guardan como JSON: se leen siempre junto a su resultado.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    metadata TEXT,
+    processed_at TEXT,
+    processing_time REAL,
+    error_message TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_videos_status ON videos(status);
+CREATE INDEX IF NOT EXISTS idx_videos_file_path ON videos(file_path);
+
+CREATE TABLE IF NOT EXISTS detection_results (
+    id TEXT PRIMARY KEY,
+    video_id TEXT NOT NULL REFERENCES videos(id) ON DELETE CASCADE,
+    created_at TEXT NOT NULL,
+    model_version TEXT NOT NULL,
+    confidence_threshold REAL NOT NULL,
+    damage_count INTEGER NOT NULL,
+    processing_time REAL NOT NULL,
+    statistics TEXT NOT NULL,
+    tracks TEXT NOT NULL,
+    output_path TEXT,
+    annotated_video_path TEXT,
+    annotated_clip_paths TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_detection_results_video_id ON detection_results(video_id);
+CREATE INDEX IF NOT EXISTS idx_detection_results_created_at ON detection_results(created_at);
+
+-- damage_id sin tipo declarado: conserva ids enteros (secuenciales) y de texto (UUID)
+CREATE TABLE IF NOT EXISTS damages (
+    result_id TEXT NOT NULL REFERENCES detection_results(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    damage_id,
+    damage_type TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    x1 REAL NOT NULL,
+    y1 REAL NOT NULL,
+    x2 REAL NOT NULL,
+    y2 REAL NOT NULL,
+    frame_number INTEGER NOT NULL,
+    timestamp REAL NOT NULL,
+    PRIMARY KEY (result_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_damages_damage_type ON damages(damage_type, result_id);
+CREATE INDEX IF NOT EXISTS idx_damages_severity ON damages(severity, result_id);
+"""
+
+
+class SqliteDatabase:
+    """Base de datos SQLite compartida por los repositorios.
+
+    Cada hilo usa su propia conexión, creada la primera vez y reutilizada después
+    (los hilos del executor forman así el pool de conexiones). Con WAL los
+    lectores no bloquean al escritor, y ``busy_timeout`` hace esperar a los
+    escritores concurrentes en lugar de fallar.
+    """
+
+    def __init__(self, db_path: Path, busy_timeout_ms: int = 5000):
+        self._db_path = db_path
+        self._busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection().executescript(SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        """Ruta del archivo de base de datos."""
+        return self._db_path
+
+    def connection(self) -> sqlite3.Connection:
+        """Conexión del hilo actual."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(str(self._db_path), check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            connection.execute(f"PRAGMA busy_timeout={self._busy_timeout_ms}")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Transacción en la conexión del hilo actual: commit al salir o rollback si falla."""
+        connection = self.connection()
+        with connection:
+            yield connection
+
+    async def run(self, operation: Callable[..., T], *args: Any) -> T:
+        """Ejecuta una operación bloqueante sobre la base de datos en el executor por defecto."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, operation, *args)
+
+    def close(self) -> None:
+        """Cierra todas las conexiones abiertas."""
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
@@ -0,0 +1,350 @@
+import json
+import sqlite3
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+from pathlib import Path
+from datetime import datetime
+import logging
+
+import numpy as np
+
+from ...domain.entities.damage import Damage
+from ...domain.entities.detection_result import DetectionResult
+from ...domain.entities.damage_columns import DAMAGE_SEVERITIES, DAMAGE_TYPES, DamageColumns
+from ...domain.repositories.detection_repository import DetectionRepository
+from .detection_serialization import (
+    dict_to_statistics,
+    dict_to_track,
+    metadata_to_dict,
+    statistics_to_dict,
+    track_to_dict
+)
+from .sqlite_database import SqliteDatabase
+from .sqlite_video_repository import row_to_video
+
+
+# Códigos de columna a partir de los valores guardados en la base de datos
+_TYPE_CODES = {damage_type.value: code for code, damage_type in enumerate(DAMAGE_TYPES)}
+_SEVERITY_CODES = {severity.value: code for code, severity in enumerate(DAMAGE_SEVERITIES)}
+
+_RESULT_COLUMNS = """
+    r.id, r.created_at, r.model_version, r.confidence_threshold, r.statistics, r.tracks,
+    r.output_path, r.annotated_video_path, r.annotated_clip_paths,
+    v.id AS video_id, v.name AS video_name, v.file_path AS video_file_path, v.status AS video_status,
+    v.created_at AS video_created_at, v.metadata AS video_metadata, v.processed_at AS video_processed_at,
+    v.processing_time AS video_processing_time, v.error_message AS video_error_message,
+    v.updated_at AS video_updated_at
+"""
+
+
+def _timestamp(value: datetime) -> str:
+    """Fecha ISO con precisión fija, para que el orden de texto coincida con el cronológico."""
+    return value.isoformat(timespec="microseconds")
+
+
+class SqliteDetectionRepository(DetectionRepository):
+    """Implementación del repositorio de detecciones usando SQLite.
+
+    Los resultados, sus videos y sus daños viven en tablas normalizadas con
+    índices por video, fecha, tipo y severidad de daño, de modo que las
+    búsquedas puntuales no recorren todo el historial.
+    """
+
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+        self._logger = logging.getLogger(__name__)
+
+    async def save(self, detection_result: DetectionResult) -> DetectionResult:
+        """Guarda un resultado de detección."""
+        try:
+            await self._db.run(self._save_sync, detection_result)
+
+            self._logger.info(f"Resultado de detección guardado: {detection_result.id}")
+            return detection_result
+
+        except Exception as e:
+            self._logger.error(f"Error al guardar detección {detection_result.id}: {e}")
+            raise e
+
+    async def find_by_id(self, result_id: str) -> Optional[DetectionResult]:
+        """Busca un resultado por su ID."""
+        try:
+            results = await self._db.run(self._select, "WHERE r.id = ?", (result_id,))
+            return results[0] if results else None
+
+        except Exception as e:
+            self._logger.error(f"Error al buscar detección {result_id}: {e}")
+            return None
+
+    async def find_by_video_id(self, video_id: str) -> List[DetectionResult]:
+        """Busca resultados por ID de video."""
+        try:
+            return await self._db.run(self._select, "WHERE r.video_id = ?", (video_id,))
+
+        except Exception as e:
+            self._logger.error(f"Error al buscar detecciones por video {video_id}: {e}")
+            return []
+
+    async def find_all(self) -> List[DetectionResult]:
+        """Obtiene todos los resultados de detección."""
+        try:
+            return await self._db.run(self._select, "", ())
+
+        except Exception as e:
+            self._logger.error(f"Error al obtener todas las detecciones: {e}")
+            return []
+
+    async def find_by_date_range(self, start_date: datetime, end_date: datetime) -> List[DetectionResult]:
+        """Busca resultados en un rango de fechas."""
+        try:
+            return await self._db.run(
+                self._select,
+                "WHERE r.created_at BETWEEN ? AND ?",
+                (_timestamp(start_date), _timestamp(end_date))
+            )
+
+        except Exception as e:
+            self._logger.error(f"Error al buscar detecciones por rango de fechas: {e}")
+            return []
+
+    async def find_with_damages(self) -> List[DetectionResult]:
+        """Busca resultados que contengan daños detectados."""
+        try:
+            return await self._db.run(self._select, "WHERE r.damage_count > 0", ())
+
+        except Exception as e:
+            self._logger.error(f"Error al buscar detecciones con daños: {e}")
+            return []
+
+    async def find_by_damage_type(self, damage_type: str) -> List[DetectionResult]:
+        """Busca resultados que contengan un tipo específico de daño."""
+        try:
+            return await self._db.run(
+                self._select,
+                "WHERE r.id IN (SELECT DISTINCT result_id FROM damages WHERE damage_type = ?)",
+                (damage_type,)
+            )
+
+        except Exception as e:
+            self._logger.error(f"Error al buscar detecciones por tipo de daño {damage_type}: {e}")
+            return []
+
+    async def update(self, detection_result: DetectionResult) -> DetectionResult:
+        """Actualiza un resultado de detección."""
+        try:
+            if not await self.exists(detection_result.id):
+                raise ValueError(f"Resultado de detección no encontrado: {detection_result.id}")
+
+            await self._db.run(self._save_sync, detection_result)
+
+            self._logger.info(f"Resultado de detección actualizado: {detection_result.id}")
+            return detection_result
+
+        except Exception as e:
+            self._logger.error(f"Error al actualizar detección {detection_result.id}: {e}")
+            raise e
+
+    async def delete(self, result_id: str) -> bool:
+        """Elimina un resultado de detección."""
+        try:
+            deleted = await self._db.run(self._delete_sync, result_id)
+            if deleted:
+                self._logger.info(f"Resultado de detección eliminado: {result_id}")
+            return deleted
+
+        except Exception as e:
+            self._logger.error(f"Error al eliminar detección {result_id}: {e}")
+            return False
+
+    async def get_statistics(self) -> Dict[str, any]:
+        """Obtiene estadísticas generales de detecciones."""
+        try:
+            return await self._db.run(self._statistics_sync)
+
+        except Exception as e:
+            self._logger.error(f"Error al obtener estadísticas: {e}")
+            return {}
+
+    async def exists(self, result_id: str) -> bool:
+        """Verifica si existe un resultado con el ID dado."""
+        try:
+            return await self._db.run(self._exists_sync, result_id)
+
+        except Exception as e:
+            self._logger.error(f"Error al verificar existencia de detección {result_id}: {e}")
+            return False
+
+    def _save_sync(self, detection: DetectionResult) -> None:
+        """Inserta o reemplaza un resultado, su video y sus daños en una transacción."""
+        video = detection.video
+        with self._db.transaction() as connection:
+            connection.execute(
+                """
+                INSERT INTO videos (id, name, file_path, status, created_at, metadata)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    name = excluded.name,
+                    file_path = excluded.file_path,
+                    status = excluded.status,
+                    metadata = excluded.metadata
+                """,
+                (
+                    video.id, video.name, str(video.file_path), video.status.value,
+                    _timestamp(video.created_at), json.dumps(metadata_to_dict(video.metadata))
+                )
+            )
+            connection.execute(
+                """
+                INSERT INTO detection_results (
+                    id, video_id, created_at, model_version, confidence_threshold, damage_count,
+                    processing_time, statistics, tracks, output_path, annotated_video_path, annotated_clip_paths
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    video_id = excluded.video_id,
+                    created_at = excluded.created_at,
+                    model_version = excluded.model_version,
+                    confidence_threshold = excluded.confidence_threshold,
+                    damage_count = excluded.damage_count,
+                    processing_time = excluded.processing_time,
+                    statistics = excluded.statistics,
+                    tracks = excluded.tracks,
+                    output_path = excluded.output_path,
+                    annotated_video_path = excluded.annotated_video_path,
+                    annotated_clip_paths = excluded.annotated_clip_paths
+                """,
+                (
+                    detection.id,
+                    video.id,
+                    _timestamp(detection.created_at),
+                    detection.model_version,
+                    detection.confidence_threshold,
+                    len(detection.damages),
+                    detection.statistics.processing_time,
+                    json.dumps(statistics_to_dict(detection.statistics), default=str),
+                    json.dumps([track_to_dict(track) for track in detection.tracks]),
+                    str(detection.output_path) if detection.output_path else None,
+                    str(detection.annotated_video_path) if detection.annotated_video_path else None,
+                    json.dumps([str(path) for path in detection.annotated_clip_paths])
+                )
+            )
+            connection.execute("DELETE FROM damages WHERE result_id = ?", (detection.id,))
+            connection.executemany(
+                """
+                INSERT INTO damages (
+                    result_id, position, damage_id, damage_type, severity, confidence,
+                    x1, y1, x2, y2, frame_number, timestamp
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                self._damage_rows(detection.id, detection.damages)
+            )
+
+    def _damage_rows(self, result_id: str, damages: Sequence[Damage]):
+        """Filas de la tabla de daños, leídas directamente de las columnas."""
+        # Los daños pueden haberse reasignado como lista tras construir el resultado
+        damages = DamageColumns.from_damages(damages)
+        ids = damages.ids.tolist() if damages.ids is not None else range(len(damages))
+        for position, (damage_id, type_code, severity_code, confidence, box, frame_number, timestamp) in enumerate(
+            zip(
+                ids,
+                damages.type_codes.tolist(),
+                damages.severity_codes.tolist(),
+                damages.confidences.tolist(),
+                damages.boxes.tolist(),
+                damages.frame_numbers.tolist(),
+                damages.timestamps.tolist()
+            )
+        ):
+            yield (
+                result_id, position, damage_id, DAMAGE_TYPES[type_code].value,
+                DAMAGE_SEVERITIES[severity_code].value, confidence, *box, frame_number, timestamp
+            )
+
+    def _select(self, where: str, params: Tuple) -> List[DetectionResult]:
+        """Carga los resultados que cumplen la condición, en orden de creación."""
+        connection = self._db.connection()
+        rows = connection.execute(
+            f"SELECT {_RESULT_COLUMNS} FROM detection_results r "
+            f"JOIN videos v ON v.id = r.video_id {where} ORDER BY r.created_at",
+            params
+        ).fetchall()
+        return [self._row_to_detection(connection, row) for row in rows]
+
+    def _delete_sync(self, result_id: str) -> bool:
+        """Elimina un resultado; sus daños se borran en cascada."""
+        with self._db.transaction() as connection:
+            cursor = connection.execute("DELETE FROM detection_results WHERE id = ?", (result_id,))
+            return cursor.rowcount > 0
+
+    def _exists_sync(self, result_id: str) -> bool:
+        """Consulta puntual por clave primaria."""
+        row = self._db.connection().execute(
+            "SELECT 1 FROM detection_results WHERE id = ?", (result_id,)
+        ).fetchone()
+        return row is not None
+
+    def _statistics_sync(self) -> Dict[str, Any]:
+        """Agregados calculados por la base de datos."""
+        connection = self._db.connection()
+        total_detections, total_damages, total_processing_time = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(damage_count), 0), COALESCE(SUM(processing_time), 0.0) "
+            "FROM detection_results"
+        ).fetchone()
+        damages_by_type = dict(connection.execute(
+            "SELECT damage_type, COUNT(*) FROM damages GROUP BY damage_type"
+        ).fetchall())
+        damages_by_severity = dict(connection.execute(
+            "SELECT severity, COUNT(*) FROM damages GROUP BY severity"
+        ).fetchall())
+
+        return {
+            'total_detections': total_detections,
+            'total_damages': total_damages,
+            'average_damages_per_detection': total_damages / total_detections if total_detections > 0 else 0,
+            'total_processing_time': total_processing_time,
+            'average_processing_time': total_processing_time / total_detections if total_detections > 0 else 0,
+            'damages_by_type': damages_by_type,
+            'damages_by_severity': damages_by_severity
+        }
+
+    def _row_to_detection(self, connection: sqlite3.Connection, row: sqlite3.Row) -> DetectionResult:
+        """Convierte una fila (resultado + video) y sus daños a DetectionResult."""
+        video = row_to_video(row, prefix="video_")
+        tracks = [dict_to_track(track_data) for track_data in json.loads(row['tracks'])]
+
+        return DetectionResult(
+            id=row['id'],
+            video=video,
+            damages=self._load_damages(connection, row['id']),
+            statistics=dict_to_statistics(json.loads(row['statistics']), default_total_tracks=len(tracks)),
+            created_at=datetime.fromisoformat(row['created_at']),
+            model_version=row['model_version'],
+            confidence_threshold=row['confidence_threshold'],
+            output_path=Path(row['output_path']) if row['output_path'] else None,
+            annotated_video_path=Path(row['annotated_video_path']) if row['annotated_video_path'] else None,
+            tracks=tracks,
+            annotated_clip_paths=[Path(path) for path in json.loads(row['annotated_clip_paths'])]
+        )
+
+    def _load_damages(self, connection: sqlite3.Connection, result_id: str) -> DamageColumns:
+        """Lee los daños de un resultado directamente a columnas."""
+        cursor = connection.cursor()
+        cursor.row_factory = None
+        rows = cursor.execute(
+            "SELECT damage_id, damage_type, severity, confidence, x1, y1, x2, y2, frame_number, timestamp "
+            "FROM damages WHERE result_id = ? ORDER BY position",
+            (result_id,)
+        ).fetchall()
+        if not rows:
+            return DamageColumns.empty()
+
+        ids, damage_types, severities, confidences, x1, y1, x2, y2, frame_numbers, timestamps = zip(*rows)
+        return DamageColumns(
+            frame_numbers=frame_numbers,
+            timestamps=timestamps,
+            type_codes=[_TYPE_CODES[damage_type] for damage_type in damage_types],
+            severity_codes=[_SEVERITY_CODES[severity] for severity in severities],
+            confidences=confidences,
+            boxes=np.column_stack([x1, y1, x2, y2]),
+            ids=list(ids)
+        )
@@ -0,0 +1,212 @@
+import json
+import sqlite3
+from typing import List, Optional
+from pathlib import Path
+from datetime import datetime
+import logging
+
+from ...domain.entities.video import Video, VideoStatus
+from ...domain.repositories.video_repository import VideoRepository
+from .detection_serialization import dict_to_metadata, metadata_to_dict
+from .sqlite_database import SqliteDatabase
+
+
+_VIDEO_COLUMNS = (
+    "id, name, file_path, status, created_at, metadata, processed_at, processing_time, error_message, updated_at"
+)
+
+
+def _optional_timestamp(value: Optional[datetime]) -> Optional[str]:
+    """Fecha ISO con precisión fija (None si no hay fecha)."""
+    return value.isoformat(timespec="microseconds") if value else None
+
+
+def row_to_video(row: sqlite3.Row, prefix: str = "") -> Video:
+    """Reconstruye un Video desde una fila de la tabla ``videos``.
+
+    ``prefix`` permite leer las columnas con alias (p. ej. ``video_``) de una
+    consulta con JOIN. El archivo no se vuelve a comprobar en disco.
+    """
+    metadata = row[f"{prefix}metadata"]
+    processed_at = row[f"{prefix}processed_at"]
+    updated_at = row[f"{prefix}updated_at"]
+    return Video(
+        id=row[f"{prefix}id"],
+        name=row[f"{prefix}name"],
+        file_path=Path(row[f"{prefix}file_path"]),
+        status=VideoStatus(row[f"{prefix}status"]),
+        created_at=datetime.fromisoformat(row[f"{prefix}created_at"]),
+        metadata=dict_to_metadata(json.loads(metadata) if metadata else None),
+        processed_at=datetime.fromisoformat(processed_at) if processed_at else None,
+        processing_time=row[f"{prefix}processing_time"],
+        error_message=row[f"{prefix}error_message"],
+        updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+        damages=[],  # Los daños se cargan con los resultados de detección
+        validate_file=False
+    )
+
+
+class SqliteVideoRepository(VideoRepository):
+    """Implementación del repositorio de videos usando SQLite.
+
+    Comparte la base de datos (y sus conexiones) con el repositorio de
+    detecciones; las búsquedas por ruta y por estado usan sus índices.
+    """
+
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+        self._logger = logging.getLogger(__name__)
+
+    async def save(self, video: Video) -> Video:
+        """Guarda un video en el repositorio."""
+        try:
+            await self._db.run(self._upsert_sync, video)
+
+            self._logger.info(f"Video guardado: {video.id} - {video.name}")
+            return video
+
+        except Exception as e:
+            self._logger.error(f"Error al guardar video {video.id}: {e}")
+            raise e
+
+    async def find_by_id(self, video_id: str) -> Optional[Video]:
+        """Busca un video por su ID."""
+        try:
+            videos = await self._db.run(self._select, "WHERE id = ?", (video_id,))
+            return videos[0] if videos else None
+
+        except Exception as e:
+            self._logger.error(f"Error al buscar video {video_id}: {e}")
+            return None
+
+    async def find_by_path(self, file_path: Path) -> Optional[Video]:
+        """Busca un video por su ruta de archivo (el registro más reciente si hay varios)."""
+        try:
+            videos = await self._db.run(
+                self._select, "WHERE file_path = ? ORDER BY created_at DESC LIMIT 1", (str(file_path),)
+            )
+            return videos[0] if videos else None
+
+        except Exception as e:
+            self._logger.error(f"Error al buscar video por ruta {file_path}: {e}")
+            return None
+
+    async def find_all(self) -> List[Video]:
+        """Obtiene todos los videos."""
+        try:
+            return await self._db.run(self._select, "ORDER BY created_at", ())
+
+        except Exception as e:
+            self._logger.error(f"Error al obtener todos los videos: {e}")
+            return []
+
+    async def find_by_status(self, status: str) -> List[Video]:
+        """Busca videos por su estado (valor de VideoStatus o el propio miembro del Enum)."""
+        try:
+            status_value = VideoStatus(status).value
+            return await self._db.run(self._select, "WHERE status = ? ORDER BY created_at", (status_value,))
+
+        except Exception as e:
+            self._logger.error(f"Error al buscar videos por estado {status}: {e}")
+            return []
+
+    async def update(self, video: Video) -> Video:
+        """Actualiza un video existente."""
+        try:
+            updated = await self._db.run(self._update_sync, video)
+            if not updated:
+                raise ValueError(f"Video no encontrado: {video.id}")
+
+            self._logger.info(f"Video actualizado: {video.id} - {video.name}")
+            return video
+
+        except Exception as e:
+            self._logger.error(f"Error al actualizar video {video.id}: {e}")
+            raise e
+
+    async def delete(self, video_id: str) -> bool:
+        """Elimina un video del repositorio (y en cascada sus resultados de detección)."""
+        try:
+            deleted = await self._db.run(self._delete_sync, video_id)
+            if deleted:
+                self._logger.info(f"Video eliminado: {video_id}")
+            return deleted
+
+        except Exception as e:
+            self._logger.error(f"Error al eliminar video {video_id}: {e}")
+            return False
+
+    async def exists(self, video_id: str) -> bool:
+        """Verifica si existe un video con el ID dado."""
+        try:
+            return await self._db.run(self._exists_sync, video_id)
+
+        except Exception as e:
+            self._logger.error(f"Error al verificar existencia del video {video_id}: {e}")
+            return False
+
+    def _values(self, video: Video) -> tuple:
+        """Valores de las columnas de ``videos`` en el orden de _VIDEO_COLUMNS."""
+        return (
+            video.id,
+            video.name,
+            str(video.file_path),
+            video.status.value,
+            video.created_at.isoformat(timespec="microseconds"),
+            json.dumps(metadata_to_dict(video.metadata)),
+            _optional_timestamp(video.processed_at),
+            video.processing_time,
+            video.error_message,
+            _optional_timestamp(video.updated_at)
+        )
+
+    def _upsert_sync(self, video: Video) -> None:
+        """Inserta el video o reemplaza todas sus columnas si ya existe."""
+        with self._db.transaction() as connection:
+            connection.execute(
+                f"""
+                INSERT INTO videos ({_VIDEO_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    name = excluded.name,
+                    file_path = excluded.file_path,
+                    status = excluded.status,
+                    created_at = excluded.created_at,
+                    metadata = excluded.metadata,
+                    processed_at = excluded.processed_at,
+                    processing_time = excluded.processing_time,
+                    error_message = excluded.error_message,
+                    updated_at = excluded.updated_at
+                """,
+                self._values(video)
+            )
+
+    def _update_sync(self, video: Video) -> bool:
+        """Actualiza un video existente; devuelve False si no existe."""
+        values = self._values(video)
+        with self._db.transaction() as connection:
+            cursor = connection.execute(
+                """
+                UPDATE videos SET
+                    name = ?, file_path = ?, status = ?, created_at = ?, metadata = ?,
+                    processed_at = ?, processing_time = ?, error_message = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (*values[1:], values[0])
+            )
+            return cursor.rowcount > 0
+
+    def _delete_sync(self, video_id: str) -> bool:
+        """Elimina un video por clave primaria."""
+        with self._db.transaction() as connection:
+            cursor = connection.execute("DELETE FROM videos WHERE id = ?", (video_id,))
+            return cursor.rowcount > 0
+
+    def _exists_sync(self, video_id: str) -> bool:
+        """Consulta puntual por clave primaria."""
+        row = self._db.connection().execute("SELECT 1 FROM videos WHERE id = ?", (video_id,)).fetchone()
+        return row is not None
+
+    def _select(self, clause: str, params: tuple) -> List[Video]:
+        """Carga los videos que cumplen la condición."""
+        rows = self._db.connection().execute(f"SELECT {_VIDEO_COLUMNS} FROM videos {clause}", params).fetchall()
+        return [row_to_video(row) for row in rows]
@@ -0,0 +1,82 @@
+import bisect
+from typing import Iterable, List, NamedTuple, Sequence
+
+
+class VideoSegment(NamedTuple):
+    """Rango de frames [start_frame, end_frame] (inclusive) de un video."""
+    start_frame: int
+    end_frame: int
+    annotated: bool = True
+
+    @property
+    def frame_count(self) -> int:
+        """Número de frames del segmento."""
+        return self.end_frame - self.start_frame + 1
+
+
+def damage_segments(
+    damaged_frames: Iterable[int],
+    fps: float,
+    total_frames: int,
+    padding_seconds: float = 1.0
+) -> List[VideoSegment]:
+    """Ventanas alrededor de los frames con daños, con ``padding_seconds`` a cada lado.
+
+    Las ventanas que se solapan o se tocan se fusionan en un único segmento.
+    """
+    padding = max(0, int(round(padding_seconds * fps))) if fps > 0 else 0
+    last_frame = total_frames - 1
+    segments: List[VideoSegment] = []
+
+    for frame_number in sorted(damaged_frames):
+        if frame_number > last_frame:
+            break
+        start = max(0, frame_number - padding)
+        end = min(last_frame, frame_number + padding)
+        if segments and start <= segments[-1].end_frame + 1:
+            segments[-1] = VideoSegment(segments[-1].start_frame, max(end, segments[-1].end_frame))
+        else:
+            segments.append(VideoSegment(start, end))
+
+    return segments
+
+
+def align_to_keyframes(
+    segments: Sequence[VideoSegment],
+    keyframes: Sequence[int],
+    total_frames: int
+) -> List[VideoSegment]:
+    """Extiende los segmentos a GOPs completos: de un keyframe al frame anterior al siguiente.
+
+    Así el resto del video empieza siempre en un keyframe y puede copiarse sin
+    recodificar. Los segmentos que pasan a solaparse se fusionan.
+    """
+    keyframes = sorted(set(keyframes) | {0})
+    aligned: List[VideoSegment] = []
+
+    for segment in segments:
+        start = keyframes[bisect.bisect_right(keyframes, segment.start_frame) - 1]
+        next_keyframe = bisect.bisect_right(keyframes, segment.end_frame)
+        end = keyframes[next_keyframe] - 1 if next_keyframe < len(keyframes) else total_frames - 1
+        if aligned and start <= aligned[-1].end_frame + 1:
+            aligned[-1] = VideoSegment(aligned[-1].start_frame, max(end, aligned[-1].end_frame))
+        else:
+            aligned.append(VideoSegment(start, end))
+
+    return aligned
+
+
+def split_timeline(segments: Sequence[VideoSegment], total_frames: int) -> List[VideoSegment]:
+    """Cubre todo el video: los segmentos anotados y, entre ellos, segmentos sin anotar."""
+    timeline: List[VideoSegment] = []
+    next_frame = 0
+
+    for segment in segments:
+        if segment.start_frame > next_frame:
+            timeline.append(VideoSegment(next_frame, segment.start_frame - 1, annotated=False))
+        timeline.append(VideoSegment(segment.start_frame, segment.end_frame, annotated=True))
+        next_frame = segment.end_frame + 1
+
+    if next_frame < total_frames:
+        timeline.append(VideoSegment(next_frame, total_frames - 1, annotated=False))
+    return timeline
@@ -0,0 +1,243 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+# Encoders que producen el mismo códec que el video original, para poder concatenar
+# los segmentos recodificados con los copiados sin volver a codificar
+SEGMENT_ENCODERS = {
+    "h264": "libx264",
+    "hevc": "libx265",
+    "mpeg4": "mpeg4"
+}
+
+# Los tramos copiados y los recodificados tienen parámetros de secuencia distintos (SPS/PPS,
+# VOL): cada tramo los lleva dentro del stream en sus keyframes y no solo en la cabecera
+COPY_BITSTREAM_FILTERS = {
+    "h264": "h264_mp4toannexb",
+    "hevc": "hevc_mp4toannexb",
+    "mpeg4": "dump_extra"
+}
+
+# Etiquetas MP4 que permiten parámetros de secuencia dentro del stream (avc1/hvc1 no)
+OUTPUT_CODEC_TAGS = {
+    "h264": "avc3",
+    "hevc": "hev1"
+}
+
+# Perfiles de ffprobe y su nombre en el encoder correspondiente
+ENCODER_PROFILES = {
+    "h264": {
+        "Constrained Baseline": "baseline",
+        "Baseline": "baseline",
+        "Main": "main",
+        "High": "high",
+        "High 10": "high10",
+        "High 4:2:2": "high422",
+        "High 4:4:4 Predictive": "high444"
+    },
+    "hevc": {
+        "Main": "main",
+        "Main 10": "main10",
+        "Main Still Picture": "mainstillpicture"
+    }
+}
+
+# Propiedades de color de ffprobe y la opción de ffmpeg que las fija en el segmento
+COLOR_OPTIONS = {
+    "color_range": "-color_range",
+    "color_space": "-colorspace",
+    "color_primaries": "-color_primaries",
+    "color_transfer": "-color_trc"
+}
+
+
+class FFmpegError(RuntimeError):
+    """Error al ejecutar ffmpeg o ffprobe."""
+    pass
+
+
+def ffmpeg_available() -> bool:
+    """Indica si ffmpeg y ffprobe están instalados en el PATH."""
+    return shutil.which("ffmpeg") is not None and shutil.which("ffprobe") is not None
+
+
+def _run(args: List[str]) -> str:
+    """Ejecuta una herramienta de ffmpeg y devuelve su salida estándar."""
+    completed = subprocess.run(args, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise FFmpegError(f"{args[0]} terminó con código {completed.returncode}: {completed.stderr.strip()[-500:]}")
+    return completed.stdout
+
+
+def probe_video_stream(video_path: Path) -> Dict[str, Any]:
+    """Códec, perfil, nivel, formato de píxel y color del primer stream de video."""
+    output = _run([
+        "ffprobe", "-v", "error", "-select_streams", "v:0",
+        "-show_entries", f"stream=codec_name,profile,level,pix_fmt,width,height,{','.join(COLOR_OPTIONS)}",
+        "-of", "json", str(video_path)
+    ])
+    streams = json.loads(output).get("streams", [])
+    if not streams:
+        raise FFmpegError(f"El archivo no contiene streams de video: {video_path}")
+    return streams[0]
+
+
+def probe_keyframes(video_path: Path, fps: float) -> List[int]:
+    """Números de frame de los keyframes donde se puede cortar el stream sin decodificarlo.
+
+    Se leen los paquetes en orden de decodificación. Un keyframe de GOP abierto (CRA
+    en HEVC, I no IDR en H.264) tiene detrás frames que se muestran antes que él y
+    dependen del GOP anterior: cortar ahí los deja sin referencias, así que solo se
+    devuelven los keyframes que ningún paquete cruza en orden de presentación.
+    """
+    output = _run([
+        "ffprobe", "-v", "error", "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,flags", "-of", "csv=p=0", str(video_path)
+    ])
+    times = []
+    keyframe_indices = []
+    for line in output.splitlines():
+        pts_time, _, flags = line.partition(",")
+        if pts_time in ("", "N/A"):
+            continue
+        if "K" in flags:
+            keyframe_indices.append(len(times))
+        times.append(float(pts_time))
+    if not times:
+        return []
+
+    # Mínimo de los tiempos desde cada paquete hasta el final del stream
+    later_minimum = list(times)
+    for index in range(len(times) - 2, -1, -1):
+        later_minimum[index] = min(times[index], later_minimum[index + 1])
+
+    cut_times = []
+    earlier_maximum = float("-inf")
+    previous_index = 0
+    for index in keyframe_indices:
+        earlier_maximum = max([earlier_maximum, *times[previous_index:index]])
+        previous_index = index
+        if earlier_maximum < times[index] <= later_minimum[index]:
+            cut_times.append(times[index])
+
+    # Los tiempos se refieren al inicio del stream, que no siempre es 0
+    start_time = later_minimum[0]
+    return sorted({int(round((time - start_time) * fps)) for time in cut_times})
+
+
+def segment_encoder_options(stream: Dict[str, Any]) -> List[str]:
+    """Opciones de ffmpeg para recodificar un tramo con los parámetros del stream original.
+
+    Mismo encoder, perfil, nivel, formato de píxel y color que el original, y los
+    parámetros de secuencia repetidos en cada keyframe del tramo.
+    """
+    codec_name = stream.get("codec_name")
+    encoder = SEGMENT_ENCODERS.get(codec_name)
+    if encoder is None:
+        raise FFmpegError(f"Códec sin copia directa soportada: {codec_name}")
+
+    options = ["-c:v", encoder, "-pix_fmt", stream.get("pix_fmt") or "yuv420p"]
+    profile = ENCODER_PROFILES.get(codec_name, {}).get(stream.get("profile"))
+    if profile:
+        options += ["-profile:v", profile]
+    for key, option in COLOR_OPTIONS.items():
+        if stream.get(key) not in (None, "", "unknown"):
+            options += [option, stream[key]]
+
+    # ffprobe da el nivel como level_idc: 10 × nivel en H.264 y 30 × nivel en HEVC
+    level = stream.get("level")
+    level = level if isinstance(level, int) and level > 0 else None
+    if codec_name == "h264":
+        if level:
+            options += ["-level", f"{level / 10:g}"]
+        options += ["-x264-params", "repeat-headers=1"]
+    elif codec_name == "hevc":
+        params = ["log-level=error", "repeat-headers=1"] + ([f"level-idc={level / 30:g}"] if level else [])
+        options += ["-x265-params", ":".join(params)]
+    else:
+        options += ["-bsf:v", COPY_BITSTREAM_FILTERS[codec_name]]
+    return options
+
+
+def copy_segment(
+    source_path: Path,
+    start_frame: int,
+    frame_count: int,
+    fps: float,
+    output_path: Path,
+    codec_name: Optional[str] = None
+) -> None:
+    """Copia sin recodificar ``frame_count`` frames desde el keyframe ``start_frame``."""
+    # Medio frame de margen: la búsqueda de entrada con -c copy cae en el keyframe anterior o igual
+    start_seconds = (start_frame + 0.5) / fps
+    bitstream_filter = COPY_BITSTREAM_FILTERS.get(codec_name)
+    _run([
+        "ffmpeg", "-v", "error", "-y", "-ss", f"{start_seconds:.6f}", "-i", str(source_path),
+        "-map", "0:v:0", "-an", "-frames:v", str(frame_count), "-c", "copy",
+        *(["-bsf:v", bitstream_filter] if bitstream_filter else []),
+        "-f", "matroska", str(output_path)
+    ])
+
+
+def concat_segments(segment_paths: Sequence[Path], output_path: Path, codec_name: Optional[str] = None) -> None:
+    """Une los segmentos en ``output_path`` sin recodificar (demuxer concat)."""
+    list_path = output_path.with_name(f"{output_path.stem}_segments.txt")
+    list_path.write_text("".join(f"file '{path.resolve()}'\n" for path in segment_paths))
+    codec_tag = OUTPUT_CODEC_TAGS.get(codec_name)
+    try:
+        _run([
+            "ffmpeg", "-v", "error", "-y", "-f", "concat", "-safe", "0", "-i", str(list_path),
+            "-c", "copy", *(["-tag:v", codec_tag] if codec_tag else []), str(output_path)
+        ])
+    finally:
+        list_path.unlink(missing_ok=True)
+
+
+class FFmpegSegmentEncoder:
+    """Codifica frames BGR en un segmento Matroska mediante un proceso ffmpeg."""
+
+    def __init__(
+        self,
+        output_path: Path,
+        fps: float,
+        width: int,
+        height: int,
+        encoder_options: Sequence[str]
+    ):
+        self._output_path = output_path
+        self._process = subprocess.Popen(
+            [
+                "ffmpeg", "-v", "error", "-y",
+                "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{width}x{height}", "-r", f"{fps}", "-i", "-",
+                "-an", *encoder_options, "-f", "matroska", str(output_path)
+            ],
+            stdin=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+
+    def write(self, frame: np.ndarray) -> None:
+        """Envía un frame al codificador."""
+        self._process.stdin.write(np.ascontiguousarray(frame).tobytes())
+
+    def close(self) -> None:
+        """Cierra la entrada y espera a que termine la codificación."""
+        _, stderr = self._process.communicate()
+        if self._process.returncode != 0:
+            raise FFmpegError(
+                f"ffmpeg no pudo codificar {self._output_path}: {stderr.decode(errors='replace').strip()[-500:]}"
+            )
+
+    def __enter__(self) -> "FFmpegSegmentEncoder":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._process.kill()
+            self._process.wait()
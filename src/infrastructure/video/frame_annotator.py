@@ -0,0 +1,100 @@
+from pathlib import Path
+from typing import Iterable, Optional
+
+import cv2
+import numpy as np
+
+from ...domain.entities.damage import Damage, DamageType
+
+
+# Colores BGR para cada tipo de daño
+DAMAGE_COLORS = {
+    DamageType.SCRATCH: (0, 255, 255),      # Amarillo
+    DamageType.DENT: (255, 0, 0),           # Azul
+    DamageType.CRACK: (0, 0, 255),          # Rojo
+    DamageType.RUST: (0, 165, 255),         # Naranja
+    DamageType.BROKEN_PART: (128, 0, 128),  # Púrpura
+    DamageType.UNKNOWN: (128, 128, 128)     # Gris
+}
+
+
+def annotate_frame(frame: np.ndarray, damages: Iterable[Damage], in_place: bool = False) -> np.ndarray:
+    """Dibuja las cajas y etiquetas de los daños sobre un frame.
+
+    Con ``in_place`` se dibuja directamente sobre ``frame`` (útil cuando el frame
+    ya no se va a reutilizar); si no, sobre una copia.
+    """
+    annotated_frame = frame if in_place else frame.copy()
+
+    for damage in damages:
+        bbox = damage.bounding_box
+        color = DAMAGE_COLORS.get(damage.damage_type, (255, 255, 255))
+
+        # Dibujar rectángulo
+        cv2.rectangle(
+            annotated_frame,
+            (int(bbox.x1), int(bbox.y1)),
+            (int(bbox.x2), int(bbox.y2)),
+            color,
+            2
+        )
+
+        # Agregar etiqueta
+        label = f"{damage.damage_type.value} ({damage.confidence:.2f})"
+        label_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)[0]
+
+        # Fondo para el texto
+        cv2.rectangle(
+            annotated_frame,
+            (int(bbox.x1), int(bbox.y1) - label_size[1] - 10),
+            (int(bbox.x1) + label_size[0], int(bbox.y1)),
+            color,
+            -1
+        )
+
+        # Texto
+        cv2.putText(
+            annotated_frame,
+            label,
+            (int(bbox.x1), int(bbox.y1) - 5),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.5,
+            (255, 255, 255),
+            1
+        )
+
+    return annotated_frame
+
+
+class AnnotatedVideoWriter:
+    """Escribe un video anotado frame a frame, en el orden en que se reciben."""
+
+    def __init__(self, output_path: Path, fps: float, width: int, height: int, fourcc: str = "mp4v"):
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._output_path = output_path
+        self._writer = cv2.VideoWriter(str(output_path), cv2.VideoWriter_fourcc(*fourcc), fps, (width, height))
+        if not self._writer.isOpened():
+            raise ValueError(f"No se pudo crear el video de salida: {output_path}")
+        self.frames_written = 0
+
+    @property
+    def output_path(self) -> Path:
+        """Ruta del video de salida."""
+        return self._output_path
+
+    def write(self, frame: np.ndarray, damages: Optional[Iterable[Damage]] = None) -> None:
+        """Escribe un frame, anotándolo en el sitio si tiene daños."""
+        if damages:
+            frame = annotate_frame(frame, damages, in_place=True)
+        self._writer.write(frame)
+        self.frames_written += 1
+
+    def release(self) -> None:
+        """Cierra el video de salida."""
+        self._writer.release()
+
+    def __enter__(self) -> "AnnotatedVideoWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
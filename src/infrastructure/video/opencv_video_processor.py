@@ -1,5 +1,7 @@
 import asyncio
-from typing import List, Optional, Tuple, AsyncGenerator, Dict, Any
+import tempfile
+from concurrent.futures import Executor
+from typing import List, Optional, Tuple, AsyncGenerator, Dict, Any, Iterator, Sequence
 from pathlib import Path
 import cv2
 import numpy as np
@@ -11,14 +13,30 @@ from ...domain.entities.video import Video, VideoMetadata, VideoFormat
 from ...domain.entities.detection_result import DetectionResult
 from ...domain.entities.damage import Damage
 from ...domain.services.video_processing_service import VideoProcessingService
+from .damage_segments import VideoSegment, align_to_keyframes, damage_segments, split_timeline
+from .ffmpeg_tools import (
+    FFmpegError,
+    FFmpegSegmentEncoder,
+    concat_segments,
+    copy_segment,
+    ffmpeg_available,
+    probe_keyframes,
+    probe_video_stream,
+    segment_encoder_options
+)
+from .frame_annotator import AnnotatedVideoWriter, annotate_frame
 
 
 class OpenCVVideoProcessor(VideoProcessingService):
     """Implementación del servicio de procesamiento de video usando OpenCV."""
     
-    def __init__(self):
+    def __init__(self, clip_padding_seconds: float = 1.0, executor: Optional[Executor] = None):
         self._logger = logging.getLogger(__name__)
         self._supported_formats = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v']
+        # Margen antes y después de cada daño en los clips y en los tramos recodificados
+        self._clip_padding_seconds = clip_padding_seconds
+        # Executor donde corre la escritura de videos anotados (None = executor por defecto del loop)
+        self._executor = executor
     
     async def extract_metadata(self, video_path: Path) -> VideoMetadata:
         """Extrae metadatos de un video."""
@@ -156,12 +174,46 @@ class OpenCVVideoProcessor(VideoProcessingService):
             self._logger.error(f"Error al obtener frame {frame_number}: {e}")
             return None
     
-    async def create_annotated_video(self, video: Video, detection_result: DetectionResult, output_path: Path) -> Path:
-        """Crea un video anotado con las detecciones."""
+    async def create_annotated_video(
+        self,
+        video: Video,
+        detection_result: DetectionResult,
+        output_path: Path,
+        passthrough_unannotated: bool = False
+    ) -> Path:
+        """Crea un video anotado con las detecciones.
+        
+        Con ``passthrough_unannotated`` y ffmpeg disponible solo se recodifican los
+        segmentos con daños; el resto se copia del original sin decodificarlo.
+        """
+        # Decodificar, codificar y esperar a ffmpeg es bloqueante: el event loop solo espera el resultado
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._create_annotated_video_sync,
+            video, detection_result, output_path, passthrough_unannotated
+        )
+    
+    def _create_annotated_video_sync(
+        self,
+        video: Video,
+        detection_result: DetectionResult,
+        output_path: Path,
+        passthrough_unannotated: bool
+    ) -> Path:
+        """Crea el video anotado de forma bloqueante (se ejecuta en el executor)."""
         try:
             # Asegurar que el directorio de salida existe
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
+            if passthrough_unannotated:
+                if ffmpeg_available():
+                    try:
+                        return self._create_passthrough_video(video, detection_result, output_path)
+                    except FFmpegError as e:
+                        self._logger.warning(f"Copia directa con ffmpeg no disponible, se recodifica todo: {e}")
+                else:
+                    self._logger.warning("ffmpeg no está instalado, se recodifica el video completo")
+            
             cap = cv2.VideoCapture(str(video.file_path))
             if not cap.isOpened():
                 raise ValueError(f"No se pudo abrir el video: {video.file_path}")
@@ -171,34 +223,26 @@ class OpenCVVideoProcessor(VideoProcessingService):
             width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
             height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
             
-            # Configurar el escritor de video
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            out = cv2.VideoWriter(str(output_path), fourcc, fps, (width, height))
+            # Frames con daños según el índice por frame del resultado
+            frames_with_damages = set(detection_result.damaged_frames)
             
-            # Agrupar daños por frame para eficiencia
-            damages_by_frame = {}
-            for damage in detection_result.damages:
-                frame_num = damage.frame_number
-                if frame_num not in damages_by_frame:
-                    damages_by_frame[frame_num] = []
-                damages_by_frame[frame_num].append(damage)
-            
-            frame_number = 0
-            
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                
-                # Anotar frame si tiene daños detectados
-                if frame_number in damages_by_frame:
-                    frame = self._annotate_frame(frame, damages_by_frame[frame_number])
-                
-                out.write(frame)
-                frame_number += 1
-            
-            cap.release()
-            out.release()
+            try:
+                with AnnotatedVideoWriter(output_path, fps, width, height) as out:
+                    frame_number = 0
+                    
+                    while True:
+                        ret, frame = cap.read()
+                        if not ret:
+                            break
+                        
+                        # Anotar frame si tiene daños detectados
+                        if frame_number in frames_with_damages:
+                            out.write(frame, detection_result.get_damages_by_frame(frame_number))
+                        else:
+                            out.write(frame)
+                        frame_number += 1
+            finally:
+                cap.release()
             
             self._logger.info(f"Video anotado creado: {output_path}")
             
@@ -208,6 +252,136 @@ class OpenCVVideoProcessor(VideoProcessingService):
             self._logger.error(f"Error al crear video anotado: {e}")
             raise e
     
+    async def create_annotated_clips(
+        self,
+        video: Video,
+        detection_result: DetectionResult,
+        output_dir: Path
+    ) -> List[Path]:
+        """Crea un clip anotado por cada tramo con daños (más el margen configurado)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._create_annotated_clips_sync, video, detection_result, output_dir
+        )
+    
+    def _create_annotated_clips_sync(
+        self,
+        video: Video,
+        detection_result: DetectionResult,
+        output_dir: Path
+    ) -> List[Path]:
+        """Crea los clips anotados de forma bloqueante (se ejecuta en el executor)."""
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            
+            cap = cv2.VideoCapture(str(video.file_path))
+            if not cap.isOpened():
+                raise ValueError(f"No se pudo abrir el video: {video.file_path}")
+            
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            segments = damage_segments(
+                detection_result.damaged_frames, fps, self._frame_count(cap, detection_result),
+                self._clip_padding_seconds
+            )
+            
+            clips = []
+            try:
+                for segment in segments:
+                    clip_path = output_dir / (
+                        f"annotated_{video.file_path.stem}_{segment.start_frame:06d}-{segment.end_frame:06d}.mp4"
+                    )
+                    with AnnotatedVideoWriter(clip_path, fps, width, height) as out:
+                        for frame, damages in self._read_annotated_segment(cap, segment, detection_result):
+                            out.write(frame, damages)
+                    clips.append(clip_path)
+            finally:
+                cap.release()
+            
+            self._logger.info(f"{len(clips)} clips anotados creados en {output_dir}")
+            
+            return clips
+            
+        except Exception as e:
+            self._logger.error(f"Error al crear clips anotados: {e}")
+            raise e
+    
+    def _create_passthrough_video(self, video: Video, detection_result: DetectionResult, output_path: Path) -> Path:
+        """Video completo: tramos con daños recodificados y el resto copiado con ffmpeg."""
+        stream = probe_video_stream(video.file_path)
+        codec_name = stream.get("codec_name")
+        # Los tramos recodificados usan el perfil, nivel y color del original
+        encoder_options = segment_encoder_options(stream)
+        
+        cap = cv2.VideoCapture(str(video.file_path))
+        if not cap.isOpened():
+            raise ValueError(f"No se pudo abrir el video: {video.file_path}")
+        
+        try:
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            total_frames = self._frame_count(cap, detection_result)
+            
+            # Los tramos recodificados ocupan GOPs completos para que la copia empiece en un keyframe
+            segments = align_to_keyframes(
+                damage_segments(detection_result.damaged_frames, fps, total_frames, self._clip_padding_seconds),
+                probe_keyframes(video.file_path, fps),
+                total_frames
+            )
+            
+            with tempfile.TemporaryDirectory(dir=output_path.parent) as work_dir:
+                parts = []
+                for index, segment in enumerate(split_timeline(segments, total_frames)):
+                    part_path = Path(work_dir) / f"part_{index:05d}.mkv"
+                    if segment.annotated:
+                        with FFmpegSegmentEncoder(part_path, fps, width, height, encoder_options) as out:
+                            for frame, damages in self._read_annotated_segment(cap, segment, detection_result):
+                                out.write(annotate_frame(frame, damages, in_place=True) if damages else frame)
+                    else:
+                        copy_segment(
+                            video.file_path, segment.start_frame, segment.frame_count, fps, part_path, codec_name
+                        )
+                    parts.append(part_path)
+                
+                concat_segments(parts, output_path, codec_name)
+        finally:
+            cap.release()
+        
+        encoded_frames = sum(segment.frame_count for segment in segments)
+        self._logger.info(
+            f"Video anotado creado: {output_path} ({encoded_frames}/{total_frames} frames recodificados)"
+        )
+        
+        return output_path
+    
+    def _read_annotated_segment(
+        self,
+        cap: cv2.VideoCapture,
+        segment: VideoSegment,
+        detection_result: DetectionResult
+    ) -> Iterator[Tuple[np.ndarray, Optional[Sequence[Damage]]]]:
+        """Lee los frames de un segmento junto con sus daños (None si no tiene)."""
+        # Solo se busca si el segmento no continúa donde quedó la lectura anterior
+        if int(cap.get(cv2.CAP_PROP_POS_FRAMES)) != segment.start_frame:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, segment.start_frame)
+        
+        for frame_number in range(segment.start_frame, segment.end_frame + 1):
+            ret, frame = cap.read()
+            if not ret:
+                break
+            damages = detection_result.get_damages_by_frame(frame_number)
+            yield frame, damages if len(damages) else None
+    
+    def _frame_count(self, cap: cv2.VideoCapture, detection_result: DetectionResult) -> int:
+        """Frames del video según el contenedor (o hasta el último frame con daños si no lo indica)."""
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        damaged_frames = detection_result.damaged_frames
+        if damaged_frames:
+            frame_count = max(frame_count, damaged_frames[-1] + 1)
+        return frame_count
+    
     async def create_thumbnail(self, video: Video, output_path: Path, timestamp: float = 0.0) -> Path:
         """Crea una miniatura del video."""
         try:
@@ -319,56 +493,3 @@ class OpenCVVideoProcessor(VideoProcessingService):
         minutes = int((duration % 3600) // 60)
         seconds = int(duration % 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-    
-    def _annotate_frame(self, frame: np.ndarray, damages: List[Damage]) -> np.ndarray:
-        """Anota un frame con las detecciones de daños."""
-        annotated_frame = frame.copy()
-        
-        # Colores para diferentes tipos de daño
-        color_mapping = {
-            'SCRATCH': (0, 255, 255),    # Amarillo
-            'DENT': (255, 0, 0),         # Azul
-            'CRACK': (0, 0, 255),        # Rojo
-            'RUST': (0, 165, 255),       # Naranja
-            'BROKEN_PART': (128, 0, 128), # Púrpura
-            'UNKNOWN': (128, 128, 128)    # Gris
-        }
-        
-        for damage in damages:
-            bbox = damage.bounding_box
-            color = color_mapping.get(damage.damage_type.value, (255, 255, 255))
-            
-            # Dibujar rectángulo
-            cv2.rectangle(
-                annotated_frame,
-                (int(bbox.x1), int(bbox.y1)),
-                (int(bbox.x2), int(bbox.y2)),
-                color,
-                2
-            )
-            
-            # Agregar etiqueta
-            label = f"{damage.damage_type.value} ({damage.confidence:.2f})"
-            label_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)[0]
-            
-            # Fondo para el texto
-            cv2.rectangle(
-                annotated_frame,
-                (int(bbox.x1), int(bbox.y1) - label_size[1] - 10),
-                (int(bbox.x1) + label_size[0], int(bbox.y1)),
-                color,
-                -1
-            )
-            
-            # Texto
-            cv2.putText(
-                annotated_frame,
-                label,
-                (int(bbox.x1), int(bbox.y1) - 5),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.5,
-                (255, 255, 255),
-                1
-            )
-        
-        return annotated_frame
\ No newline at end of file
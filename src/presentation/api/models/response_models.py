@@ -111,6 +111,13 @@ class DetectionResultListResponse(ApiResponse):
     total_count: int = Field(description="Número total de resultados")
 
 
+class DamageListResponse(ApiResponse):
+    """Modelo de respuesta para los daños de un frame o de un intervalo de un resultado."""
+    result_id: str = Field(description="ID del resultado de detección")
+    damages: List[Dict[str, Any]] = Field(description="Daños encontrados, en orden de frame")
+    total_count: int = Field(description="Número de daños encontrados")
+
+
 class FileValidationResponse(BaseModel):
     """Modelo de respuesta para validación de archivos."""
     is_valid: bool = Field(description="Indica si el archivo es válido")
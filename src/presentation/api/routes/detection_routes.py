@@ -16,6 +16,7 @@ from src.presentation.api.models.response_models import (
     StatisticsResponse,
     SearchResultsResponse,
     TrendsResponse,
+    DamageListResponse,
     ApiResponse
 )
 from src.presentation.api.middleware.error_handler import ResourceNotFoundException
@@ -213,6 +214,79 @@ async def get_detection_result(
         )
 
 
+@router.get("/{result_id}/frames/{frame_number}", response_model=DamageListResponse)
+async def get_damages_in_frame(
+    result_id: str,
+    frame_number: int,
+    container: DependencyContainer = Depends(get_dependency_container)
+) -> DamageListResponse:
+    """Get the damages detected in one frame of a detection result."""
+    try:
+        use_case = container.get_detection_results_use_case()
+        
+        # Indexed lookup on the result's damage columns (binary search by frame)
+        damages = await use_case.get_damages_in_frame(result_id, frame_number)
+        if damages is None:
+            raise ResourceNotFoundException("detection_result", result_id)
+        
+        return DamageListResponse(
+            success=True,
+            message=f"Retrieved {len(damages)} damages in frame {frame_number}",
+            result_id=result_id,
+            damages=[damage.to_dict() for damage in damages],
+            total_count=len(damages)
+        )
+        
+    except Exception as e:
+        logger.error(f"Failed to get damages in frame {frame_number} of result {result_id}: {e}")
+        if isinstance(e, (ResourceNotFoundException, HTTPException)):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get damages in frame"
+        )
+
+
+@router.get("/{result_id}/time-range", response_model=DamageListResponse)
+async def get_damages_in_time_range(
+    result_id: str,
+    start_seconds: float = Query(..., ge=0, description="Start of the interval (seconds)"),
+    end_seconds: float = Query(..., ge=0, description="End of the interval (seconds)"),
+    container: DependencyContainer = Depends(get_dependency_container)
+) -> DamageListResponse:
+    """Get the damages detected between two instants of the video."""
+    if end_seconds < start_seconds:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_seconds must be greater than or equal to start_seconds"
+        )
+    
+    try:
+        use_case = container.get_detection_results_use_case()
+        
+        # Indexed lookup on the result's damage columns (binary search by timestamp)
+        damages = await use_case.get_damages_in_time_range(result_id, start_seconds, end_seconds)
+        if damages is None:
+            raise ResourceNotFoundException("detection_result", result_id)
+        
+        return DamageListResponse(
+            success=True,
+            message=f"Retrieved {len(damages)} damages between {start_seconds}s and {end_seconds}s",
+            result_id=result_id,
+            damages=[damage.to_dict() for damage in damages],
+            total_count=len(damages)
+        )
+        
+    except Exception as e:
+        logger.error(f"Failed to get damages in time range of result {result_id}: {e}")
+        if isinstance(e, (ResourceNotFoundException, HTTPException)):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get damages in time range"
+        )
+
+
 @router.get("/video/{video_id}", response_model=DetectionResultListResponse)
 async def get_detection_results_by_video(
     video_id: str,
@@ -319,7 +319,7 @@ async def list_videos(
         
         # Get videos based on status filter
         if status_filter:
-            videos = await video_repo.find_by_status(status_filter)
+            videos = await video_repo.find_by_status(status_filter.value)
         else:
             videos = await video_repo.find_all()
         
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import cv2
+import numpy as np
+import pytest
+
+from src.domain.entities.damage import BoundingBox, Damage, DamageSeverity, DamageType
+from src.domain.entities.detection_result import DetectionResult, DetectionStatistics
+from src.domain.entities.video import Video, VideoStatus
+from src.infrastructure.video.opencv_video_processor import OpenCVVideoProcessor
+
+
+FPS = 10
+FRAMES = 60
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "source.mp4"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), FPS, (160, 120))
+    for frame_number in range(FRAMES):
+        writer.write(np.full((120, 160, 3), frame_number * 4, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def _result(path, damaged_frames):
+    video = Video(
+        id="v1",
+        file_path=path,
+        name=path.name,
+        status=VideoStatus.COMPLETED,
+        created_at=datetime(2026, 1, 1),
+        validate_file=False
+    )
+    damages = [
+        Damage(
+            id=index,
+            damage_type=DamageType.SCRATCH,
+            severity=DamageSeverity.LOW,
+            confidence=0.8,
+            bounding_box=BoundingBox(x=20.0, y=20.0, width=40.0, height=30.0),
+            frame_number=frame_number,
+            timestamp=frame_number / FPS
+        )
+        for index, frame_number in enumerate(damaged_frames)
+    ]
+    statistics = DetectionStatistics(
+        total_frames_processed=FRAMES,
+        total_damages_detected=len(damages),
+        damages_by_type={},
+        damages_by_severity={},
+        average_confidence=0.8,
+        processing_time=1.0,
+        frames_per_second=float(FRAMES)
+    )
+    return DetectionResult(
+        id="r1",
+        video=video,
+        damages=damages,
+        statistics=statistics,
+        created_at=datetime(2026, 1, 1),
+        model_version="test",
+        confidence_threshold=0.5
+    )
+
+
+class _RecordingProcessor(OpenCVVideoProcessor):
+    """Anota en qué hilo se leen los frames de cada segmento."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.threads = set()
+
+    def _read_annotated_segment(self, cap, segment, detection_result):
+        self.threads.add(threading.current_thread().name)
+        return super()._read_annotated_segment(cap, segment, detection_result)
+
+
+async def _with_ticks(coroutine):
+    """Ejecuta ``coroutine`` y cuenta cuántas veces avanza el event loop mientras tanto."""
+    ticks = 0
+    task = asyncio.ensure_future(coroutine)
+    while not task.done():
+        ticks += 1
+        await asyncio.sleep(0)
+    return await task, ticks
+
+
+def test_clips_are_written_on_the_executor(tmp_path, source):
+    result = _result(source, [10, 11, 40])
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="render") as executor:
+        processor = _RecordingProcessor(clip_padding_seconds=0.5, executor=executor)
+        clips, ticks = asyncio.run(_with_ticks(
+            processor.create_annotated_clips(result.video, result, tmp_path / "clips")
+        ))
+
+    assert [clip.name for clip in clips] == ["annotated_source_000005-000016.mp4", "annotated_source_000035-000045.mp4"]
+    assert all(clip.stat().st_size > 0 for clip in clips)
+    assert processor.threads and all(name.startswith("render") for name in processor.threads)
+    # El event loop siguió atendiendo otras tareas mientras se escribían los clips
+    assert ticks > 1
+
+
+def test_annotated_video_is_written_on_the_executor(tmp_path, source):
+    result = _result(source, [10])
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="render") as executor:
+        processor = OpenCVVideoProcessor(executor=executor)
+        threads = []
+        original = processor._create_annotated_video_sync
+        processor._create_annotated_video_sync = lambda *args: threads.append(
+            threading.current_thread().name
+        ) or original(*args)
+        output, ticks = asyncio.run(_with_ticks(
+            processor.create_annotated_video(result.video, result, tmp_path / "annotated.mp4")
+        ))
+
+    capture = cv2.VideoCapture(str(output))
+    assert int(capture.get(cv2.CAP_PROP_FRAME_COUNT)) == FRAMES
+    capture.release()
+    assert threads == ["render_0"]
+    assert ticks > 1
@@ -0,0 +1,108 @@
+import json
+import multiprocessing
+import queue
+
+import pytest
+
+from src.infrastructure.repositories.jsonl_log import FileLock, JsonLinesLog
+
+
+WORKERS = 4
+ROUNDS = 40
+
+
+def _writer(path, worker_id, rounds, start):
+    """Mezcla put, replace y delete sobre ids propios y un id compartido por todos."""
+    log = JsonLinesLog(path, compaction_ratio=2.0, min_compaction_records=25)
+    start.wait()
+    for i in range(rounds):
+        record_id = f"{worker_id}-{i}"
+        log.put(record_id, {"worker": worker_id, "i": i, "version": 0})
+        if not log.replace(record_id, {"worker": worker_id, "i": i, "version": 1}):
+            raise AssertionError(f"{record_id} desapareció antes de reemplazarlo")
+        if i % 3 == 0 and not log.delete(record_id):
+            raise AssertionError(f"{record_id} desapareció antes de borrarlo")
+        log.put("shared", {"worker": worker_id, "i": i})
+
+        # Las lecturas (bloqueo compartido) ven siempre las escrituras propias ya hechas
+        state = log.load()
+        if (record_id in state) != bool(i % 3) or "shared" not in state:
+            raise AssertionError(f"Estado incoherente tras la ronda {i} del proceso {worker_id}")
+
+
+def _reader(path, results):
+    # Los registros son de solo lectura (no se pueden enviar por la cola tal cual)
+    results.put({record_id: dict(record) for record_id, record in JsonLinesLog(path).load().items()})
+
+
+@pytest.fixture
+def context():
+    return multiprocessing.get_context("spawn")
+
+
+def test_concurrent_put_replace_and_delete_from_several_processes(tmp_path, context):
+    path = tmp_path / "records.jsonl"
+    JsonLinesLog(path)
+    start = context.Event()
+    processes = [context.Process(target=_writer, args=(path, w, ROUNDS, start)) for w in range(WORKERS)]
+    for process in processes:
+        process.start()
+    start.set()
+    for process in processes:
+        process.join(timeout=120)
+
+    assert [process.exitcode for process in processes] == [0] * WORKERS
+
+    expected = {
+        f"{w}-{i}": {"worker": w, "i": i, "version": 1}
+        for w in range(WORKERS) for i in range(ROUNDS) if i % 3
+    }
+    state = JsonLinesLog(path).load()
+    shared = state.pop("shared")
+    assert state == expected
+    assert shared["i"] == ROUNDS - 1
+
+    # Ninguna línea quedó entrelazada ni a medias, y no quedan temporales de compactación
+    assert all(json.loads(line) for line in path.read_text(encoding="utf-8").splitlines())
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["records.jsonl", "records.jsonl.lock"]
+
+
+def test_readers_share_the_lock_and_wait_for_writers(tmp_path, context):
+    path = tmp_path / "records.jsonl"
+    JsonLinesLog(path).put("a", {"value": 1})
+    lock = FileLock(path.with_name("records.jsonl.lock"))
+    results = context.Queue()
+
+    # Con otro lector dentro, la lectura de otro proceso no espera
+    with lock.acquire(shared=True):
+        reader = context.Process(target=_reader, args=(path, results))
+        reader.start()
+        assert results.get(timeout=30) == {"a": {"value": 1}}
+        reader.join(timeout=30)
+
+    # Con un escritor dentro, la lectura espera a que termine
+    with lock.acquire():
+        reader = context.Process(target=_reader, args=(path, results))
+        reader.start()
+        with pytest.raises(queue.Empty):
+            results.get(timeout=1.0)
+    assert results.get(timeout=30) == {"a": {"value": 1}}
+    reader.join(timeout=30)
+
+
+def test_torn_tail_written_by_another_process_is_truncated_on_load(tmp_path, context):
+    path = tmp_path / "records.jsonl"
+    log = JsonLinesLog(path)
+    log.put("a", {"value": 1})
+    with open(path, "ab") as f:
+        f.write(b'{"op":"put","id":"b"')
+    results = context.Queue()
+
+    reader = context.Process(target=_reader, args=(path, results))
+    reader.start()
+    assert results.get(timeout=30) == {"a": {"value": 1}}
+    reader.join(timeout=30)
+
+    assert path.read_bytes().endswith(b"}\n")
+    log.put("c", {"value": 3})
+    assert JsonLinesLog(path).load() == {"a": {"value": 1}, "c": {"value": 3}}
@@ -0,0 +1,137 @@
+import asyncio
+import json
+import logging
+import subprocess
+from datetime import datetime
+
+import pytest
+
+from src.domain.entities.damage import BoundingBox, Damage, DamageSeverity, DamageType
+from src.domain.entities.detection_result import DetectionResult, DetectionStatistics
+from src.domain.entities.video import Video, VideoStatus
+from src.infrastructure.video.ffmpeg_tools import ffmpeg_available, probe_keyframes
+from src.infrastructure.video.opencv_video_processor import OpenCVVideoProcessor
+
+
+pytestmark = pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg no está instalado")
+
+FPS = 30
+FRAMES = 180
+DAMAGED_FRAMES = [75, 80, 85]
+
+
+def _encoders():
+    output = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"], capture_output=True, text=True).stdout
+    return {line.split()[1] for line in output.splitlines()[1:] if len(line.split()) > 1}
+
+
+SOURCES = {
+    "h264_high_bframes": ["-c:v", "libx264", "-profile:v", "high", "-level", "4.1", "-g", "30", "-bf", "2"],
+    "h264_baseline": ["-c:v", "libx264", "-profile:v", "baseline", "-level", "3.0", "-g", "30"],
+    "h264_open_gop": ["-c:v", "libx264", "-g", "30", "-x264-params", "open-gop=1:scenecut=0"],
+    "hevc_open_gop": ["-c:v", "libx265", "-tag:v", "hvc1", "-x265-params", "keyint=30:open-gop=1:log-level=error"],
+    "mpeg4": ["-c:v", "mpeg4", "-g", "30"]
+}
+
+
+def _source(tmp_path, name):
+    options = SOURCES[name]
+    if options[1] not in _encoders():
+        pytest.skip(f"ffmpeg sin el encoder {options[1]}")
+    path = tmp_path / f"{name}.mp4"
+    subprocess.run([
+        "ffmpeg", "-v", "error", "-y", "-f", "lavfi", "-i", f"testsrc2=size=320x240:rate={FPS}",
+        "-frames:v", str(FRAMES), "-pix_fmt", "yuv420p", *options, str(path)
+    ], check=True)
+    return path
+
+
+def _result(path):
+    video = Video(
+        id="v1",
+        file_path=path,
+        name=path.name,
+        status=VideoStatus.COMPLETED,
+        created_at=datetime(2026, 1, 1),
+        validate_file=False
+    )
+    damages = [
+        Damage(
+            id=index,
+            damage_type=DamageType.DENT,
+            severity=DamageSeverity.HIGH,
+            confidence=0.9,
+            bounding_box=BoundingBox(x=50.0, y=50.0, width=80.0, height=60.0),
+            frame_number=frame_number,
+            timestamp=frame_number / FPS
+        )
+        for index, frame_number in enumerate(DAMAGED_FRAMES)
+    ]
+    statistics = DetectionStatistics(
+        total_frames_processed=FRAMES,
+        total_damages_detected=len(damages),
+        damages_by_type={},
+        damages_by_severity={},
+        average_confidence=0.9,
+        processing_time=1.0,
+        frames_per_second=float(FRAMES)
+    )
+    return DetectionResult(
+        id="r1",
+        video=video,
+        damages=damages,
+        statistics=statistics,
+        created_at=datetime(2026, 1, 1),
+        model_version="test",
+        confidence_threshold=0.5
+    )
+
+
+def _stream(path):
+    output = subprocess.run([
+        "ffprobe", "-v", "error", "-select_streams", "v:0", "-count_frames",
+        "-show_entries", "stream=codec_name,codec_tag_string,profile,level,pix_fmt,nb_read_frames",
+        "-of", "json", str(path)
+    ], capture_output=True, text=True, check=True).stdout
+    return json.loads(output)["streams"][0]
+
+
+def _frame_hashes(path):
+    completed = subprocess.run(
+        ["ffmpeg", "-v", "error", "-i", str(path), "-f", "framemd5", "-"], capture_output=True, text=True
+    )
+    # Cualquier aviso del decodificador (SPS/PPS ausentes, referencias perdidas) es un fallo
+    assert completed.returncode == 0 and completed.stderr == ""
+    return [line.rsplit(",", 1)[1].strip() for line in completed.stdout.splitlines() if not line.startswith("#")]
+
+
+@pytest.mark.parametrize("name", sorted(SOURCES))
+def test_passthrough_output_decodes_and_copies_unannotated_frames(tmp_path, caplog, name):
+    source = _source(tmp_path, name)
+    output = tmp_path / "annotated.mp4"
+
+    result = _result(source)
+    asyncio.run(OpenCVVideoProcessor(clip_padding_seconds=0.2).create_annotated_video(
+        result.video, result, output, passthrough_unannotated=True
+    ))
+
+    # Sin recurrir a recodificar el video completo
+    assert not [record for record in caplog.records if record.levelno >= logging.WARNING]
+
+    source_stream, output_stream = _stream(source), _stream(output)
+    for key in ("codec_name", "profile", "level", "pix_fmt"):
+        assert output_stream[key] == source_stream[key]
+    assert output_stream["nb_read_frames"] == str(FRAMES)
+    assert output_stream["codec_tag_string"] == {"h264": "avc3", "hevc": "hev1"}.get(name.split("_")[0], "mp4v")
+
+    # Solo difieren los GOPs con daños (más el margen); el resto se copió tal cual del original.
+    # Con GOP abierto los keyframes que no son puntos de corte limpios no cuentan
+    keyframes = probe_keyframes(source, FPS)
+    padding = int(0.2 * FPS)
+    start = max(frame for frame in keyframes if frame <= DAMAGED_FRAMES[0] - padding)
+    end = min([frame for frame in keyframes if frame > DAMAGED_FRAMES[-1] + padding] + [FRAMES])
+
+    source_hashes, output_hashes = _frame_hashes(source), _frame_hashes(output)
+    assert len(output_hashes) == len(source_hashes) == FRAMES
+    changed = [frame for frame in range(FRAMES) if source_hashes[frame] != output_hashes[frame]]
+    assert changed == list(range(start, end))
@@ -0,0 +1,152 @@
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.domain.entities.damage import BoundingBox, Damage, DamageSeverity, DamageType
+from src.domain.entities.damage_track import DamageTrack
+from src.domain.entities.detection_result import DetectionResult, DetectionStatistics
+from src.domain.entities.video import Video, VideoStatus
+from src.infrastructure.repositories.sqlite_database import SqliteDatabase
+from src.infrastructure.repositories.sqlite_detection_repository import SqliteDetectionRepository
+from src.infrastructure.repositories.sqlite_video_repository import SqliteVideoRepository
+
+
+def _damage(damage_id, frame_number, damage_type=DamageType.SCRATCH, severity=DamageSeverity.LOW):
+    return Damage(
+        id=damage_id,
+        damage_type=damage_type,
+        severity=severity,
+        confidence=0.75,
+        bounding_box=BoundingBox(x=10.0, y=20.0, width=30.0, height=40.0),
+        frame_number=frame_number,
+        timestamp=frame_number / 30.0
+    )
+
+
+def _result(result_id, video_id, damages, minutes=0, tracks=()):
+    created_at = datetime(2026, 1, 1, 12, 0) + timedelta(minutes=minutes)
+    video = Video(
+        id=video_id,
+        file_path=Path(f"/videos/{video_id}.mp4"),
+        name=f"{video_id}.mp4",
+        status=VideoStatus.COMPLETED,
+        created_at=created_at,
+        validate_file=False
+    )
+    statistics = DetectionStatistics(
+        total_frames_processed=300,
+        total_damages_detected=len(damages),
+        damages_by_type={},
+        damages_by_severity={},
+        average_confidence=0.75 if damages else 0.0,
+        processing_time=2.0,
+        frames_per_second=150.0,
+        total_tracks=len(tracks)
+    )
+    return DetectionResult(
+        id=result_id,
+        video=video,
+        damages=damages,
+        statistics=statistics,
+        created_at=created_at,
+        model_version="YOLOv11",
+        confidence_threshold=0.5,
+        annotated_clip_paths=[Path(f"/output/{result_id}_clip0.mp4")],
+        tracks=list(tracks)
+    )
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = SqliteDatabase(tmp_path / "detections.db")
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def repository(database):
+    return SqliteDetectionRepository(database)
+
+
+def test_save_and_find_round_trip(repository):
+    track = DamageTrack(
+        id="t1", damage_type=DamageType.DENT, severity=DamageSeverity.HIGH, peak_confidence=0.75,
+        representative_box=BoundingBox(x=10.0, y=20.0, width=30.0, height=40.0),
+        first_frame=3, last_frame=9, first_timestamp=0.1, last_timestamp=0.3,
+        peak_frame=5, peak_timestamp=5 / 30.0, detection_count=3
+    )
+    result = _result("r1", "v1", [
+        _damage(0, 3, DamageType.DENT, DamageSeverity.HIGH),
+        _damage(1, 9, DamageType.RUST)
+    ], tracks=[track])
+
+    asyncio.run(repository.save(result))
+    loaded = asyncio.run(repository.find_by_id("r1"))
+
+    assert loaded.video.id == "v1"
+    assert loaded.created_at == result.created_at
+    assert [damage.to_dict() for damage in loaded.damages] == [damage.to_dict() for damage in result.damages]
+    assert loaded.tracks == [track]
+    assert loaded.annotated_clip_paths == result.annotated_clip_paths
+    assert loaded.statistics.total_tracks == 1
+    assert asyncio.run(repository.find_by_id("missing")) is None
+
+
+def test_uuid_damage_ids_round_trip(repository):
+    asyncio.run(repository.save(_result("r1", "v1", [_damage("3f0c-uuid", 0)])))
+
+    (damage,) = asyncio.run(repository.find_by_id("r1")).damages
+
+    assert damage.id == "3f0c-uuid"
+
+
+def test_filters_by_video_damages_type_and_date(repository):
+    asyncio.run(repository.save(_result("r1", "v1", [_damage(0, 1, DamageType.DENT)], minutes=0)))
+    asyncio.run(repository.save(_result("r2", "v1", [], minutes=10)))
+    asyncio.run(repository.save(_result("r3", "v2", [_damage(0, 1, DamageType.RUST)], minutes=20)))
+
+    assert [r.id for r in asyncio.run(repository.find_all())] == ["r1", "r2", "r3"]
+    assert [r.id for r in asyncio.run(repository.find_by_video_id("v1"))] == ["r1", "r2"]
+    assert [r.id for r in asyncio.run(repository.find_with_damages())] == ["r1", "r3"]
+    assert [r.id for r in asyncio.run(repository.find_by_damage_type("rust"))] == ["r3"]
+    in_range = asyncio.run(repository.find_by_date_range(datetime(2026, 1, 1, 12, 5), datetime(2026, 1, 1, 12, 30)))
+    assert [r.id for r in in_range] == ["r2", "r3"]
+
+
+def test_update_replaces_damages_and_delete_cascades(repository, database):
+    result = _result("r1", "v1", [_damage(0, 1), _damage(1, 2)])
+    asyncio.run(repository.save(result))
+
+    result.damages = [_damage(0, 5, DamageType.CRACK)]
+    asyncio.run(repository.update(result))
+
+    (damage,) = asyncio.run(repository.find_by_id("r1")).damages
+    assert (damage.frame_number, damage.damage_type) == (5, DamageType.CRACK)
+
+    assert asyncio.run(repository.delete("r1"))
+    assert not asyncio.run(repository.exists("r1"))
+    remaining = database.connection().execute("SELECT COUNT(*) FROM damages").fetchone()[0]
+    assert remaining == 0
+
+
+def test_statistics_are_aggregated_in_sql(repository):
+    asyncio.run(repository.save(_result("r1", "v1", [_damage(0, 1), _damage(1, 2, DamageType.DENT)])))
+    asyncio.run(repository.save(_result("r2", "v2", [_damage(0, 1, severity=DamageSeverity.CRITICAL)])))
+
+    statistics = asyncio.run(repository.get_statistics())
+
+    assert statistics["total_detections"] == 2
+    assert statistics["total_damages"] == 3
+    assert statistics["damages_by_type"] == {"scratch": 2, "dent": 1}
+    assert statistics["damages_by_severity"] == {"low": 2, "critical": 1}
+    assert statistics["total_processing_time"] == pytest.approx(4.0)
+
+
+def test_results_and_videos_share_the_database(repository, database):
+    asyncio.run(repository.save(_result("r1", "v1", [])))
+
+    video = asyncio.run(SqliteVideoRepository(database).find_by_id("v1"))
+
+    assert video.status == VideoStatus.COMPLETED
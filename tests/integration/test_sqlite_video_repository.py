@@ -0,0 +1,89 @@
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.domain.entities.video import Video, VideoFormat, VideoMetadata, VideoStatus
+from src.infrastructure.repositories.sqlite_database import SqliteDatabase
+from src.infrastructure.repositories.sqlite_video_repository import SqliteVideoRepository
+
+
+def _video(video_id, status=VideoStatus.PENDING, minutes=0, file_path=None):
+    return Video(
+        id=video_id,
+        file_path=Path(file_path or f"/videos/{video_id}.mp4"),
+        name=f"{video_id}.mp4",
+        status=status,
+        created_at=datetime(2026, 1, 1, 12, 0) + timedelta(minutes=minutes),
+        metadata=VideoMetadata(
+            duration=10.0, fps=30.0, width=1920, height=1080, frame_count=300,
+            format=VideoFormat.MP4, file_size=1024, codec="h264", bitrate=8000
+        ),
+        validate_file=False
+    )
+
+
+@pytest.fixture
+def repository(tmp_path):
+    database = SqliteDatabase(tmp_path / "detections.db")
+    yield SqliteVideoRepository(database)
+    database.close()
+
+
+def test_save_and_find_round_trip(repository):
+    video = _video("v1")
+    video.processed_at = datetime(2026, 1, 1, 12, 5, 0, 123456)
+    video.processing_time = 4.5
+
+    asyncio.run(repository.save(video))
+    loaded = asyncio.run(repository.find_by_id("v1"))
+
+    assert loaded.id == video.id
+    assert loaded.file_path == video.file_path
+    assert loaded.status == VideoStatus.PENDING
+    assert loaded.created_at == video.created_at
+    assert loaded.processed_at == video.processed_at
+    assert loaded.processing_time == 4.5
+    assert loaded.metadata == video.metadata
+    assert asyncio.run(repository.find_by_id("missing")) is None
+
+
+def test_find_by_status_accepts_value_and_enum(repository):
+    asyncio.run(repository.save(_video("v1", VideoStatus.COMPLETED, minutes=1)))
+    asyncio.run(repository.save(_video("v2", VideoStatus.PENDING, minutes=2)))
+    asyncio.run(repository.save(_video("v3", VideoStatus.COMPLETED, minutes=3)))
+
+    by_value = asyncio.run(repository.find_by_status("completed"))
+    by_enum = asyncio.run(repository.find_by_status(VideoStatus.COMPLETED))
+
+    assert [video.id for video in by_value] == ["v1", "v3"]
+    assert [video.id for video in by_enum] == ["v1", "v3"]
+    assert asyncio.run(repository.find_by_status("not-a-status")) == []
+
+
+def test_find_by_path_returns_the_most_recent_video(repository):
+    asyncio.run(repository.save(_video("old", minutes=1, file_path="/videos/car.mp4")))
+    asyncio.run(repository.save(_video("new", minutes=5, file_path="/videos/car.mp4")))
+
+    assert asyncio.run(repository.find_by_path(Path("/videos/car.mp4"))).id == "new"
+    assert asyncio.run(repository.find_by_path(Path("/videos/other.mp4"))) is None
+
+
+def test_update_exists_and_delete(repository):
+    video = _video("v1")
+    asyncio.run(repository.save(video))
+
+    video.status = VideoStatus.FAILED
+    video.error_message = "decoder error"
+    asyncio.run(repository.update(video))
+
+    loaded = asyncio.run(repository.find_by_id("v1"))
+    assert (loaded.status, loaded.error_message) == (VideoStatus.FAILED, "decoder error")
+    with pytest.raises(ValueError):
+        asyncio.run(repository.update(_video("missing")))
+
+    assert asyncio.run(repository.exists("v1"))
+    assert asyncio.run(repository.delete("v1"))
+    assert not asyncio.run(repository.exists("v1"))
+    assert not asyncio.run(repository.delete("v1"))
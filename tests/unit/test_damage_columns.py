@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from src.domain.entities.damage import BoundingBox, Damage, DamageSeverity, DamageType
+from src.domain.entities.damage_columns import DamageColumns, DamageColumnsBuilder
+
+
+def _damage(damage_id, frame_number, damage_type=DamageType.SCRATCH, severity=DamageSeverity.LOW, confidence=0.7):
+    return Damage(
+        id=damage_id,
+        damage_type=damage_type,
+        severity=severity,
+        confidence=confidence,
+        bounding_box=BoundingBox(x=10.0 + frame_number, y=20.0, width=30.0, height=40.0),
+        frame_number=frame_number,
+        timestamp=frame_number / 10.0
+    )
+
+
+DAMAGES = [
+    _damage(0, 4, DamageType.DENT, DamageSeverity.HIGH, 0.9),
+    _damage(1, 1),
+    _damage(2, 4, DamageType.RUST, DamageSeverity.CRITICAL, 0.8),
+    _damage(3, 2, DamageType.SCRATCH, DamageSeverity.MEDIUM, 0.5),
+    _damage(4, 9, DamageType.DENT, DamageSeverity.LOW, 0.6)
+]
+
+
+def test_from_damages_round_trips_every_field():
+    columns = DamageColumns.from_damages(DAMAGES)
+
+    assert len(columns) == len(DAMAGES)
+    for original, restored in zip(DAMAGES, columns):
+        assert restored.id == original.id
+        assert restored.damage_type == original.damage_type
+        assert restored.severity == original.severity
+        assert restored.confidence == pytest.approx(original.confidence)
+        assert restored.bounding_box == original.bounding_box
+        assert restored.frame_number == original.frame_number
+        assert restored.timestamp == original.timestamp
+    assert columns[-1].id == 4
+    assert DamageColumns.from_damages(columns) is columns
+
+
+def test_uuid_ids_are_kept_as_strings():
+    columns = DamageColumns.from_damages([_damage("a-uuid", 0), _damage("b-uuid", 1)])
+
+    assert [damage.id for damage in columns] == ["a-uuid", "b-uuid"]
+
+
+def test_columns_reject_mismatched_lengths():
+    with pytest.raises(ValueError):
+        DamageColumns([0, 1], [0.0], [0, 0], [0, 0], [0.5, 0.5], np.zeros((2, 4)))
+
+
+def test_filters_return_masked_columns():
+    columns = DamageColumns.from_damages(DAMAGES)
+
+    assert [d.id for d in columns.severe()] == [0, 2]
+    assert [d.id for d in columns.by_type("dent")] == [0, 4]
+    assert len(columns.by_type("not-a-type")) == 0
+    assert [d.id for d in columns.by_confidence_range(0.6, 0.8)] == [1, 2, 4]
+    assert [d.id for d in columns.with_types(["rust", "scratch"])] == [1, 2, 3]
+    assert [d.id for d in columns.with_severities(["medium", "critical"])] == [2, 3]
+    assert columns.unique_types() == ["scratch", "dent", "rust"]
+
+
+def test_counts_match_a_python_count():
+    columns = DamageColumns.from_damages(DAMAGES)
+
+    assert columns.count_by_type() == {"scratch": 2, "dent": 2, "rust": 1}
+    assert columns.count_by_severity() == {"low": 2, "medium": 1, "high": 1, "critical": 1}
+    assert DamageColumns.empty().count_by_type() == {}
+
+
+def test_concat_preserves_order_and_ids():
+    first = DamageColumns.from_damages(DAMAGES[:2])
+    second = DamageColumns.from_damages(DAMAGES[2:])
+
+    merged = DamageColumns.concat([first, second])
+
+    assert [d.id for d in merged] == [d.id for d in DAMAGES]
+    assert len(DamageColumns.concat([])) == 0
+
+
+def test_concat_drops_ids_when_a_chunk_has_none():
+    with_ids = DamageColumns.from_damages(DAMAGES[:2])
+    without_ids = DamageColumns.from_damages(DAMAGES[2:])
+    without_ids.ids = None
+
+    merged = DamageColumns.concat([with_ids, without_ids])
+
+    assert merged.ids is None
+    assert [d.id for d in merged] == list(range(len(DAMAGES)))
+
+
+def test_builder_compacts_pending_frames(monkeypatch):
+    monkeypatch.setattr(DamageColumnsBuilder, "COMPACT_EVERY", 2)
+    builder = DamageColumnsBuilder()
+
+    for damage in DAMAGES:
+        builder.append([damage])
+    builder.append([])
+
+    assert len(builder._blocks) == 2 and len(builder._pending) == 1
+    assert [d.id for d in builder.build()] == [d.id for d in DAMAGES]
+    assert len(DamageColumnsBuilder().build()) == 0
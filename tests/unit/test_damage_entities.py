@@ -0,0 +1,94 @@
+import dataclasses
+from datetime import datetime
+
+import pytest
+
+from src.domain.entities.damage import BoundingBox, Damage, DamageSeverity, DamageType
+from src.domain.entities.damage_track import DamageTrack
+
+
+def _damage(**overrides):
+    fields = dict(
+        id=7,
+        damage_type=DamageType.DENT,
+        severity=DamageSeverity.HIGH,
+        confidence=0.8,
+        bounding_box=BoundingBox(x=10.0, y=20.0, width=30.0, height=40.0),
+        frame_number=12,
+        timestamp=0.4
+    )
+    fields.update(overrides)
+    return Damage(**fields)
+
+
+@pytest.mark.parametrize("instance", [
+    BoundingBox(x=1.0, y=2.0, width=3.0, height=4.0),
+    _damage(),
+    DamageTrack(
+        id="t1", damage_type=DamageType.DENT, severity=DamageSeverity.HIGH, peak_confidence=0.8,
+        representative_box=BoundingBox(x=1.0, y=2.0, width=3.0, height=4.0),
+        first_frame=0, last_frame=5, first_timestamp=0.0, last_timestamp=0.2,
+        peak_frame=3, peak_timestamp=0.1, detection_count=2
+    )
+])
+def test_entities_are_slotted_and_frozen(instance):
+    assert not hasattr(instance, "__dict__")
+    assert "__slots__" in type(instance).__dict__
+
+    field = dataclasses.fields(instance)[0].name
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        setattr(instance, field, getattr(instance, field))
+    with pytest.raises((AttributeError, TypeError)):
+        instance.extra = 1
+
+
+def test_from_corners_and_corner_properties_round_trip():
+    box = BoundingBox.from_corners(x1=10.0, y1=20.0, x2=40.0, y2=60.0)
+
+    assert box == BoundingBox(x=10.0, y=20.0, width=30.0, height=40.0)
+    assert (box.x1, box.y1, box.x2, box.y2) == (10.0, 20.0, 40.0, 60.0)
+    assert box.area == 1200.0
+    assert box.center == (25.0, 40.0)
+    assert BoundingBox.from_corners(box.x1, box.y1, box.x2, box.y2) == box
+
+
+def test_from_corners_keeps_the_validation():
+    with pytest.raises(ValueError):
+        BoundingBox.from_corners(x1=10.0, y1=20.0, x2=10.0, y2=60.0)
+    with pytest.raises(ValueError):
+        BoundingBox.from_corners(x1=-1.0, y1=0.0, x2=5.0, y2=5.0)
+
+
+def test_damage_validation_still_runs_on_frozen_instances():
+    with pytest.raises(ValueError):
+        _damage(confidence=1.5)
+    with pytest.raises(ValueError):
+        _damage(frame_number=-1)
+
+
+def test_frozen_damages_are_hashable_and_compare_by_value():
+    assert _damage() == _damage()
+    assert len({_damage(), _damage(), _damage(id=8)}) == 2
+    assert dataclasses.replace(_damage(), severity=DamageSeverity.LOW).severity == DamageSeverity.LOW
+
+
+def test_to_dict_with_float_timestamp_and_sequential_id():
+    data = _damage().to_dict()
+
+    assert data == {
+        "id": 7,
+        "damage_type": "dent",
+        "severity": "high",
+        "confidence": 0.8,
+        "bounding_box": {"x": 10.0, "y": 20.0, "width": 30.0, "height": 40.0},
+        "frame_number": 12,
+        "timestamp": 0.4,
+        "description": None
+    }
+
+
+def test_to_dict_still_serialises_datetime_timestamps():
+    data = _damage(id="3f0c-uuid", timestamp=datetime(2026, 1, 1, 12, 0)).to_dict()
+
+    assert data["id"] == "3f0c-uuid"
+    assert data["timestamp"] == "2026-01-01T12:00:00"
@@ -0,0 +1,94 @@
+import pytest
+
+from src.domain.entities.damage import BoundingBox, Damage, DamageSeverity, DamageType
+from src.infrastructure.ml.damage_tracker import IoUDamageTracker
+from src.infrastructure.ml.frame_sampler import create_frame_sampler
+
+
+def _damage(frame_number, x, y=100.0, size=50.0, damage_type=DamageType.SCRATCH,
+            severity=DamageSeverity.LOW, confidence=0.6):
+    return Damage(
+        id=frame_number,
+        damage_type=damage_type,
+        severity=severity,
+        confidence=confidence,
+        bounding_box=BoundingBox(x=x, y=y, width=size, height=size),
+        frame_number=frame_number,
+        timestamp=frame_number / 30.0
+    )
+
+
+def test_overlapping_detections_are_linked_into_one_track():
+    tracker = IoUDamageTracker(max_frame_gap=5)
+
+    ids = [tracker.update(frame, [_damage(frame, x=100.0 + 2 * frame)])[0] for frame in range(0, 10, 2)]
+
+    assert len(set(ids)) == 1
+    (track,) = tracker.finalize()
+    assert (track.first_frame, track.last_frame, track.detection_count) == (0, 8, 5)
+
+
+def test_track_keeps_peak_confidence_and_max_severity():
+    tracker = IoUDamageTracker()
+    tracker.update(0, [_damage(0, x=100.0, confidence=0.5, severity=DamageSeverity.HIGH)])
+    tracker.update(1, [_damage(1, x=102.0, confidence=0.9, severity=DamageSeverity.LOW)])
+
+    (track,) = tracker.finalize()
+
+    assert track.peak_confidence == 0.9
+    assert track.peak_frame == 1
+    assert track.severity == DamageSeverity.HIGH
+
+
+def test_different_damage_types_never_share_a_track():
+    tracker = IoUDamageTracker()
+
+    ids = tracker.update(0, [
+        _damage(0, x=100.0, damage_type=DamageType.SCRATCH),
+        _damage(0, x=100.0, damage_type=DamageType.DENT)
+    ])
+    next_ids = tracker.update(1, [
+        _damage(1, x=101.0, damage_type=DamageType.DENT),
+        _damage(1, x=101.0, damage_type=DamageType.SCRATCH)
+    ])
+
+    assert ids[0] != ids[1]
+    assert next_ids == [ids[1], ids[0]]
+
+
+def test_nearby_detection_without_overlap_links_by_centroid_distance():
+    tracker = IoUDamageTracker(iou_threshold=0.5, max_centroid_distance=0.5)
+    first = tracker.update(0, [_damage(0, x=100.0)])
+    # Desplazada 30 px: IoU 0.25, centroide a ~0.42 diagonales
+    second = tracker.update(1, [_damage(1, x=130.0)])
+
+    assert first == second
+
+
+def test_gap_longer_than_max_frame_gap_splits_the_track():
+    tracker = IoUDamageTracker(max_frame_gap=10)
+    first = tracker.update(0, [_damage(0, x=100.0)])
+    same = tracker.update(10, [_damage(10, x=100.0)])
+    split = tracker.update(21, [_damage(21, x=100.0)])
+
+    assert first == same
+    assert split != first
+    assert [(t.first_frame, t.last_frame) for t in tracker.finalize()] == [(0, 10), (21, 21)]
+
+
+def test_tracker_rejects_invalid_parameters():
+    with pytest.raises(ValueError):
+        IoUDamageTracker(iou_threshold=0.0)
+    with pytest.raises(ValueError):
+        IoUDamageTracker(max_frame_gap=0)
+
+
+@pytest.mark.parametrize("mode, interval, max_frame_gap, spacing", [
+    ("fixed", 5, 30, 5),
+    ("adaptive", 1, 30, 30),
+    ("adaptive", 4, 30, 32),
+])
+def test_sampler_max_spacing_bounds_the_gap_between_inferred_frames(mode, interval, max_frame_gap, spacing):
+    sampler = create_frame_sampler(mode=mode, interval=interval, max_frame_gap=max_frame_gap)
+
+    assert sampler.max_spacing == spacing
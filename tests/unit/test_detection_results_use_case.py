@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime
+from pathlib import Path
+
+from src.domain.entities.damage import BoundingBox, Damage, DamageSeverity, DamageType
+from src.domain.entities.detection_result import DetectionResult, DetectionStatistics
+from src.domain.entities.video import Video, VideoStatus
+from src.domain.use_cases.get_detection_results_use_case import GetDetectionResultsUseCase
+
+
+def _damage(frame_number, damage_type, severity, confidence=0.7):
+    return Damage(
+        id=frame_number,
+        damage_type=damage_type,
+        severity=severity,
+        confidence=confidence,
+        bounding_box=BoundingBox(x=10.0, y=10.0, width=20.0, height=20.0),
+        frame_number=frame_number,
+        timestamp=frame_number / 30.0
+    )
+
+
+def _result(result_id, damages):
+    video = Video(
+        id=f"video-{result_id}",
+        file_path=Path(f"/videos/{result_id}.mp4"),
+        name=f"{result_id}.mp4",
+        status=VideoStatus.COMPLETED,
+        created_at=datetime(2026, 1, 1),
+        validate_file=False
+    )
+    statistics = DetectionStatistics(
+        total_frames_processed=100,
+        total_damages_detected=len(damages),
+        damages_by_type={},
+        damages_by_severity={},
+        average_confidence=0.7,
+        processing_time=1.0,
+        frames_per_second=100.0
+    )
+    return DetectionResult(
+        id=result_id,
+        video=video,
+        damages=damages,
+        statistics=statistics,
+        created_at=datetime(2026, 1, 1),
+        model_version="test",
+        confidence_threshold=0.5
+    )
+
+
+class _InMemoryDetectionRepository:
+    def __init__(self, results):
+        self._results = results
+
+    async def find_by_id(self, result_id):
+        return next((result for result in self._results if result.id == result_id), None)
+
+    async def find_all(self):
+        return list(self._results)
+
+    async def find_with_damages(self):
+        return [result for result in self._results if result.has_damages]
+
+    async def get_statistics(self):
+        return {"total_results": len(self._results)}
+
+
+RESULTS = [
+    _result("a", [
+        _damage(0, DamageType.SCRATCH, DamageSeverity.LOW, confidence=0.55),
+        _damage(1, DamageType.SCRATCH, DamageSeverity.MEDIUM, confidence=0.6)
+    ]),
+    _result("b", [
+        _damage(0, DamageType.DENT, DamageSeverity.CRITICAL, confidence=0.9),
+        _damage(5, DamageType.SCRATCH, DamageSeverity.LOW, confidence=0.65)
+    ]),
+    _result("c", [])
+]
+
+
+def _use_case():
+    return GetDetectionResultsUseCase(_InMemoryDetectionRepository(RESULTS), video_repository=None)
+
+
+def test_statistics_count_damage_types_and_severities_across_results():
+    statistics = asyncio.run(_use_case().get_statistics())
+
+    assert statistics["damage_types_distribution"] == {"scratch": 3, "dent": 1}
+    assert statistics["severity_distribution"] == {"low": 2, "medium": 1, "critical": 1}
+    assert statistics["videos_with_damages"] == 2
+    assert statistics["videos_without_damages"] == 1
+
+
+def test_severe_damage_results_only_include_results_with_high_or_critical_damages():
+    results = asyncio.run(_use_case().get_severe_damage_results())
+
+    assert [result.id for result in results] == ["b"]
+
+
+def test_search_filters_by_damage_type_confidence_and_severity():
+    use_case = _use_case()
+
+    by_type = asyncio.run(use_case.search_results(damage_types=[DamageType.DENT, DamageType.RUST]))
+    by_confidence = asyncio.run(use_case.search_results(min_confidence=0.62))
+    by_severity = asyncio.run(use_case.search_results(severity_levels=[DamageSeverity.MEDIUM]))
+    combined = asyncio.run(use_case.search_results(
+        damage_types=[DamageType.SCRATCH], severity_levels=[DamageSeverity.LOW], min_confidence=0.6
+    ))
+
+    assert [result.id for result in by_type] == ["b"]
+    assert [result.id for result in by_confidence] == ["b"]
+    assert [result.id for result in by_severity] == ["a"]
+    assert [result.id for result in combined] == ["a", "b"]
+
+
+def test_damages_in_frame_and_time_range_use_the_frame_index():
+    use_case = _use_case()
+
+    in_frame = asyncio.run(use_case.get_damages_in_frame("b", 5))
+    in_range = asyncio.run(use_case.get_damages_in_time_range("a", 0.0, 0.02))
+
+    assert [(d.frame_number, d.damage_type) for d in in_frame] == [(5, DamageType.SCRATCH)]
+    assert [d.frame_number for d in in_range] == [0]
+    assert asyncio.run(use_case.get_damages_in_frame("missing", 0)) is None
+
+
+def test_summary_reports_frames_with_damages():
+    summaries = {result.id: result.generate_summary() for result in RESULTS}
+
+    assert {result_id: s["frames_with_damages"] for result_id, s in summaries.items()} == {"a": 2, "b": 2, "c": 0}
@@ -0,0 +1,44 @@
+import numpy as np
+
+from src.infrastructure.ml.detections import FrameDetections
+from src.infrastructure.ml.letterbox import LetterboxTransform
+
+
+def _detections(boxes):
+    xyxy = np.array(boxes, dtype=np.float32).reshape(-1, 4)
+    count = xyxy.shape[0]
+    return FrameDetections(xyxy, np.linspace(0.5, 0.9, count, dtype=np.float32), np.arange(count, dtype=np.int64))
+
+
+def test_without_degenerate_boxes_keeps_valid_detections():
+    detections = _detections([[0, 0, 10, 10], [5, 5, 5, 20], [5, 5, 20, 5], [1, 1, 2, 2]])
+
+    filtered = detections.without_degenerate_boxes()
+
+    assert filtered.count == 2
+    assert filtered.xyxy.tolist() == [[0, 0, 10, 10], [1, 1, 2, 2]]
+    assert filtered.class_ids.tolist() == [0, 3]
+    assert np.allclose(filtered.confidences, detections.confidences[[0, 3]])
+
+
+def test_without_degenerate_boxes_returns_same_instance_when_all_valid():
+    detections = _detections([[0, 0, 10, 10]])
+
+    assert detections.without_degenerate_boxes() is detections
+    assert FrameDetections.empty().without_degenerate_boxes().count == 0
+
+
+def test_box_in_letterbox_padding_is_clipped_to_zero_width_and_filtered():
+    # 1920x1080 -> 640x360 centrado en 640x640: franja de relleno de 140 px arriba
+    transform = LetterboxTransform.for_shape((1080, 1920, 3), 640)
+    padding_box = [[100, 10, 200, 120]]        # completamente en el relleno superior
+    border_box = [[-20, 200, 0, 260]]          # fuera del borde izquierdo
+    valid_box = [[100, 200, 200, 260]]
+    xyxy = np.array(padding_box + border_box + valid_box, dtype=np.float32)
+
+    original = transform.to_original(xyxy)
+    detections = FrameDetections(original, np.full(3, 0.8, dtype=np.float32), np.zeros(3, dtype=np.int64))
+
+    filtered = detections.without_degenerate_boxes()
+    assert filtered.count == 1
+    assert np.allclose(filtered.xyxy[0], [300, 180, 600, 360])
@@ -0,0 +1,52 @@
+import numpy as np
+
+from src.domain.entities.damage import BoundingBox, Damage, DamageSeverity, DamageType
+from src.domain.entities.damage_columns import DamageColumns, FrameIndex
+
+
+def _damage(damage_id, frame_number, damage_type=DamageType.SCRATCH, severity=DamageSeverity.LOW, confidence=0.7):
+    return Damage(
+        id=damage_id,
+        damage_type=damage_type,
+        severity=severity,
+        confidence=confidence,
+        bounding_box=BoundingBox(x=10.0 + frame_number, y=20.0, width=30.0, height=40.0),
+        frame_number=frame_number,
+        timestamp=frame_number / 10.0
+    )
+
+
+DAMAGES = [
+    _damage(0, 4, DamageType.DENT, DamageSeverity.HIGH, 0.9),
+    _damage(1, 1),
+    _damage(2, 4, DamageType.RUST, DamageSeverity.CRITICAL, 0.8),
+    _damage(3, 2, DamageType.SCRATCH, DamageSeverity.MEDIUM, 0.5),
+    _damage(4, 9, DamageType.DENT, DamageSeverity.LOW, 0.6)
+]
+
+
+def test_frame_index_lookups_by_frame_and_time():
+    columns = DamageColumns.from_damages(DAMAGES)
+
+    assert columns.frames.tolist() == [1, 2, 4, 9]
+    assert [d.id for d in columns.by_frame(4)] == [0, 2]
+    assert len(columns.by_frame(3)) == 0
+    assert len(columns.by_frame(100)) == 0
+    # Intervalo cerrado [0.2, 0.4] segundos: frames 2 y 4, en orden de frame
+    assert [d.id for d in columns.by_time_range(0.2, 0.4)] == [3, 0, 2]
+    assert len(columns.by_time_range(0.5, 0.8)) == 0
+    assert [(frame, len(damages)) for frame, damages in columns.iter_frames()] == [(1, 1), (2, 1), (4, 2), (9, 1)]
+
+
+def test_frame_index_matches_a_linear_scan():
+    rng = np.random.default_rng(0)
+    frame_numbers = rng.integers(0, 500, size=2000)
+    index = FrameIndex.build(frame_numbers, frame_numbers / 25.0)
+
+    for frame_number in (0, 17, 250, 499, 500):
+        expected = np.flatnonzero(frame_numbers == frame_number)
+        np.testing.assert_array_equal(index.rows_for_frame(frame_number), expected)
+
+    rows = index.rows_for_time_range(2.0, 4.0)
+    expected = np.flatnonzero((frame_numbers >= 50) & (frame_numbers <= 100))
+    assert sorted(rows.tolist()) == expected.tolist()
@@ -0,0 +1,114 @@
+import time
+
+import numpy as np
+import pytest
+
+from src.infrastructure.ml.frame_sampler import AdaptiveFrameSampler, FrameSampler, sample_frames
+from src.infrastructure.ml.inference_pipeline import InferencePipeline
+
+
+class _StaticCapture:
+    """Sustituto de cv2.VideoCapture con una escena estática de ``frame_count`` frames."""
+
+    def __init__(self, frame_count: int):
+        self._frame_count = frame_count
+        self._position = 0
+        self._frame = np.full((48, 64, 3), 128, dtype=np.uint8)
+
+    def grab(self) -> bool:
+        if self._position >= self._frame_count:
+            return False
+        self._position += 1
+        return True
+
+    def read(self):
+        if not self.grab():
+            return False, None
+        return True, self._frame.copy()
+
+
+def _run_detection(sampler, frame_count, hit_frames, passthrough=False):
+    """Recorre el pipeline como el detector; devuelve los frames inferidos y los entregados."""
+    inferred = []
+
+    def infer_batch(batch):
+        time.sleep(0.002)  # inferencia lenta: el decodificador se adelanta
+        inferred.extend(item.frame_number for item in batch)
+        return [item.frame_number in hit_frames for item in batch]
+
+    pipeline = InferencePipeline(
+        infer_batch=infer_batch,
+        batch_size=4,
+        max_batch_wait_seconds=0.01,
+        queue_size=16,
+        passthrough_buffer_size=32,
+        sampler=sampler,
+        forward_skipped=passthrough
+    )
+    delivered = [
+        (item.frame_number, item.infer)
+        for item, _ in pipeline.run(sample_frames(_StaticCapture(frame_count), 30.0, sampler, passthrough))
+    ]
+    return sorted(inferred), delivered
+
+
+def test_fixed_sampler_infers_every_interval():
+    sampler = FrameSampler(interval=5)
+
+    inferred, delivered = _run_detection(sampler, 50, hit_frames=set())
+
+    assert inferred == list(range(0, 50, 5))
+    assert [frame_number for frame_number, _ in delivered] == inferred
+
+
+def test_adaptive_sampler_skips_static_scene_up_to_max_gap():
+    sampler = AdaptiveFrameSampler(interval=1, max_frame_gap=30, dense_window=15)
+
+    inferred, _ = _run_detection(sampler, 120, hit_frames=set())
+
+    assert inferred == [0, 30, 60, 90]
+
+
+def test_damage_hit_densifies_sampling_of_following_frames():
+    sampler = AdaptiveFrameSampler(interval=1, max_frame_gap=30, dense_window=15)
+
+    inferred, delivered = _run_detection(sampler, 200, hit_frames={60})
+
+    # Sin daños la escena estática solo se infiere cada 30 frames...
+    assert not set(range(31, 60)) & set(inferred)
+    # ...y tras el daño del frame 60 se infieren todos los frames de la ventana densa,
+    # aunque el decodificador ya los hubiera descartado al conocerse el daño
+    assert set(range(61, 76)) <= set(inferred)
+    assert not set(range(76, 90)) & set(inferred)
+    # Los frames recuperados se entregan en orden con el resto de frames inferidos
+    assert [frame_number for frame_number, _ in delivered] == inferred
+    assert all(infer for _, infer in delivered)
+
+
+def test_dense_window_respects_interval_and_passthrough_order():
+    sampler = AdaptiveFrameSampler(interval=2, max_frame_gap=30, dense_window=10)
+
+    inferred, delivered = _run_detection(sampler, 100, hit_frames={30}, passthrough=True)
+
+    assert set(range(32, 41, 2)) <= set(inferred)
+    assert not {31, 33, 35, 37, 39} & set(inferred)
+    assert [frame_number for frame_number, _ in delivered] == list(range(100))
+
+
+def test_should_resample_only_inside_dense_window():
+    sampler = AdaptiveFrameSampler(interval=1, dense_window=5)
+    assert not sampler.should_resample(3)
+
+    sampler.notify_damage(10)
+
+    assert sampler.should_resample(15)
+    assert not sampler.should_resample(16)
+
+
+def test_sampler_rejects_invalid_parameters():
+    with pytest.raises(ValueError):
+        FrameSampler(interval=0)
+    with pytest.raises(ValueError):
+        AdaptiveFrameSampler(scene_change_threshold=1.5)
+    with pytest.raises(ValueError):
+        AdaptiveFrameSampler(max_frame_gap=0)
@@ -0,0 +1,69 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.infrastructure.ml.inference_pipeline import InferencePipeline
+from src.infrastructure.ml.passthrough_buffer import PassthroughFrameBuffer
+
+
+def _frames(count, infer_every):
+    for frame_number in range(count):
+        frame = np.full((4, 4, 3), frame_number % 256, dtype=np.uint8)
+        yield frame_number, frame_number / 30.0, frame, frame_number % infer_every == 0
+
+
+def test_passthrough_frames_are_delivered_in_order_with_their_images():
+    pipeline = InferencePipeline(
+        infer_batch=lambda batch: [item.frame_number for item in batch],
+        batch_size=4,
+        max_batch_wait_seconds=0.01,
+        queue_size=8,
+        passthrough_buffer_size=4
+    )
+
+    delivered = list(pipeline.run(_frames(100, infer_every=5)))
+
+    assert [item.frame_number for item, _ in delivered] == list(range(100))
+    for item, result in delivered:
+        assert item.frame[0, 0, 0] == item.frame_number % 256
+        assert result == (item.frame_number if item.infer else None)
+
+
+def test_passthrough_frames_in_memory_are_bounded_by_the_buffer():
+    capacity = 6
+    pipeline = InferencePipeline(
+        infer_batch=lambda batch: [None for _ in batch],
+        batch_size=8,
+        max_batch_wait_seconds=1.0,
+        queue_size=64,
+        passthrough_buffer_size=capacity
+    )
+    peak = 0
+
+    for _ in pipeline.run(_frames(300, infer_every=10)):
+        peak = max(peak, len(pipeline._passthrough))
+        time.sleep(0.001)  # consumidor lento: el decodificador va por delante
+
+    assert 0 < peak <= capacity
+
+
+def test_passthrough_buffer_put_waits_for_a_free_slot():
+    buffer = PassthroughFrameBuffer(capacity=1)
+    stop = threading.Event()
+    frame = np.zeros((2, 2, 3), dtype=np.uint8)
+    assert buffer.put(0, frame, stop)
+    assert buffer.is_full()
+
+    threading.Timer(0.05, buffer.take, args=(0,)).start()
+    assert buffer.put(1, frame, stop)
+    assert len(buffer) == 1
+
+    stop.set()
+    assert not buffer.put(2, frame, stop)
+
+
+def test_passthrough_buffer_rejects_zero_capacity():
+    with pytest.raises(ValueError):
+        PassthroughFrameBuffer(capacity=0)
@@ -0,0 +1,231 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from src.infrastructure.repositories import jsonl_log
+from src.infrastructure.repositories.jsonl_log import FileLock, JsonLinesLog
+
+
+def _lines(log):
+    return log.path.read_text(encoding="utf-8").splitlines()
+
+
+def test_replay_applies_puts_and_deletes_in_order(tmp_path):
+    log = JsonLinesLog(tmp_path / "records.jsonl")
+    log.put("a", {"value": 1})
+    log.put("b", {"value": 2})
+    log.put("a", {"value": 3})
+    assert log.delete("b")
+    assert not log.delete("missing")
+
+    # Una instancia nueva reconstruye el estado solo a partir del archivo
+    assert JsonLinesLog(tmp_path / "records.jsonl").load() == {"a": {"value": 3}}
+    assert len(_lines(log)) == 4
+
+
+def test_replace_only_writes_existing_records(tmp_path):
+    log = JsonLinesLog(tmp_path / "records.jsonl")
+    log.put("a", {"value": 1})
+
+    assert log.replace("a", {"value": 2})
+    assert not log.replace("missing", {"value": 3})
+    assert log.load() == {"a": {"value": 2}}
+    assert len(_lines(log)) == 2
+
+
+def test_torn_tail_is_ignored_and_truncated(tmp_path):
+    path = tmp_path / "records.jsonl"
+    log = JsonLinesLog(path)
+    log.put("a", {"value": 1})
+    with open(path, "ab") as f:
+        f.write(b'{"op":"put","id":"b","data":{"val')
+
+    reopened = JsonLinesLog(path)
+    assert reopened.load() == {"a": {"value": 1}}
+
+    # El siguiente anexado empieza en una línea nueva y el log sigue siendo legible
+    reopened.put("c", {"value": 3})
+    assert JsonLinesLog(path).load() == {"a": {"value": 1}, "c": {"value": 3}}
+    assert all(json.loads(line) for line in _lines(reopened))
+
+
+def test_unreadable_line_is_skipped(tmp_path):
+    path = tmp_path / "records.jsonl"
+    log = JsonLinesLog(path)
+    log.put("a", {"value": 1})
+    with open(path, "ab") as f:
+        f.write(b"not json\n")
+    log.put("b", {"value": 2})
+
+    assert JsonLinesLog(path).load() == {"a": {"value": 1}, "b": {"value": 2}}
+
+
+def test_compaction_keeps_one_line_per_live_record(tmp_path):
+    log = JsonLinesLog(tmp_path / "records.jsonl", compaction_ratio=2.0, min_compaction_records=10)
+    for version in range(4):
+        log.put("a", {"version": version})
+        log.put("b", {"version": version})
+
+    assert len(_lines(log)) == 8
+    log.put("a", {"version": 4})
+    log.put("a", {"version": 5})
+    # 10 líneas para 2 registros vivos: se supera el ratio y el log se reescribe
+    assert len(_lines(log)) == 2
+    assert log.load() == {"a": {"version": 5}, "b": {"version": 3}}
+
+    log.put("c", {"version": 0})
+    log.compact()
+    assert len(_lines(log)) == 3
+
+
+def test_compaction_leaves_no_temporary_files(tmp_path):
+    log = JsonLinesLog(tmp_path / "records.jsonl")
+    log.put("a", {"value": 1})
+    log.compact()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["records.jsonl", "records.jsonl.lock"]
+
+
+def test_legacy_document_is_migrated_once(tmp_path):
+    legacy = tmp_path / "records.json"
+    legacy.write_text(json.dumps({"a": {"value": 1}}), encoding="utf-8")
+
+    log = JsonLinesLog(tmp_path / "records.jsonl", legacy_path=legacy)
+    assert log.load() == {"a": {"value": 1}}
+
+    legacy.write_text(json.dumps({"b": {"value": 2}}), encoding="utf-8")
+    assert JsonLinesLog(tmp_path / "records.jsonl", legacy_path=legacy).load() == {"a": {"value": 1}}
+
+
+def test_cache_is_invalidated_by_writes_from_another_instance(tmp_path):
+    path = tmp_path / "records.jsonl"
+    reader = JsonLinesLog(path)
+    writer = JsonLinesLog(path)
+    writer.put("a", {"value": 1})
+    assert reader.load() == {"a": {"value": 1}}
+
+    writer.put("b", {"value": 2})
+    assert reader.load() == {"a": {"value": 1}, "b": {"value": 2}}
+
+    writer.compact()
+    assert writer.delete("a")
+    assert reader.load() == {"b": {"value": 2}}
+
+
+def test_fresh_cache_skips_rereading_the_log(tmp_path, monkeypatch):
+    log = JsonLinesLog(tmp_path / "records.jsonl")
+    log.put("a", {"value": 1})
+    log.load()
+
+    replays = []
+    original_replay = log._replay
+    monkeypatch.setattr(log, "_replay", lambda *args, **kwargs: replays.append(1) or original_replay(*args, **kwargs))
+
+    log.load()
+    log.put("b", {"value": 2})
+    assert log.load() == {"a": {"value": 1}, "b": {"value": 2}}
+    assert replays == []
+
+    # Un anexado externo cambia la firma del archivo y fuerza la relectura
+    with open(log.path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"op": "put", "id": "c", "data": {"value": 3}}) + "\n")
+    assert log.load()["c"] == {"value": 3}
+    assert replays == [1]
+
+
+def test_loaded_records_are_read_only(tmp_path):
+    log = JsonLinesLog(tmp_path / "records.jsonl")
+    log.put("a", {"value": 1, "tags": ["x"], "nested": {"count": 1}})
+
+    loaded = log.load()
+    with pytest.raises(TypeError):
+        loaded["a"]["value"] = 99
+    with pytest.raises(TypeError):
+        loaded["a"]["nested"]["count"] = 2
+    assert loaded["a"]["tags"] == ("x",)
+
+    # El diccionario exterior es una copia: quitarle registros no altera la caché
+    loaded.pop("a")
+    assert log.load() == {"a": {"value": 1, "tags": ("x",), "nested": {"count": 1}}}
+
+
+def test_get_and_contains_look_up_single_records(tmp_path):
+    path = tmp_path / "records.jsonl"
+    log = JsonLinesLog(path)
+    log.put("a", {"value": 1})
+
+    assert log.get("a") == {"value": 1}
+    assert log.get("missing") is None
+    assert log.contains("a") and not log.contains("missing")
+
+    # También ven las escrituras de otra instancia
+    JsonLinesLog(path).put("b", {"value": 2})
+    assert log.get("b") == {"value": 2}
+    assert JsonLinesLog(path).delete("a")
+    assert not log.contains("a")
+
+
+def test_cached_reads_do_not_parse_json(tmp_path, monkeypatch):
+    log = JsonLinesLog(tmp_path / "records.jsonl")
+    log.put("a", {"value": 1})
+    log.load()
+
+    parsed = []
+    original_loads = jsonl_log.json.loads
+    monkeypatch.setattr(jsonl_log.json, "loads", lambda *args, **kwargs: parsed.append(1) or original_loads(*args, **kwargs))
+
+    log.load()
+    log.get("a")
+    log.contains("a")
+    assert parsed == []
+
+    # Una escritura propia solo decodifica el registro escrito
+    log.put("b", {"value": 2})
+    assert log.get("b") == {"value": 2}
+    assert parsed == [1]
+
+
+def test_mutating_a_record_after_put_does_not_change_the_cache(tmp_path):
+    log = JsonLinesLog(tmp_path / "records.jsonl")
+    log.load()
+    record = {"value": 1, "nested": {"count": 1}}
+    log.put("a", record)
+
+    record["nested"]["count"] = 2
+
+    assert log.load() == {"a": {"value": 1, "nested": {"count": 1}}}
+
+
+def test_cached_and_replayed_records_are_identical(tmp_path):
+    log = JsonLinesLog(tmp_path / "records.jsonl")
+    log.load()
+    log.put("a", {"created_at": datetime(2026, 1, 1), "name": "café"})
+
+    # Los valores no serializables se guardan como texto también en la caché
+    assert log.load() == JsonLinesLog(tmp_path / "records.jsonl").load() == {
+        "a": {"created_at": "2026-01-01 00:00:00", "name": "café"}
+    }
+
+
+def test_file_lock_is_reentrant_but_cannot_upgrade_a_shared_lock(tmp_path):
+    lock = FileLock(tmp_path / "records.lock")
+
+    with lock.acquire():
+        with lock.acquire(shared=True):
+            pass
+    with lock.acquire(shared=True):
+        with lock.acquire(shared=True):
+            pass
+        with pytest.raises(RuntimeError):
+            with lock.acquire():
+                pass
+
+
+def test_reader_instance_does_not_rewrite_an_existing_log(tmp_path):
+    log = JsonLinesLog(tmp_path / "records.jsonl")
+    log.put("a", {"value": 1})
+    signature = log._signature()
+
+    assert JsonLinesLog(tmp_path / "records.jsonl").load() == {"a": {"value": 1}}
+    assert log._signature() == signature
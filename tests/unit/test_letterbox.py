@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from src.infrastructure.ml.letterbox import PAD_VALUE, LetterboxPreprocessor, LetterboxTransform
+
+
+def test_square_letterbox_pads_to_imgsz():
+    transform = LetterboxTransform.for_shape((1080, 1920, 3), 640)
+
+    assert transform.out_shape == (640, 640, 3)
+    assert (transform.new_width, transform.new_height) == (640, 360)
+    assert (transform.left, transform.top) == (0, 140)
+
+
+def test_stride_letterbox_pads_only_to_the_next_stride_multiple():
+    transform = LetterboxTransform.for_shape((1080, 1920, 3), 640, stride=32)
+
+    assert transform.out_shape == (384, 640, 3)
+    assert (transform.left, transform.top) == (0, 12)
+
+    portrait = LetterboxTransform.for_shape((1920, 1080, 3), 640, stride=32)
+    assert portrait.out_shape == (640, 384, 3)
+
+
+def test_stride_letterbox_boxes_map_back_to_original_coordinates():
+    transform = LetterboxTransform.for_shape((1080, 1920, 3), 640, stride=32)
+    letterboxed = np.array([[100.0, 12.0 + 50.0, 200.0, 12.0 + 150.0]], dtype=np.float32)
+
+    np.testing.assert_allclose(transform.to_original(letterboxed), [[300.0, 150.0, 600.0, 450.0]], rtol=1e-5)
+
+
+def test_preprocessor_writes_rect_buffers_with_padding():
+    preprocessor = LetterboxPreprocessor(640, stride=32)
+    frame = np.full((1080, 1920, 3), 7, dtype=np.uint8)
+
+    inputs, transforms = preprocessor.preprocess([frame, frame])
+
+    assert [image.shape for image in inputs] == [(384, 640, 3)] * 2
+    assert (inputs[0][:12] == PAD_VALUE).all()
+    assert (inputs[0][12:372] == 7).all()
+    assert (inputs[0][372:] == PAD_VALUE).all()
+    assert transforms[0] == transforms[1]
+
+
+def test_preprocessor_falls_back_to_square_for_mixed_batches():
+    preprocessor = LetterboxPreprocessor(640, stride=32)
+    wide = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    tall = np.zeros((1920, 1080, 3), dtype=np.uint8)
+
+    inputs, _ = preprocessor.preprocess([wide, tall])
+    assert [image.shape for image in inputs] == [(640, 640, 3)] * 2
+
+    # El buffer reutilizado vuelve a la forma rectangular con un lote homogéneo
+    inputs, _ = preprocessor.preprocess([wide])
+    assert inputs[0].shape == (384, 640, 3)
+    assert (inputs[0][:12] == PAD_VALUE).all()
+
+
+def test_preprocessor_rejects_imgsz_not_multiple_of_stride():
+    with pytest.raises(ValueError):
+        LetterboxPreprocessor(640, stride=48)
@@ -0,0 +1,84 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from src.domain.entities.damage import DamageSeverity
+from src.infrastructure.ml.severity import SeverityClassifier
+
+
+THRESHOLDS = {
+    'area_small': 1000,
+    'area_medium': 5000,
+    'confidence_high': 0.8,
+    'confidence_medium': 0.6
+}
+
+
+def _rule_table_severity(area, confidence, thresholds=THRESHOLDS):
+    """Tabla de decisión original del detector (MINOR/MODERATE/SEVERE -> LOW/MEDIUM/HIGH)."""
+    if confidence >= thresholds['confidence_high']:
+        if area >= thresholds['area_medium']:
+            return DamageSeverity.CRITICAL
+        elif area >= thresholds['area_small']:
+            return DamageSeverity.HIGH
+        else:
+            return DamageSeverity.MEDIUM
+    elif confidence >= thresholds['confidence_medium']:
+        if area >= thresholds['area_medium']:
+            return DamageSeverity.HIGH
+        elif area >= thresholds['area_small']:
+            return DamageSeverity.MEDIUM
+        else:
+            return DamageSeverity.LOW
+    else:
+        if area >= thresholds['area_medium']:
+            return DamageSeverity.MEDIUM
+        else:
+            return DamageSeverity.LOW
+
+
+def test_classifier_matches_the_rule_table_on_threshold_boundaries():
+    classifier = SeverityClassifier(THRESHOLDS, scale_with_resolution=False)
+    areas = [0.0, 999.0, 1000.0, 1001.0, 4999.0, 5000.0, 50000.0]
+    confidences = [0.0, 0.59, 0.6, 0.61, 0.79, 0.8, 1.0]
+    pairs = list(itertools.product(areas, confidences))
+
+    codes = classifier.classify(
+        np.array([area for area, _ in pairs]),
+        np.array([confidence for _, confidence in pairs])
+    )
+
+    assert list(classifier.to_severities(codes)) == [_rule_table_severity(a, c) for a, c in pairs]
+
+
+def test_classifier_matches_the_rule_table_on_random_detections():
+    rng = np.random.default_rng(0)
+    areas = rng.uniform(0, 10000, size=2000).astype(np.float32)
+    confidences = rng.uniform(0, 1, size=2000).astype(np.float32)
+    classifier = SeverityClassifier(THRESHOLDS, scale_with_resolution=False)
+
+    severities = classifier.to_severities(classifier.classify(areas, confidences))
+
+    expected = [_rule_table_severity(a, c) for a, c in zip(areas, confidences)]
+    assert list(severities) == expected
+
+
+@pytest.mark.parametrize("frame_shape, scale", [((720, 1280, 3), 1.0), ((2160, 3840, 3), 9.0)])
+def test_area_thresholds_scale_with_frame_area(frame_shape, scale):
+    classifier = SeverityClassifier(THRESHOLDS, reference_resolution=(1280, 720))
+
+    assert classifier.area_thresholds(frame_shape) == (1000 * scale, 5000 * scale)
+    # Sin escalado (o sin forma de frame) se usan los umbrales tal cual
+    assert SeverityClassifier(THRESHOLDS, scale_with_resolution=False).area_thresholds(frame_shape) == (1000, 5000)
+    assert classifier.area_thresholds() == (1000, 5000)
+
+
+def test_same_relative_size_gets_same_severity_at_any_resolution():
+    classifier = SeverityClassifier(THRESHOLDS)
+    confidences = np.array([0.7])
+
+    hd = classifier.classify(np.array([3000.0]), confidences, (720, 1280, 3))
+    uhd = classifier.classify(np.array([3000.0 * 9]), confidences, (2160, 3840, 3))
+
+    assert hd[0] == uhd[0] == 1
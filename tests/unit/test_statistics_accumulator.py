@@ -0,0 +1,122 @@
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.domain.entities.damage import BoundingBox, Damage, DamageSeverity, DamageType
+from src.domain.entities.damage_columns import DamageColumns
+from src.domain.entities.detection_result import (
+    DetectionResult,
+    DetectionStatistics,
+    DetectionStatisticsAccumulator
+)
+from src.domain.entities.video import Video, VideoStatus
+
+
+THRESHOLD = 0.6
+FRAMES = 300
+
+
+def _frames():
+    """Detecciones aleatorias por frame; muchos frames quedan sin daños."""
+    rng = np.random.default_rng(7)
+    types, severities = list(DamageType), list(DamageSeverity)
+    frames = []
+    damage_id = 0
+    for frame_number in range(FRAMES):
+        damages = []
+        for _ in range(rng.choice([0, 0, 1, 3])):
+            damages.append(Damage(
+                id=damage_id,
+                damage_type=types[rng.integers(len(types))],
+                severity=severities[rng.integers(len(severities))],
+                confidence=float(rng.uniform(0.25, 1.0)),
+                bounding_box=BoundingBox(x=10.0, y=10.0, width=20.0, height=20.0),
+                frame_number=frame_number,
+                timestamp=frame_number / 30.0
+            ))
+            damage_id += 1
+        frames.append((frame_number, damages))
+    return frames
+
+
+FRAME_DAMAGES = _frames()
+ALL_DAMAGES = [damage for _, damages in FRAME_DAMAGES for damage in damages]
+
+
+def _accumulated(top_k=10):
+    accumulator = DetectionStatisticsAccumulator(THRESHOLD, histogram_bins=10, top_k=top_k)
+    for frame_number, damages in FRAME_DAMAGES:
+        accumulator.add_frame(frame_number, damages)
+    return accumulator.build(processing_time=3.0, total_tracks=4)
+
+
+def test_accumulated_statistics_match_a_batch_pass_over_the_same_detections():
+    statistics = _accumulated()
+    columns = DamageColumns.from_damages(ALL_DAMAGES)
+    confidences = np.array([damage.confidence for damage in ALL_DAMAGES])
+
+    assert statistics.total_frames_processed == FRAMES
+    assert statistics.total_damages_detected == len(ALL_DAMAGES)
+    assert statistics.damages_by_type == columns.count_by_type()
+    assert statistics.damages_by_type == dict(Counter(d.damage_type.value for d in ALL_DAMAGES))
+    assert statistics.damages_by_severity == dict(Counter(d.severity.value for d in ALL_DAMAGES))
+    assert statistics.average_confidence == pytest.approx(confidences.mean())
+    assert statistics.high_confidence_damages == len(columns.by_confidence_range(THRESHOLD))
+    assert statistics.severe_damages == len(columns.severe())
+    assert statistics.confidence_histogram == np.histogram(confidences, bins=10, range=(0.0, 1.0))[0].tolist()
+    assert statistics.damages_per_frame == dict(Counter(d.frame_number for d in ALL_DAMAGES))
+    assert statistics.frames_per_second == pytest.approx(FRAMES / 3.0)
+    assert statistics.total_tracks == 4
+
+
+def test_top_damages_are_the_most_confident_in_order():
+    for top_k in (1, 10, len(ALL_DAMAGES) + 5):
+        expected = sorted(ALL_DAMAGES, key=lambda damage: damage.confidence, reverse=True)[:top_k]
+        assert [damage.id for damage in _accumulated(top_k).top_damages] == [damage.id for damage in expected]
+
+
+def test_summary_is_the_same_with_accumulated_or_scanned_figures():
+    video = Video(
+        id="v1",
+        file_path=Path("/videos/v1.mp4"),
+        name="v1.mp4",
+        status=VideoStatus.COMPLETED,
+        created_at=datetime(2026, 1, 1),
+        validate_file=False
+    )
+    accumulated = _accumulated()
+    # Estadísticas sin los agregados incrementales, como en los resultados guardados antes de existir
+    scanned = DetectionStatistics(
+        total_frames_processed=accumulated.total_frames_processed,
+        total_damages_detected=accumulated.total_damages_detected,
+        damages_by_type=accumulated.damages_by_type,
+        damages_by_severity=accumulated.damages_by_severity,
+        average_confidence=accumulated.average_confidence,
+        processing_time=accumulated.processing_time,
+        frames_per_second=accumulated.frames_per_second
+    )
+
+    def summary(statistics):
+        return DetectionResult(
+            id="r1", video=video, damages=ALL_DAMAGES, statistics=statistics,
+            created_at=datetime(2026, 1, 1), model_version="test", confidence_threshold=THRESHOLD
+        ).generate_summary()
+
+    assert summary(accumulated) == summary(scanned)
+
+
+def test_empty_frames_only_count_as_processed():
+    accumulator = DetectionStatisticsAccumulator()
+    for frame_number in range(5):
+        accumulator.add_frame(frame_number, [])
+
+    statistics = accumulator.build(processing_time=0.0)
+
+    assert (statistics.total_frames_processed, statistics.total_damages_detected) == (5, 0)
+    assert statistics.average_confidence == 0.0
+    assert statistics.frames_per_second == 0.0
+    assert statistics.damages_per_frame == {} and statistics.top_damages == []
+    assert statistics.confidence_histogram == [0] * 10
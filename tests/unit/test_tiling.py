@@ -0,0 +1,124 @@
+import numpy as np
+
+from src.infrastructure.ml.box_ops import batched_nms
+from src.infrastructure.ml.detections import FrameDetections
+from src.infrastructure.ml.tiling import FrameTiler
+
+
+FRAME_SHAPE = (1000, 1600, 3)
+
+
+def _detections(boxes, confidences, class_ids):
+    return FrameDetections(
+        np.array(boxes, dtype=np.float32).reshape(-1, 4),
+        np.array(confidences, dtype=np.float32),
+        np.array(class_ids, dtype=np.int64)
+    )
+
+
+def _tile_outputs(tiler, detections_by_origin):
+    """Detecciones por tesela en el orden de ``split``; las teselas no listadas quedan vacías."""
+    origins = tiler.tile_origins(FRAME_SHAPE)
+    outputs = [detections_by_origin.get(origin, FrameDetections.empty()) for origin in origins]
+    outputs.append(detections_by_origin.get("full", FrameDetections.empty()))
+    offsets = np.array(origins + [(0, 0)], dtype=np.float32)
+    return outputs, offsets
+
+
+def test_last_tile_is_aligned_to_the_frame_edge():
+    tiler = FrameTiler(tile_size=640, overlap=0.2)
+
+    assert tiler.tile_origins(FRAME_SHAPE) == [
+        (0, 0), (512, 0), (960, 0), (0, 360), (512, 360), (960, 360)
+    ]
+
+
+def test_split_returns_views_and_appends_the_full_frame():
+    tiler = FrameTiler(tile_size=640, overlap=0.2)
+    frame = np.zeros(FRAME_SHAPE, dtype=np.uint8)
+
+    tiles, offsets = tiler.split(frame)
+
+    assert len(tiles) == 7 and tiles[-1] is frame
+    assert all(tile.shape == (640, 640, 3) and np.shares_memory(tile, frame) for tile in tiles[:-1])
+    assert offsets.tolist() == [[x, y] for x, y in tiler.tile_origins(FRAME_SHAPE)] + [[0, 0]]
+
+
+def test_split_keeps_small_frames_whole():
+    tiler = FrameTiler(tile_size=640)
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+    tiles, offsets = tiler.split(frame)
+
+    assert len(tiles) == 1 and tiles[0] is frame
+    assert offsets.tolist() == [[0, 0]]
+
+
+def test_merge_shifts_tile_boxes_into_frame_coordinates():
+    tiler = FrameTiler(tile_size=640, overlap=0.2)
+    outputs, offsets = _tile_outputs(tiler, {
+        (512, 360): _detections([[100, 50, 200, 150]], [0.9], [0]),
+        (0, 0): _detections([[10, 20, 30, 40]], [0.8], [1])
+    })
+
+    merged = tiler.merge(outputs, offsets, FRAME_SHAPE)
+
+    assert merged.xyxy.tolist() == [[612, 410, 712, 510], [10, 20, 30, 40]]
+    assert merged.confidences.tolist() == np.array([0.9, 0.8], dtype=np.float32).tolist()
+    assert merged.class_ids.tolist() == [0, 1]
+
+
+def test_merge_removes_same_class_duplicates_across_a_tile_seam():
+    tiler = FrameTiler(tile_size=640, overlap=0.2)
+    # El daño ocupa x=520..620 del frame: cae entero en el solape de las teselas x=0 y x=512
+    outputs, offsets = _tile_outputs(tiler, {
+        (0, 0): _detections([[520, 100, 620, 200]], [0.7], [2]),
+        (512, 0): _detections([[8, 100, 108, 200], [8, 102, 108, 198]], [0.85, 0.6], [2, 3]),
+        "full": _detections([[521, 101, 619, 199]], [0.5], [2])
+    })
+
+    merged = tiler.merge(outputs, offsets, FRAME_SHAPE)
+
+    # Una sola caja de clase 2 (la de mayor confianza) y la de clase 3 que la solapa se conserva
+    assert merged.count == 2
+    assert merged.class_ids.tolist() == [2, 3]
+    assert merged.xyxy.tolist() == [[520, 100, 620, 200], [520, 102, 620, 198]]
+    assert merged.confidences.tolist() == np.array([0.85, 0.6], dtype=np.float32).tolist()
+
+
+def test_merge_clips_boxes_to_the_frame():
+    tiler = FrameTiler(tile_size=640, overlap=0.2)
+    outputs, offsets = _tile_outputs(tiler, {
+        (960, 360): _detections([[600, 620, 660, 700]], [0.9], [0]),
+        "full": _detections([[-5, -3, 40, 30]], [0.8], [1])
+    })
+
+    merged = tiler.merge(outputs, offsets, FRAME_SHAPE)
+
+    assert merged.xyxy.tolist() == [[1560, 980, 1600, 1000], [0, 0, 40, 30]]
+    # Sin la forma del frame solo se desplazan
+    assert tiler.merge(outputs, offsets).xyxy.tolist() == [[1560, 980, 1620, 1060], [-5, -3, 40, 30]]
+
+
+def test_merge_without_detections_or_with_a_single_image():
+    tiler = FrameTiler(tile_size=640, overlap=0.2)
+    outputs, offsets = _tile_outputs(tiler, {})
+    single = _detections([[1, 2, 3, 4]], [0.5], [0])
+
+    assert tiler.merge(outputs, offsets, FRAME_SHAPE).count == 0
+    assert tiler.merge([single], np.zeros((1, 2), dtype=np.float32), FRAME_SHAPE) is single
+
+
+def test_batched_nms_only_suppresses_within_a_class():
+    xyxy = np.array([
+        [0, 0, 10, 10],
+        [1, 1, 10, 10],
+        [0, 0, 10, 10],
+        [50, 50, 60, 60]
+    ], dtype=np.float32)
+    scores = np.array([0.6, 0.9, 0.7, 0.3], dtype=np.float32)
+    class_ids = np.array([0, 0, 1, 0], dtype=np.int64)
+
+    keep = batched_nms(xyxy, scores, class_ids, iou_threshold=0.5)
+
+    assert keep.tolist() == [1, 2, 3]
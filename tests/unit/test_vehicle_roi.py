@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from src.infrastructure.ml.detections import FrameDetections
+from src.infrastructure.ml.frame_batcher import BatchedFrame
+from src.infrastructure.ml.vehicle_roi import VehicleRoiTracker, crop_to_roi, detections_to_frame
+
+
+class _CountingLocator:
+    """Localizador de prueba: cuenta las llamadas y devuelve una ROI derivada del frame."""
+
+    def __init__(self, missing=()):
+        self.calls = []
+        self._missing = set(missing)
+
+    def locate(self, frames):
+        rois = []
+        for frame in frames:
+            frame_number = int(frame[0, 0, 0])
+            self.calls.append(frame_number)
+            rois.append(None if frame_number in self._missing else (frame_number, 10, frame_number + 50, 60))
+        return rois
+
+
+def _batch(frame_numbers):
+    # El número de frame va en los píxeles para que el localizador sepa qué frame recibe
+    return [
+        BatchedFrame(frame_number, frame_number / 30.0, np.full((120, 160, 3), frame_number, dtype=np.uint8))
+        for frame_number in frame_numbers
+    ]
+
+
+def test_locator_runs_every_refresh_interval_frames():
+    locator = _CountingLocator()
+    tracker = VehicleRoiTracker(locator, refresh_interval=3)
+
+    rois = [tracker.rois_for(_batch([frame_number]))[0] for frame_number in range(10)]
+
+    assert locator.calls == [0, 3, 6, 9]
+    # Entre refrescos se reutiliza la última ROI localizada
+    assert [roi[0] for roi in rois] == [0, 0, 0, 3, 3, 3, 6, 6, 6, 9]
+
+
+def test_locator_runs_at_most_once_per_batch():
+    locator = _CountingLocator()
+    tracker = VehicleRoiTracker(locator, refresh_interval=3)
+
+    rois = [roi for start in range(0, 12, 4) for roi in tracker.rois_for(_batch(range(start, start + 4)))]
+
+    # Solo el primer frame caducado de cada lote pasa por el localizador
+    assert locator.calls == [0, 4, 8]
+    assert [roi[0] for roi in rois] == [0] * 4 + [4] * 4 + [8] * 4
+
+
+def test_frames_without_vehicle_fall_back_to_the_full_frame():
+    locator = _CountingLocator(missing={0, 1, 2})
+    tracker = VehicleRoiTracker(locator, refresh_interval=10)
+    batch = _batch([0, 1])
+
+    rois = tracker.rois_for(batch)
+
+    assert rois == [None, None]
+    assert all(crop_to_roi(item.frame, roi) is item.frame for item, roi in zip(batch, rois))
+    # Sin ROI se vuelve a localizar en cada lote, sin esperar al intervalo de refresco
+    assert tracker.rois_for(_batch([2])) == [None]
+    assert tracker.rois_for(_batch([3, 4])) == [(3, 10, 53, 60)] * 2
+    assert locator.calls == [0, 2, 3]
+
+
+def test_crop_boxes_are_shifted_back_to_frame_coordinates():
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    frame[35, 50] = 255
+    roi = (40, 30, 120, 90)
+
+    crop = crop_to_roi(frame, roi)
+    detections = FrameDetections(
+        np.array([[10, 5, 20, 15]], dtype=np.float32),
+        np.array([0.9], dtype=np.float32),
+        np.array([1], dtype=np.int64)
+    )
+    remapped = detections_to_frame(detections, roi)
+
+    assert crop.shape == (60, 80, 3) and np.shares_memory(crop, frame)
+    assert crop[5, 10].tolist() == [255, 255, 255]
+    assert remapped.xyxy.tolist() == [[50, 35, 60, 45]]
+    assert remapped.xyxy.dtype == np.float32
+    assert remapped.confidences is detections.confidences and remapped.class_ids is detections.class_ids
+    assert detections_to_frame(detections, None) is detections
+
+
+def test_refresh_interval_must_be_positive():
+    with pytest.raises(ValueError):
+        VehicleRoiTracker(_CountingLocator(), refresh_interval=0)